@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from src.api.v1.routers import input, scrape
+from src.api.v1.routers import input, scrape, status
 
 # Define the main API router for this version (v1)
 api_v1_router = APIRouter()
@@ -8,3 +8,4 @@ api_v1_router = APIRouter()
 # Include the router from the chat file
 api_v1_router.include_router(input.router)
 api_v1_router.include_router(scrape.router)
+api_v1_router.include_router(status.router)
@@ -0,0 +1,80 @@
+from fastapi import Depends, Request
+
+from src.core.container import ServiceContainer
+from src.services.browser_pool import BrowserPoolService
+from src.services.profile_cache import ProfileCacheService
+from src.services.profile_history import ProfileHistoryService
+from src.services.rate_social_media import RateSocialMediaService
+from src.services.result_feedback import ResultFeedbackService
+from src.services.scrape_jobs import ScrapeJobService
+from src.services.scrape_orchestrator import ScrapeOrchestratorService
+from src.services.search_cache import SearchCacheService
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.rate_limiter import HostRateLimiter
+
+
+def get_container(request: Request) -> ServiceContainer:
+    """
+    Returns the service container built in the application lifespan.
+    """
+    return request.app.state.container
+
+
+def get_browser_pool(
+    container: ServiceContainer = Depends(get_container),
+) -> BrowserPoolService:
+    return container.browser_pool
+
+
+def get_profile_cache(
+    container: ServiceContainer = Depends(get_container),
+) -> ProfileCacheService:
+    return container.profile_cache
+
+
+def get_scrape_orchestrator(
+    container: ServiceContainer = Depends(get_container),
+) -> ScrapeOrchestratorService:
+    return container.scrape_orchestrator
+
+
+def get_scrape_jobs(
+    container: ServiceContainer = Depends(get_container),
+) -> ScrapeJobService:
+    return container.scrape_jobs
+
+
+def get_profile_history(
+    container: ServiceContainer = Depends(get_container),
+) -> ProfileHistoryService:
+    return container.profile_history
+
+
+def get_rate_social_media(
+    container: ServiceContainer = Depends(get_container),
+) -> RateSocialMediaService:
+    return container.rate_social_media
+
+
+def get_result_feedback(
+    container: ServiceContainer = Depends(get_container),
+) -> ResultFeedbackService:
+    return container.result_feedback
+
+
+def get_search_cache(
+    container: ServiceContainer = Depends(get_container),
+) -> SearchCacheService:
+    return container.search_cache
+
+
+def get_rate_limiter(
+    container: ServiceContainer = Depends(get_container),
+) -> HostRateLimiter:
+    return container.rate_limiter
+
+
+def get_circuit_breakers(
+    container: ServiceContainer = Depends(get_container),
+) -> CircuitBreakerRegistry:
+    return container.breakers
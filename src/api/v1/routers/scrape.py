@@ -1,19 +1,27 @@
+import asyncio
+import json
 import logging
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from src.models.scrape import ScrapeRequest
-from src.services.facebook_scraper import FacebookScraperService
-from src.services.instagram_scraper import InstagramScraperService
+from src.api.v1.dependencies import (
+    get_profile_history,
+    get_rate_social_media,
+    get_result_feedback,
+    get_scrape_jobs,
+    get_scrape_orchestrator,
+)
+from src.core.config import config
+from src.models.scrape import BatchScrapeRequest, ScrapeRequest
+from src.services.profile_history import ProfileHistoryService
 from src.services.rate_social_media import RateSocialMediaService
 from src.services.result_feedback import ResultFeedbackService
-from src.services.tiktok_scraper import TiktokScraperService
-from src.services.x_scraper import XScraperService
+from src.services.scrape_jobs import ScrapeJobService
+from src.services.scrape_orchestrator import PLATFORMS, ScrapeOrchestratorService
+from src.utils.concurrency import bounded_map_unordered
 
 logger = logging.getLogger(__name__)
-rateSocialMediaService = RateSocialMediaService()
-resultFeedbackService = ResultFeedbackService()
 
 
 router = APIRouter(
@@ -28,6 +36,9 @@ router = APIRouter(
 )
 async def scrape(
     data: ScrapeRequest,
+    orchestrator: ScrapeOrchestratorService = Depends(get_scrape_orchestrator),
+    rate_social_media: RateSocialMediaService = Depends(get_rate_social_media),
+    result_feedback: ResultFeedbackService = Depends(get_result_feedback),
 ) -> JSONResponse:
     """Scrape endpoint for processing scrape data.
 
@@ -37,43 +48,12 @@ async def scrape(
         JSONResponse: Object containing the data, status code, and error message.
     """
 
-    facebook = FacebookScraperService()
-    instagram = InstagramScraperService()
-    tiktok = TiktokScraperService()
-    x = XScraperService()
     log = logger.getChild("scrape")
     log.debug(f"Received data: {data}")
-    # This will be used for concurrent scraping
-    # facebook_results, instagram_results, tiktok_results, x_results = (
-    #     await asyncio.gather(
-    #         facebook.scrape(url=data.facebook, timeout=2000),
-    #         instagram.scrape(url=data.instagram, timeout=2000),
-    #         tiktok.scrape(url=data.tiktok, timeout=2000),
-    #         x.scrape(url=data.x, timeout=2000),
-    #     )
-    # )
-
-    # This will be used for sequential scraping
-    facebook_results = await facebook.scrape(url=data.facebook, timeout=2000)
-    # This is playwright scraping
-    # instagram_results = await instagram.scrape(url=data.instagram, timeout=2000)
-    # tiktok_results = await tiktok.scrape(
-    #     url=data.tiktok, timeout=2000
-    # )
-    instagram_results = await instagram.scrape_via_apify(
-        url=data.instagram, timeout=2000
-    )
-    tiktok_results = await tiktok.scrape_via_httpx(url=data.tiktok, timeout=2000)
-    x_results = await x.scrape(url=data.x, timeout=2000)
-    gathered_data = {
-        "facebook": facebook_results,
-        "instagram": instagram_results,
-        "tiktok": tiktok_results,
-        "x": x_results,
-    }
-
-    scores = rateSocialMediaService.rate(gathered_data)
-    feedback = await resultFeedbackService.generate_feedback(gathered_data, scores)
+    gathered_data = await orchestrator.gather(data)
+
+    scores = rate_social_media.rate(gathered_data)
+    feedback = await result_feedback.generate_feedback(gathered_data, scores)
     log.info("Generated scores: %s, feedback: %s", scores, feedback)
     results = {**scores, "feedback": feedback}
 
@@ -84,3 +64,238 @@ async def scrape(
             "status_code": status.HTTP_200_OK,
         },
     )
+
+
+@router.post(
+    "/batch",
+    tags=["scrape"],
+)
+async def scrape_batch(
+    data: BatchScrapeRequest,
+    orchestrator: ScrapeOrchestratorService = Depends(get_scrape_orchestrator),
+    rate_social_media: RateSocialMediaService = Depends(get_rate_social_media),
+) -> StreamingResponse:
+    """Batch scrape endpoint streaming one NDJSON line per business.
+
+    Businesses are scraped with bounded concurrency and each line is written as
+    soon as its scores are ready, so lines arrive in completion order and carry
+    the index of the item in the request. Feedback is not generated.
+
+    Args:
+        data (BatchScrapeRequest): The businesses to scrape
+    Returns:
+        StreamingResponse: application/x-ndjson stream of results.
+    """
+
+    log = logger.getChild("scrape_batch")
+    log.info("Received batch of %s items", len(data.items))
+
+    async def score(item):
+        gathered_data = await orchestrator.gather(item)
+        return rate_social_media.rate(gathered_data)
+
+    async def lines():
+        async for index, result in bounded_map_unordered(
+            score, data.items, config.SCRAPE_BATCH_CONCURRENCY
+        ):
+            if isinstance(result, Exception):
+                log.error("Failed to score item %s: %s", index, result)
+                line = {
+                    "index": index,
+                    "error": str(result),
+                    "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                }
+            else:
+                line = {
+                    "index": index,
+                    "data": result,
+                    "status_code": status.HTTP_200_OK,
+                }
+            yield json.dumps(line) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/rescore",
+    tags=["scrape"],
+)
+async def rescore(
+    data: BatchScrapeRequest,
+    profile_history: ProfileHistoryService = Depends(get_profile_history),
+    rate_social_media: RateSocialMediaService = Depends(get_rate_social_media),
+) -> JSONResponse:
+    """Recomputes the scores of businesses from their stored profile history.
+
+    Nothing is scraped: each platform is rated from its latest snapshot and
+    stored posts, so the scores only reflect the time passed since the last
+    scrape. Platforms without a history are reported as errors.
+
+    Args:
+        data (BatchScrapeRequest): The businesses to rescore
+    Returns:
+        JSONResponse: Object containing the scores of every item, in order.
+    """
+    log = logger.getChild("rescore")
+    log.info("Rescoring %s items from history", len(data.items))
+
+    stored = await profile_history.load(
+        (platform, getattr(item, platform))
+        for item in data.items
+        for platform in PLATFORMS
+        if getattr(item, platform)
+    )
+    accounts = []
+    for item in data.items:
+        gathered_data = {}
+        for platform in PLATFORMS:
+            url = getattr(item, platform)
+            if not url:
+                gathered_data[platform] = "No URL provided."
+            elif (platform, url) in stored:
+                gathered_data[platform] = stored[(platform, url)]
+            else:
+                gathered_data[platform] = {
+                    "error": "No history",
+                    "message": f"No stored history for {platform}",
+                }
+        accounts.append(gathered_data)
+
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "data": rate_social_media.rate_many(accounts),
+            "status_code": status.HTTP_200_OK,
+        },
+    )
+
+
+@router.post(
+    "/jobs",
+    tags=["scrape"],
+)
+async def submit_scrape_job(
+    data: ScrapeRequest,
+    scrape_jobs: ScrapeJobService = Depends(get_scrape_jobs),
+) -> JSONResponse:
+    """Queues a scrape and returns its job ID at once.
+
+    Args:
+        data (ScrapeRequest): ScrapeRequest content
+    Returns:
+        JSONResponse: 202 with the job ID, or 503 when the job queue is full.
+    """
+    log = logger.getChild("submit_scrape_job")
+    try:
+        job = scrape_jobs.submit(data)
+    except asyncio.QueueFull:
+        log.warning("Scrape job queue is full")
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": "30"},
+            content={
+                "error": "Queue full",
+                "message": "Too many scrape jobs are queued, retry later",
+                "status_code": status.HTTP_503_SERVICE_UNAVAILABLE,
+            },
+        )
+
+    log.info("Queued scrape job %s", job.id)
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={
+            "data": job.to_dict(),
+            "status_code": status.HTTP_202_ACCEPTED,
+        },
+    )
+
+
+@router.get(
+    "/jobs/{job_id}",
+    tags=["scrape"],
+)
+async def get_scrape_job(
+    job_id: str,
+    scrape_jobs: ScrapeJobService = Depends(get_scrape_jobs),
+) -> JSONResponse:
+    """Reports the per-platform progress and the result of a scrape job.
+
+    Args:
+        job_id (str): The ID returned when the job was queued
+    Returns:
+        JSONResponse: Object containing the job state, or 404 for unknown jobs.
+    """
+    job = scrape_jobs.get(job_id)
+    if job is None:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={
+                "error": "Not found",
+                "message": f"Scrape job {job_id} does not exist",
+                "status_code": status.HTTP_404_NOT_FOUND,
+            },
+        )
+
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "data": job.to_dict(),
+            "status_code": status.HTTP_200_OK,
+        },
+    )
+
+
+def _sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post(
+    "/stream",
+    tags=["scrape"],
+)
+async def scrape_stream(
+    data: ScrapeRequest,
+    orchestrator: ScrapeOrchestratorService = Depends(get_scrape_orchestrator),
+    rate_social_media: RateSocialMediaService = Depends(get_rate_social_media),
+    result_feedback: ResultFeedbackService = Depends(get_result_feedback),
+) -> StreamingResponse:
+    """Streaming variant of the scrape endpoint using Server-Sent Events.
+
+    A `platform` event is sent as each platform finishes, then a `scores`
+    event once all of them are rated and finally a `feedback` event. An
+    `error` event replaces the feedback when it cannot be generated.
+
+    Args:
+        data (ScrapeRequest): ScrapeRequest content
+    Returns:
+        StreamingResponse: text/event-stream of the results.
+    """
+
+    log = logger.getChild("scrape_stream")
+    log.debug(f"Received data: {data}")
+
+    async def events():
+        gathered_data = {}
+        async for platform, result in orchestrator.stream(data):
+            gathered_data[platform] = result
+            yield _sse_event("platform", {"platform": platform, "data": result})
+
+        scores = rate_social_media.rate(gathered_data)
+        yield _sse_event("scores", scores)
+
+        try:
+            feedback = await result_feedback.generate_feedback(gathered_data, scores)
+        except Exception as e:
+            log.error("Failed to generate feedback: %s", e)
+            yield _sse_event(
+                "error",
+                {"error": str(e), "message": "Failed to generate feedback"},
+            )
+            return
+        yield _sse_event("feedback", {"feedback": feedback})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,175 @@
+import logging
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+
+from src.api.v1.dependencies import (
+    get_browser_pool,
+    get_circuit_breakers,
+    get_profile_cache,
+    get_profile_history,
+    get_rate_limiter,
+    get_result_feedback,
+    get_search_cache,
+)
+from src.services.browser_pool import BrowserPoolService
+from src.services.profile_cache import ProfileCacheService
+from src.services.profile_history import ProfileHistoryService
+from src.services.result_feedback import ResultFeedbackService
+from src.services.search_cache import SearchCacheService
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.rate_limiter import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/status",
+    tags=["status"],
+)
+
+
+@router.get(
+    "/browser-pool",
+    tags=["status"],
+)
+async def browser_pool_status(
+    browser_pool: BrowserPoolService = Depends(get_browser_pool),
+) -> JSONResponse:
+    """Reports the occupancy of the shared browser pool.
+
+    Returns:
+        JSONResponse: Object containing the pool statistics and status code.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "data": browser_pool.stats(),
+            "status_code": status.HTTP_200_OK,
+        },
+    )
+
+
+@router.get(
+    "/profile-cache",
+    tags=["status"],
+)
+async def profile_cache_status(
+    profile_cache: ProfileCacheService = Depends(get_profile_cache),
+) -> JSONResponse:
+    """Reports the size and hit counters of the profile cache.
+
+    Returns:
+        JSONResponse: Object containing the cache statistics and status code.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "data": profile_cache.stats(),
+            "status_code": status.HTTP_200_OK,
+        },
+    )
+
+
+@router.get(
+    "/profile-history",
+    tags=["status"],
+)
+async def profile_history_status(
+    profile_history: ProfileHistoryService = Depends(get_profile_history),
+) -> JSONResponse:
+    """Reports the number of profiles, posts and snapshots in the history store.
+
+    Returns:
+        JSONResponse: Object containing the history statistics and status code.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "data": await profile_history.stats(),
+            "status_code": status.HTTP_200_OK,
+        },
+    )
+
+
+@router.get(
+    "/search-quota",
+    tags=["status"],
+)
+async def search_quota_status(
+    search_cache: SearchCacheService = Depends(get_search_cache),
+) -> JSONResponse:
+    """Reports today's Google Custom Search usage and remaining budget.
+
+    Returns:
+        JSONResponse: Object containing the quota ledger and status code.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "data": await search_cache.quota(),
+            "status_code": status.HTTP_200_OK,
+        },
+    )
+
+
+@router.get(
+    "/feedback-cache",
+    tags=["status"],
+)
+async def feedback_cache_status(
+    result_feedback: ResultFeedbackService = Depends(get_result_feedback),
+) -> JSONResponse:
+    """Reports the size and hit counters of the feedback cache.
+
+    Returns:
+        JSONResponse: Object containing the cache statistics and status code.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "data": result_feedback.stats(),
+            "status_code": status.HTTP_200_OK,
+        },
+    )
+
+
+@router.get(
+    "/rate-limits",
+    tags=["status"],
+)
+async def rate_limits_status(
+    rate_limiter: HostRateLimiter = Depends(get_rate_limiter),
+) -> JSONResponse:
+    """Reports the outbound rate limit and current wait time of each host.
+
+    Returns:
+        JSONResponse: Object containing the per-host limiter state and status code.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "data": rate_limiter.stats(),
+            "status_code": status.HTTP_200_OK,
+        },
+    )
+
+
+@router.get(
+    "/circuit-breakers",
+    tags=["status"],
+)
+async def circuit_breakers_status(
+    breakers: CircuitBreakerRegistry = Depends(get_circuit_breakers),
+) -> JSONResponse:
+    """Reports the state of the circuit breaker of each platform and strategy.
+
+    Returns:
+        JSONResponse: Object containing the breaker states and status code.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "data": breakers.stats(),
+            "status_code": status.HTTP_200_OK,
+        },
+    )
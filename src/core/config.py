@@ -1,4 +1,5 @@
 import os
+from typing import Dict, List
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -22,20 +23,180 @@ class Config(BaseSettings):
         "INFO", validation_alias="LOG_LEVEL"
     )  # e.g., DEBUG, INFO, WARNING, ERROR
     INSTAGRAM_COOKIES: str = Field("", validation_alias="INSTAGRAM_COOKIES")
+    INSTAGRAM_POST_CONCURRENCY: int = Field(
+        5, validation_alias="INSTAGRAM_POST_CONCURRENCY"
+    )  # Post pages fetched at the same time for their dates
     TIKTOK_COOKIES: str = Field("", validation_alias="TIKTOK_COOKIES")
+    TIKTOK_ITEM_LIST_MAX_PAGES: int = Field(
+        5, validation_alias="TIKTOK_ITEM_LIST_MAX_PAGES"
+    )  # Item list pages (35 posts each) followed per profile
     TEXT_PROMPT_MODEL_NAME: str = Field("", validation_alias="TEXT_PROMPT_MODEL_NAME")
     PREPROMPT_FILE_PATH: str = Field(
         os.path.join("assets", "preprompt"), validation_alias="PREPROMPT_FILE_PATH"
     )
+    FEEDBACK_CACHE_SIZE: int = Field(
+        1024, validation_alias="FEEDBACK_CACHE_SIZE"
+    )  # Generated feedbacks kept in memory, 0 disables the cache
+    EXTRACTION_SPECS_PATH: str = Field(
+        os.path.join("assets", "extraction_specs.json"),
+        validation_alias="EXTRACTION_SPECS_PATH",
+    )  # XPath field specs used to parse the scraped pages
     GOOGLE_API_KEY: str = Field("", validation_alias="GOOGLE_API_KEY")
     APIFY_KEY: str = Field("", validation_alias="APIFY_KEY")
+    APIFY_BATCH_WINDOW: float = Field(
+        0.5, validation_alias="APIFY_BATCH_WINDOW"
+    )  # Seconds Instagram lookups are collected before an actor run
+    APIFY_BATCH_MAX_SIZE: int = Field(
+        25, validation_alias="APIFY_BATCH_MAX_SIZE"
+    )  # Profiles per actor run
 
     HTTPX_TIMEOUT: int = Field(120, validation_alias="HTTPX_TIMEOUT")
+    HTTPX_HTTP2: bool = Field(True, validation_alias="HTTPX_HTTP2")
+    HTTPX_MAX_CONNECTIONS: int = Field(100, validation_alias="HTTPX_MAX_CONNECTIONS")
+    HTTPX_MAX_CONNECTIONS_PER_HOST: int = Field(
+        10, validation_alias="HTTPX_MAX_CONNECTIONS_PER_HOST"
+    )  # In-flight requests per host
+    HTTPX_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        20, validation_alias="HTTPX_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    HTTPX_KEEPALIVE_EXPIRY: float = Field(
+        60, validation_alias="HTTPX_KEEPALIVE_EXPIRY"
+    )  # Seconds an idle connection is kept open
     GOOGLE_SEARCH_API_ENDPOINT: str = Field(
         "https://www.googleapis.com/customsearch/v1",
         validation_alias="GOOGLE_SEARCH_API_ENDPOINT",
     )
     GOOGLE_SEARCH_ENGINE_ID: str = Field("", validation_alias="GOOGLE_SEARCH_ENGINE_ID")
+    CSE_MAX_PAGES: int = Field(
+        2, validation_alias="CSE_MAX_PAGES"
+    )  # Google Custom Search pages per dork (10 results each)
+    CSE_CONCURRENT_PAGES: int = Field(
+        2, validation_alias="CSE_CONCURRENT_PAGES"
+    )  # Pages requested speculatively at the same time, after the first
+    CSE_CACHE_DB_PATH: str = Field(
+        os.path.join("exports", "cse_cache.db"), validation_alias="CSE_CACHE_DB_PATH"
+    )
+    CSE_CACHE_TTL: float = Field(
+        12 * 60 * 60, validation_alias="CSE_CACHE_TTL"
+    )  # Seconds a search response is reused
+    CSE_DAILY_QUOTA: int = Field(
+        100, validation_alias="CSE_DAILY_QUOTA"
+    )  # Queries allowed per UTC day
+    CSE_QUOTA_RESERVE: int = Field(
+        10, validation_alias="CSE_QUOTA_RESERVE"
+    )  # Queries kept back; below this only cached results are served
+    RATING_HORIZON_DAYS: int = Field(
+        30, validation_alias="RATING_HORIZON_DAYS"
+    )  # Posts older than this do not affect the rating
+
+    # --- Outbound Rate Limits (requests per second per domain) ---
+    OUTBOUND_RATE_LIMITS: Dict[str, float] = Field(
+        {
+            "tiktok.com": 2,
+            "instagram.com": 1,
+            "facebook.com": 1,
+            "x.com": 1,
+            "googleapis.com": 5,
+            "api.apify.com": 2,
+        },
+        validation_alias="OUTBOUND_RATE_LIMITS",
+    )  # JSON object in the environment, subdomains share their domain's bucket
+    OUTBOUND_RATE_BURST: int = Field(
+        2, validation_alias="OUTBOUND_RATE_BURST"
+    )  # Requests allowed back to back before the rate applies
+
+    # --- Scrape Deadlines (seconds per platform) ---
+    FACEBOOK_SCRAPE_DEADLINE: float = Field(
+        60, validation_alias="FACEBOOK_SCRAPE_DEADLINE"
+    )
+    INSTAGRAM_SCRAPE_DEADLINE: float = Field(
+        90, validation_alias="INSTAGRAM_SCRAPE_DEADLINE"
+    )
+    TIKTOK_SCRAPE_DEADLINE: float = Field(45, validation_alias="TIKTOK_SCRAPE_DEADLINE")
+    X_SCRAPE_DEADLINE: float = Field(60, validation_alias="X_SCRAPE_DEADLINE")
+
+    # --- Batch Scraping ---
+    SCRAPE_BATCH_CONCURRENCY: int = Field(
+        4, validation_alias="SCRAPE_BATCH_CONCURRENCY"
+    )  # Businesses scraped at the same time per batch
+    SCRAPE_BATCH_MAX_ITEMS: int = Field(5000, validation_alias="SCRAPE_BATCH_MAX_ITEMS")
+
+    # --- Scrape Jobs ---
+    SCRAPE_JOB_WORKERS: int = Field(
+        4, validation_alias="SCRAPE_JOB_WORKERS"
+    )  # Jobs processed at the same time
+    SCRAPE_JOB_QUEUE_SIZE: int = Field(
+        100, validation_alias="SCRAPE_JOB_QUEUE_SIZE"
+    )  # Queued jobs before new submissions are refused
+    SCRAPE_JOB_RETENTION: float = Field(
+        60 * 60, validation_alias="SCRAPE_JOB_RETENTION"
+    )  # Seconds a finished job can still be polled
+
+    # --- Circuit Breakers ---
+    CIRCUIT_FAILURE_THRESHOLD: int = Field(
+        5, validation_alias="CIRCUIT_FAILURE_THRESHOLD"
+    )  # Consecutive failures before a strategy is short-circuited
+    CIRCUIT_RESET_TIMEOUT: float = Field(
+        60, validation_alias="CIRCUIT_RESET_TIMEOUT"
+    )  # Seconds before a probe call is let through
+
+    # --- Page Readiness ---
+    PAGE_READY_TIMEOUT_MS: int = Field(
+        2000, validation_alias="PAGE_READY_TIMEOUT_MS"
+    )  # Upper bound on waiting for the profile fields, never above the old sleep
+    SPA_PAGE_READY_TIMEOUT_MS: int = Field(
+        60000, validation_alias="SPA_PAGE_READY_TIMEOUT_MS"
+    )  # Same for Instagram and TikTok, which render well after DOMContentLoaded
+
+    # --- Browser Pool ---
+    BROWSER_HEADLESS: bool = Field(True, validation_alias="BROWSER_HEADLESS")
+    BROWSER_POOL_SIZE: int = Field(
+        4, validation_alias="BROWSER_POOL_SIZE"
+    )  # Maximum number of concurrent pages
+    BROWSER_MAX_NAVIGATIONS: int = Field(
+        50, validation_alias="BROWSER_MAX_NAVIGATIONS"
+    )  # Navigations before a browser is relaunched
+    BROWSER_BLOCKED_RESOURCE_TYPES: List[str] = Field(
+        ["image", "media", "font"], validation_alias="BROWSER_BLOCKED_RESOURCE_TYPES"
+    )  # Playwright resource types aborted in every page
+    BROWSER_BLOCKED_DOMAINS: List[str] = Field(
+        [
+            "google-analytics.com",
+            "googletagmanager.com",
+            "doubleclick.net",
+            "googlesyndication.com",
+            "analytics.tiktok.com",
+            "analytics.twitter.com",
+            "ads-twitter.com",
+        ],
+        validation_alias="BROWSER_BLOCKED_DOMAINS",
+    )  # Tracker domains aborted in every page, subdomains included
+
+    # --- Profile Cache (seconds) ---
+    PROFILE_CACHE_SIZE: int = Field(
+        512, validation_alias="PROFILE_CACHE_SIZE"
+    )  # Profiles kept in memory per worker
+    PROFILE_CACHE_TTL: float = Field(
+        6 * 60 * 60, validation_alias="PROFILE_CACHE_TTL"
+    )  # Age up to which a profile is served without a refresh
+    PROFILE_CACHE_STALE_TTL: float = Field(
+        24 * 60 * 60, validation_alias="PROFILE_CACHE_STALE_TTL"
+    )  # Extra age served stale while a refresh runs in the background
+    PROFILE_CACHE_NEGATIVE_TTL: float = Field(
+        5 * 60, validation_alias="PROFILE_CACHE_NEGATIVE_TTL"
+    )  # Age up to which failed scrapes are remembered
+    PROFILE_CACHE_DB_PATH: str = Field(
+        "", validation_alias="PROFILE_CACHE_DB_PATH"
+    )  # SQLite file shared across workers, disabled when empty
+
+    # --- Profile History ---
+    PROFILE_HISTORY_DB_PATH: str = Field(
+        os.path.join("exports", "profile_history.db"),
+        validation_alias="PROFILE_HISTORY_DB_PATH",
+    )  # SQLite file of follower snapshots and post timestamps per profile
+    PROFILE_HISTORY_RETENTION_DAYS: int = Field(
+        90, validation_alias="PROFILE_HISTORY_RETENTION_DAYS"
+    )  # Posts and snapshots older than this are dropped
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,106 @@
+import logging
+
+from apify_client import ApifyClientAsync
+
+from src.core.config import config
+from src.services.apify_batcher import ApifyInstagramBatcher
+from src.services.browser_pool import BrowserPoolService
+from src.services.facebook_scraper import FacebookScraperService
+from src.services.instagram_scraper import InstagramScraperService
+from src.services.profile_cache import ProfileCacheService
+from src.services.profile_history import ProfileHistoryService
+from src.services.rate_social_media import RateSocialMediaService
+from src.services.result_feedback import ResultFeedbackService
+from src.services.scrape_jobs import ScrapeJobService
+from src.services.scrape_orchestrator import ScrapeOrchestratorService
+from src.services.search_cache import SearchCacheService
+from src.services.social_dorker import SocialDorkerService
+from src.services.tiktok_scraper import TiktokScraperService
+from src.services.x_scraper import XScraperService
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.http_client import build_async_client
+from src.utils.rate_limiter import HostRateLimiter
+
+
+class ServiceContainer:
+    """
+    Holds the application-wide services.
+
+    The container is built once in the FastAPI lifespan, handed to the routers
+    through the dependencies in `src.api.v1.dependencies`, and closed on
+    shutdown so that browsers and HTTP connections are released.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger("ServiceContainer")
+        self.rate_limiter = HostRateLimiter()
+        self.breakers = CircuitBreakerRegistry()
+        self.httpx_client = build_async_client(rate_limiter=self.rate_limiter)
+        self.apify_client = ApifyClientAsync(config.APIFY_KEY)
+        self.apify_batcher = ApifyInstagramBatcher(
+            apify_client=self.apify_client, rate_limiter=self.rate_limiter
+        )
+        self.browser_pool = BrowserPoolService(rate_limiter=self.rate_limiter)
+        self.search_cache = SearchCacheService()
+        self.social_dorker = SocialDorkerService(
+            httpx_client=self.httpx_client,
+            search_cache=self.search_cache,
+            breakers=self.breakers,
+        )
+        self.profile_cache = ProfileCacheService()
+        self.profile_history = ProfileHistoryService()
+
+        self.facebook = FacebookScraperService(
+            browser_pool=self.browser_pool, social_dorker=self.social_dorker
+        )
+        self.instagram = InstagramScraperService(
+            browser_pool=self.browser_pool,
+            apify_batcher=self.apify_batcher,
+            httpx_client=self.httpx_client,
+        )
+        self.tiktok = TiktokScraperService(
+            browser_pool=self.browser_pool,
+            social_dorker=self.social_dorker,
+            httpx_client=self.httpx_client,
+        )
+        self.x = XScraperService(
+            browser_pool=self.browser_pool, social_dorker=self.social_dorker
+        )
+        self.scrape_orchestrator = ScrapeOrchestratorService(
+            facebook=self.facebook,
+            instagram=self.instagram,
+            tiktok=self.tiktok,
+            x=self.x,
+            cache=self.profile_cache,
+            breakers=self.breakers,
+            history=self.profile_history,
+        )
+        self.rate_social_media = RateSocialMediaService()
+        self.result_feedback = ResultFeedbackService()
+        self.scrape_jobs = ScrapeJobService(
+            orchestrator=self.scrape_orchestrator,
+            rate_social_media=self.rate_social_media,
+            result_feedback=self.result_feedback,
+        )
+
+    async def start(self):
+        """
+        Starts the services that hold long-lived resources.
+        """
+        self.logger.info("Starting services")
+        await self.browser_pool.start()
+        await self.scrape_jobs.start()
+
+    async def close(self):
+        """
+        Releases the browsers and HTTP connections held by the services.
+        """
+        self.logger.info("Closing services")
+        await self.scrape_jobs.close()
+        await self.apify_batcher.close()
+        await self.scrape_orchestrator.close()
+        await self.browser_pool.close()
+        await self.httpx_client.aclose()
+        self.search_cache.close()
+        self.profile_cache.close()
+        self.profile_history.close()
@@ -0,0 +1,22 @@
+from urllib.parse import urlparse
+
+
+def profile_key(platform: str, url: str) -> str:
+    """
+    Builds a stable cache key for a platform profile URL.
+
+    The scheme, a leading "www.", the query string, the fragment and trailing
+    slashes are ignored and the result is lowercased, so the different ways a
+    client writes the same profile URL share a key.
+
+    Args:
+        platform (str): The platform name (facebook, instagram, tiktok or x).
+        url (str): The profile URL.
+
+    Returns:
+        str: The cache key, e.g. "tiktok:tiktok.com/@user".
+    """
+    parsed = urlparse(url.strip() if "://" in url else f"https://{url.strip()}")
+    host = parsed.netloc.lower().removeprefix("www.")
+    path = parsed.path.rstrip("/").lower()
+    return f"{platform}:{host}{path}"
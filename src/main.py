@@ -1,12 +1,13 @@
 import asyncio
 import logging
 import sys
+from contextlib import asynccontextmanager
 
-import nest_asyncio  # type: ignore
 from fastapi import FastAPI
 
 from src.api.v1.api_router import api_v1_router
 from src.core.config import config
+from src.core.container import ServiceContainer
 from src.core.exceptions import add_exception_handlers
 from src.utils.logging import setup_logging
 
@@ -16,22 +17,24 @@ setup_logging(log_level=log_level)
 logger = logging.getLogger(__name__)  # This logger will be used by the middleware too
 # ---------------------
 
-# Apply nest_asyncio to allow nested event loops
-if type(asyncio.get_event_loop()).__module__ != "uvloop.loop":
-    nest_asyncio.apply()
-
 # Windows-specific event loop policy
 if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
-# @asynccontextmanager
-# async def lifespan(app: FastAPI):
-#     """
-#     Lifespan context manager for FastAPI.
-#     """
-#     pass
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Lifespan context manager for FastAPI.
+    """
+    container = ServiceContainer()
+    await container.start()
+    app.state.container = container
+    yield
+    await container.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(api_v1_router, prefix="/v1")
 
@@ -1,5 +1,9 @@
+from typing import List, Optional
+
 from pydantic import BaseModel, Field
 
+from src.core.config import config
+
 
 class ScrapeRequest(BaseModel):
     """
@@ -11,6 +15,24 @@ class ScrapeRequest(BaseModel):
     instagram: str = Field("", description="Instagram URL")
     tiktok: str = Field("", description="Tiktok URL")
     x: str = Field("", description="X URL")
+    max_age: Optional[float] = Field(
+        None,
+        ge=0,
+        description="Maximum age in seconds of cached profile data, 0 to re-scrape",
+    )
+
+
+class BatchScrapeRequest(BaseModel):
+    """
+    Model for a batch of businesses to scrape, one ScrapeRequest per business.
+    """
+
+    items: List[ScrapeRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=config.SCRAPE_BATCH_MAX_ITEMS,
+        description="Businesses to scrape",
+    )
 
 
 # from pydantic import BaseModel, Field, field_validator
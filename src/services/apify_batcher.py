@@ -0,0 +1,163 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+from apify_client import ApifyClientAsync
+
+from src.core.config import config
+
+APIFY_API_HOST = "api.apify.com"
+INSTAGRAM_ACTOR = "apify/instagram-scraper"
+
+
+def instagram_username(url):
+    """
+    Returns the lowercased username of an Instagram profile URL.
+    """
+    path = urlparse(url if "://" in url else f"https://{url}").path
+    segments = [segment for segment in path.split("/") if segment]
+    if not segments:
+        raise ValueError(f"Could not extract username from {url}")
+    return segments[0].lower()
+
+
+class _PendingProfile:
+    def __init__(self, url, since):
+        self.url = url
+        self.since = since
+        self.future = asyncio.get_running_loop().create_future()
+
+
+class ApifyInstagramBatcher:
+    """
+    Micro-batches Instagram profile lookups into shared Apify actor runs.
+
+    Profiles requested within `window` seconds of each other, up to
+    `max_batch_size`, are sent as the `directUrls` of a single
+    `apify/instagram-scraper` run, awaited with the async Apify client. The
+    dataset items are routed back to each caller by username, so the actor
+    cold start is paid once per batch instead of once per profile. When every
+    profile of a batch has a `since`, only posts newer than the oldest of them
+    are requested.
+    """
+
+    def __init__(
+        self,
+        apify_client=None,
+        window=config.APIFY_BATCH_WINDOW,
+        max_batch_size=config.APIFY_BATCH_MAX_SIZE,
+        rate_limiter=None,
+    ):
+        self.logger = logging.getLogger("ApifyInstagramBatcher")
+        self.apify_client = apify_client or ApifyClientAsync(config.APIFY_KEY)
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.rate_limiter = rate_limiter
+        self._pending = {}
+        self._flush_task = None
+        self._runs = set()
+        self.batches = 0
+        self.profiles = 0
+
+    async def fetch(self, url, since=None):
+        """
+        Returns the Apify dataset item of an Instagram profile.
+
+        Args:
+            url (str): The Instagram profile URL.
+            since (int, optional): Epoch time of the newest post already known.
+
+        Returns:
+            dict: The "details" item produced by the actor for the profile.
+
+        Raises:
+            LookupError: When the actor run returned no item for the profile.
+        """
+        username = instagram_username(url)
+        waiter = self._pending.get(username)
+        if waiter is None:
+            waiter = _PendingProfile(url, since)
+            self._pending[username] = waiter
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_later())
+        elif waiter.since is not None:
+            waiter.since = None if since is None else min(waiter.since, since)
+        # Shielded so that one caller giving up does not fail the others
+        return await asyncio.shield(waiter.future)
+
+    async def close(self):
+        """
+        Cancels the scheduled flush and the actor runs still being awaited.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        for task in list(self._runs):
+            task.cancel()
+        await asyncio.gather(*self._runs, return_exceptions=True)
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.window)
+        self._flush_task = None
+        self._flush()
+
+    def _flush(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._runs.add(task)
+            task.add_done_callback(self._runs.discard)
+
+    async def _run(self, batch):
+        log = self.logger.getChild("_run")
+        log.info("Running %s for %s profiles", INSTAGRAM_ACTOR, len(batch))
+        self.batches += 1
+        self.profiles += len(batch)
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(APIFY_API_HOST)
+            run_input = {
+                "directUrls": [waiter.url for waiter in batch.values()],
+                "enhanceUserSearchWithFacebookPage": False,
+                "isUserReelFeedURL": False,
+                "isUserTaggedFeedURL": False,
+                "resultsLimit": 20,
+                "resultsType": "details",
+                "searchLimit": 2,
+            }
+            since = [waiter.since for waiter in batch.values()]
+            if None not in since:
+                run_input["onlyPostsNewerThan"] = datetime.fromtimestamp(
+                    min(since), timezone.utc
+                ).strftime("%Y-%m-%dT%H:%M:%SZ")
+            run = await self.apify_client.actor(INSTAGRAM_ACTOR).call(
+                run_input=run_input, logger=None
+            )
+            dataset = self.apify_client.dataset(run["defaultDatasetId"])
+            async for item in dataset.iterate_items():
+                username = (item.get("username") or "").lower()
+                if username not in batch and item.get("inputUrl"):
+                    username = instagram_username(item["inputUrl"])
+                waiter = batch.get(username)
+                if waiter is not None and not waiter.future.done():
+                    waiter.future.set_result(item)
+            for username, waiter in batch.items():
+                if not waiter.future.done():
+                    waiter.future.set_exception(
+                        LookupError(f"No Apify result for {username}")
+                    )
+        except Exception as e:
+            log.error("Actor run failed: %s", e)
+            for waiter in batch.values():
+                if not waiter.future.done():
+                    waiter.future.set_exception(e)
+        finally:
+            # Closing the batcher cancels the run, and with it its waiters
+            for waiter in batch.values():
+                if not waiter.future.done():
+                    waiter.future.cancel()
@@ -0,0 +1,237 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+from playwright.async_api import async_playwright
+
+from src.core.config import config
+
+# Typical transfer size of the resource types that get blocked, used to report
+# an estimate of the bandwidth saved since aborted requests have no size
+ESTIMATED_RESOURCE_BYTES = {
+    "image": 60_000,
+    "media": 500_000,
+    "font": 40_000,
+    "stylesheet": 30_000,
+    "script": 80_000,
+}
+DEFAULT_RESOURCE_BYTES = 20_000
+
+
+class _PageRoutes:
+    def __init__(self):
+        self.blocked = 0
+        self.bytes_saved = 0
+
+
+class _PooledBrowser:
+    def __init__(self, browser):
+        self.browser = browser
+        self.navigations = 0
+        self.active_contexts = 0
+        self.retired = False
+
+
+class BrowserPoolService:
+    """
+    Process-wide pool of persistent Chromium browsers.
+
+    Every scrape gets a fresh isolated browser context on a long-lived browser
+    instead of launching Chromium itself. The number of concurrent pages is
+    capped at the pool size, and the browser is replaced after
+    `max_navigations` contexts to keep its memory in check. A replaced browser
+    is closed once its last context is done.
+
+    Every pooled context aborts the requests for `blocked_resource_types` and
+    `blocked_domains`, since scrapers only read the DOM. When a rate limiter is
+    given, every navigation also waits for its host's token before the request
+    is sent.
+    """
+
+    def __init__(
+        self,
+        size=config.BROWSER_POOL_SIZE,
+        max_navigations=config.BROWSER_MAX_NAVIGATIONS,
+        headless=config.BROWSER_HEADLESS,
+        rate_limiter=None,
+        blocked_resource_types=config.BROWSER_BLOCKED_RESOURCE_TYPES,
+        blocked_domains=config.BROWSER_BLOCKED_DOMAINS,
+    ):
+        self.logger = logging.getLogger("BrowserPoolService")
+        self.size = size
+        self.max_navigations = max_navigations
+        self.headless = headless
+        self.rate_limiter = rate_limiter
+        self.blocked_resource_types = frozenset(blocked_resource_types)
+        self.blocked_domains = frozenset(domain.lower() for domain in blocked_domains)
+        self._playwright = None
+        self._current = None
+        self._browsers = set()
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(size)
+        self._launches = 0
+        self._navigations = 0
+        self._active_pages = 0
+        self._queued = 0
+        self._blocked = 0
+        self._bytes_saved = 0
+
+    async def start(self):
+        """
+        Starts Playwright and launches the first browser of the pool.
+        """
+        self.logger.info("Starting browser pool with %s pages", self.size)
+        async with self._lock:
+            await self._current_browser()
+
+    async def close(self):
+        """
+        Closes every browser in the pool and stops Playwright.
+        """
+        self.logger.info("Closing browser pool")
+        async with self._lock:
+            for pooled in list(self._browsers):
+                await self._close_browser(pooled)
+            self._current = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    @asynccontextmanager
+    async def context(self, **context_options):
+        """
+        Yields a fresh isolated browser context from the pool.
+
+        The context is closed on exit, so cookies and storage never leak between
+        scrapes. Callers wait here while the pool is at its page limit.
+
+        Args:
+            **context_options: Keyword arguments for `browser.new_context`.
+
+        Yields:
+            BrowserContext: The Playwright browser context.
+        """
+        self._queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+
+        self._active_pages += 1
+        try:
+            async with self._lock:
+                pooled = await self._current_browser()
+                pooled.navigations += 1
+                pooled.active_contexts += 1
+                self._navigations += 1
+            try:
+                context = await pooled.browser.new_context(**context_options)
+                routes = _PageRoutes()
+                try:
+                    if (
+                        self.rate_limiter is not None
+                        or self.blocked_resource_types
+                        or self.blocked_domains
+                    ):
+                        await context.route(
+                            "**/*", lambda route: self._handle_route(route, routes)
+                        )
+                    yield context
+                finally:
+                    await context.close()
+                    if routes.blocked:
+                        self.logger.debug(
+                            "Blocked %s requests, about %s KB saved",
+                            routes.blocked,
+                            routes.bytes_saved // 1000,
+                        )
+            finally:
+                pooled.active_contexts -= 1
+                if pooled.retired and pooled.active_contexts == 0:
+                    await self._close_browser(pooled)
+        finally:
+            self._active_pages -= 1
+            self._semaphore.release()
+
+    def _is_blocked(self, request):
+        if request.resource_type in self.blocked_resource_types:
+            return True
+        labels = (urlparse(request.url).hostname or "").split(".")
+        return any(
+            ".".join(labels[index:]) in self.blocked_domains
+            for index in range(len(labels) - 1)
+        )
+
+    async def _handle_route(self, route, routes):
+        request = route.request
+        if self._is_blocked(request):
+            estimate = ESTIMATED_RESOURCE_BYTES.get(
+                request.resource_type, DEFAULT_RESOURCE_BYTES
+            )
+            routes.blocked += 1
+            routes.bytes_saved += estimate
+            self._blocked += 1
+            self._bytes_saved += estimate
+            await route.abort("blockedbyclient")
+            return
+        if self.rate_limiter is not None and request.is_navigation_request():
+            await self.rate_limiter.acquire(request.url)
+        await route.continue_()
+
+    def stats(self):
+        """
+        Reports the occupancy of the pool.
+
+        Returns:
+            dict: The page limit, live browsers, active and queued pages, browser
+                launches and navigations served so far, and the requests blocked
+                with an estimate of the bytes they would have transferred.
+        """
+        return {
+            "size": self.size,
+            "browsers": len(self._browsers),
+            "activePages": self._active_pages,
+            "queuedPages": self._queued,
+            "launches": self._launches,
+            "navigations": self._navigations,
+            "maxNavigationsPerBrowser": self.max_navigations,
+            "blockedRequests": self._blocked,
+            "estimatedBytesSaved": self._bytes_saved,
+            "estimatedBytesSavedPerNavigation": (
+                self._bytes_saved // self._navigations if self._navigations else 0
+            ),
+        }
+
+    async def _current_browser(self):
+        # Must be called while holding self._lock
+        current = self._current
+        if (
+            current is not None
+            and current.browser.is_connected()
+            and current.navigations < self.max_navigations
+        ):
+            return current
+
+        if current is not None:
+            self.logger.info(
+                "Recycling browser after %s navigations", current.navigations
+            )
+            current.retired = True
+            if current.active_contexts == 0 or not current.browser.is_connected():
+                await self._close_browser(current)
+
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        browser = await self._playwright.chromium.launch(headless=self.headless)
+        self._current = _PooledBrowser(browser)
+        self._browsers.add(self._current)
+        self._launches += 1
+        return self._current
+
+    async def _close_browser(self, pooled):
+        self._browsers.discard(pooled)
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            self.logger.error("Failed to close browser: %s", e)
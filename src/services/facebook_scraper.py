@@ -1,35 +1,31 @@
-import asyncio
 import logging
-import re
-from concurrent.futures import ThreadPoolExecutor
 
 from lxml import html
-from playwright.sync_api import sync_playwright
 
+from src.core.config import config
+from src.services.browser_pool import BrowserPoolService
 from src.services.social_dorker import SocialDorkerService
-from src.utils.convert_number_with_suffix import convert_number_with_suffix
-from src.utils.time_to_epoch import time_to_epoch
+from src.utils.circuit_breaker import is_transient
+from src.utils.extraction import extract
+from src.utils.page_ready import wait_for_ready
+from src.utils.single_flight import SingleFlight, coalesce
+from src.utils.time_to_epoch import parse_many
+
+# Nodes read from the rendered page, waited for instead of a fixed sleep
+READY_SELECTORS = ("xpath=//a[contains(@href, 'followers')]/strong",)
 
 
 class FacebookScraperService:
-    def __init__(self, headless=True):
+    def __init__(self, browser_pool=None, social_dorker=None):
         self.logger = logging.getLogger("FacebookScraperService")
-        self.headless = headless
-        self.executor = ThreadPoolExecutor(max_workers=1)
-        self.social_dorker = SocialDorkerService()
+        self.single_flight = SingleFlight()
+        self.social_dorker = social_dorker or SocialDorkerService()
+        self.browser_pool = browser_pool or BrowserPoolService()
 
+    @coalesce("facebook")
     async def scrape(self, url, timeout=2000):
         """
-        Run sync Playwright in a thread pool to avoid event loop conflicts
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor, lambda: self._sync_scrape(url, timeout)
-        )
-
-    def _sync_scrape(self, url, timeout=2000):
-        """
-        Synchronously scrapes Facebook page data using Playwright.
+        Scrapes Facebook page data using async Playwright.
 
         This method navigates to a given Facebook URL, waits for the content to load,
         and extracts various data points such as verification status, reviews, likes,
@@ -50,6 +46,8 @@ class FacebookScraperService:
                 - follower (int): The number of followers, if available.
                 - error (str, optional): An error message if scraping fails.
                 - message (str, optional): A failure message if scraping fails.
+                - transient (bool, optional): Whether the failure came from the
+                  platform or the network rather than from the profile.
         """
 
         log = self.logger.getChild("scrape")
@@ -59,90 +57,63 @@ class FacebookScraperService:
         log.info("Scraping facebook %s", url)
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=self.headless)
-                context = browser.new_context(
-                    locale="en-US",
-                    extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
-                )
-                page = context.new_page()
+            async with self.browser_pool.context(
+                locale="en-US",
+                extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
+            ) as context:
+                page = await context.new_page()
 
                 # Set a realistic user-agent
-                page.set_extra_http_headers(
+                await page.set_extra_http_headers(
                     {
                         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"  # noqa
                     }
                 )
                 # Navigate to the page
-                page.goto(url)
+                await page.goto(url)
 
                 # Wait for page content to load (you can adjust the selector)
-                page.wait_for_load_state("domcontentloaded")
+                await page.wait_for_load_state("domcontentloaded")
                 # Close the "Create New Account" popup
-                close_button = page.query_selector('[aria-label="Close"]')
+                close_button = await page.query_selector('[aria-label="Close"]')
                 if close_button:
-                    close_button.click()
+                    await close_button.click()
 
                 # Scroll to the bottom of the page to load more content
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
 
-                # Wait for page content to load (you can adjust the selector)
-                page.wait_for_timeout(timeout)
+                # Wait until the follower count is rendered
+                if not await wait_for_ready(
+                    page, READY_SELECTORS, min(timeout, config.PAGE_READY_TIMEOUT_MS)
+                ):
+                    log.warning("Facebook page %s did not become ready", url)
 
                 # Get the full HTML after JS has rendered
-                html_content = page.content()
-                browser.close()
-                tree = html.fromstring(html_content)
-                # post_age_list = tree.xpath(
-                #     "//div[contains(@data-pagelet, 'TimelineFeedUnit')]//div[2]/span//span//a[contains(@role, 'link')]"  # noqa
-                # )
-                page_like = (
-                    tree.xpath("//a[contains(@href, 'friends_likes')]/strong").pop()
-                    if len(tree.xpath("//a[contains(@href, 'friends_likes')]/strong"))
-                    > 0
-                    else None
-                )
-                page_follower = (
-                    tree.xpath("//a[contains(@href, 'followers')]/strong").pop()
-                    if len(tree.xpath("//a[contains(@href, 'followers')]/strong")) > 0
-                    else None
-                )
-                is_verified = (
-                    True
-                    if len(tree.xpath("//*/h1//*[@title='Verified account']")) > 0
-                    else False
-                )
-                review_path = tree.xpath("//a[contains(@href, '/reviews')]//span")
-                reviews = (
-                    review_path[0].text_content()
-                    if len(review_path) > 0
-                    else "No reviews"
-                )
-                posts = self.social_dorker.get_video_dates(
-                    url, dork_fn=self.social_dorker.get_facebook_dork
-                )
-                gathered_data = {
-                    "verified": is_verified,
-                    "reviews": reviews,
-                    "posts": [
-                        time_to_epoch(re.sub(r"\s+", " ", post).strip())
-                        for post in posts
-                    ],
-                }
-                if isinstance(page_like, html.HtmlElement):
-                    gathered_data["like"] = convert_number_with_suffix(
-                        page_like.text_content()
-                    )
-                if isinstance(page_follower, html.HtmlElement):
-                    gathered_data["follower"] = convert_number_with_suffix(
-                        page_follower.text_content()
-                    )
-                log.info("Gathered data: %s", gathered_data)
-                return gathered_data
+                html_content = await page.content()
+            tree = html.fromstring(html_content)
+            # post_age_list = tree.xpath(
+            #     "//div[contains(@data-pagelet, 'TimelineFeedUnit')]//div[2]/span//span//a[contains(@role, 'link')]"  # noqa
+            # )
+            fields = extract("facebook", tree)
+            posts = await self.social_dorker.get_video_dates(
+                url, dork_fn=self.social_dorker.get_facebook_dork
+            )
+            gathered_data = {
+                "verified": fields["verified"],
+                "reviews": fields["reviews"],
+                "posts": list(parse_many(posts, source="facebook", normalize=True)),
+            }
+            if "like" in fields:
+                gathered_data["like"] = fields["like"]
+            if "follower" in fields:
+                gathered_data["follower"] = fields["follower"]
+            log.info("Gathered data: %s", gathered_data)
+            return gathered_data
 
         except Exception as e:
             log.error("Failed to scrape Facebook: %s", e)
             return {
                 "error": str(e),
                 "message": "Failed to scrape Facebook",
+                "transient": is_transient(e),
             }
@@ -1,118 +1,133 @@
 import asyncio
 import logging
 import re
-from concurrent.futures import ThreadPoolExecutor
 
-import requests
-from apify_client import ApifyClient
+import httpx
 from lxml import html
-from playwright.sync_api import sync_playwright
 
 from src.core.config import config
+from src.services.apify_batcher import ApifyInstagramBatcher
+from src.services.browser_pool import BrowserPoolService
+from src.utils.circuit_breaker import is_transient
 from src.utils.convert_number_with_suffix import convert_number_with_suffix
-from src.utils.time_to_epoch import time_to_epoch
+from src.utils.extraction import extract
+from src.utils.page_ready import wait_for_ready
+from src.utils.single_flight import SingleFlight, coalesce
+from src.utils.time_to_epoch import parse_many, time_to_epoch
+
+HEAD_END = b"</head>"
+POST_DATE_PATTERN = re.compile(
+    r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}"  # noqa
+)
+# Nodes read from the rendered page, waited for instead of a fixed sleep
+READY_SELECTORS = (
+    "xpath=(//span/span/span[contains(@class, 'html-span')])[2]",
+    "xpath=//*[contains(@style, 'flex')]//a[contains(@href,'/')]",
+)
 
 
 class InstagramScraperService:
-    def __init__(self, headless=True):
+    def __init__(
+        self,
+        browser_pool=None,
+        apify_batcher=None,
+        httpx_client=None,
+        rate_limiter=None,
+        post_concurrency=config.INSTAGRAM_POST_CONCURRENCY,
+    ):
         self.logger = logging.getLogger("InstagramScraperService")
-        self.headless = headless
-        self.executor = ThreadPoolExecutor(max_workers=1)
-        self.apify_client = ApifyClient(config.APIFY_KEY)
+        self.single_flight = SingleFlight()
+        self.httpx_client = httpx_client or httpx.AsyncClient()
+        self.apify_batcher = apify_batcher or ApifyInstagramBatcher(
+            rate_limiter=rate_limiter
+        )
+        self.browser_pool = browser_pool or BrowserPoolService()
+        self._post_semaphore = asyncio.Semaphore(post_concurrency)
 
-    def _fallback_to_apify(self, url):
+    async def _fallback_to_apify(self, url, since=None):
         """
         Fallback method to retrieve Instagram data using Apify's Instagram scraper.
 
         This method interacts with the Apify platform to scrape Instagram data
         in situations where the main scraping method fails. It retrieves the
         number of followers, verification status, and latest post timestamps
-        for a specific Instagram URL.
+        for a specific Instagram URL. The lookup is batched with the ones of
+        concurrent requests into a single actor run.
 
         Args:
             url (str): The Instagram URL to scrape.
+            since (int, optional): Epoch time of the newest post already known;
+                only newer posts are requested.
 
         Returns:
             dict: A dictionary containing:
                 - verified (int): Whether the account is verified 1 or 0.
                 - follower (str): The number of followers in a human-readable format.
                 - posts (list): A list of timestamps of the latest posts.
+                - postsSince (int | None): The `since` the posts were limited
+                  to, the timestamps being exact.
         """
 
-        posts = []
-
-        run = self.apify_client.actor("apify/instagram-scraper").call(
-            run_input={
-                "directUrls": [
-                    url,
-                ],
-                "enhanceUserSearchWithFacebookPage": False,
-                "isUserReelFeedURL": False,
-                "isUserTaggedFeedURL": False,
-                "resultsLimit": 20,
-                "resultsType": "details",
-                "searchLimit": 2,
-            },
-            logger=None,
-        )
-        for item in self.apify_client.dataset(run["defaultDatasetId"]).iterate_items():
-            followers = item["followersCount"]
-            verified = item["verified"]
-            for post in item["latestPosts"]:
-                posts.append(time_to_epoch(post["timestamp"]))
-            break
-
+        item = await self.apify_batcher.fetch(url, since=since)
         return {
-            "verified": int(verified),
-            "follower": convert_number_with_suffix(str(followers)),
-            "posts": posts,
+            "verified": int(item["verified"]),
+            "follower": convert_number_with_suffix(str(item["followersCount"])),
+            "posts": list(
+                parse_many(
+                    (post["timestamp"] for post in item["latestPosts"]),
+                    source="apify",
+                )
+            ),
+            "postsSince": since,
         }
 
-    def _check_url(self, session, href):
+    async def _check_url(self, href):
         """
         Extracts the timestamp of the most recent post from an Instagram URL.
 
-        This method constructs the full URL using the provided href, sends a GET request
-        to retrieve the page content, and parses the HTML to find the post date. The
-        date is then converted to an epoch timestamp.
+        The post page is streamed and only read up to the end of its `<head>`,
+        which holds the og:description meta tag with the post date, so the
+        body is never downloaded. At most `post_concurrency` posts are fetched
+        at the same time.
 
         Args:
-            session (requests.Session): The HTTP session for making requests.
             href (str): The relative URL path of the Instagram post.
 
         Returns:
             int: The epoch timestamp of the most recent post date.
 
         Raises:
-            requests.exceptions.HTTPError: If the HTTP request returns an
+            httpx.HTTPStatusError: If the HTTP request returns an
                 unsuccessful status code.
         """
 
         url = "https://www.instagram.com" + href
-        response = session.get(url)
-        response.raise_for_status()  # Raises exception for bad status codes
+        head = bytearray()
+        async with self._post_semaphore:
+            async with self.httpx_client.stream(
+                "GET",
+                url,
+                headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"},
+            ) as response:
+                response.raise_for_status()  # Raises exception for bad status codes
+                async for chunk in response.aiter_bytes():
+                    # Only search the new bytes, plus room for a split tag
+                    start = max(len(head) - len(HEAD_END) + 1, 0)
+                    head += chunk
+                    end = head.find(HEAD_END, start)
+                    if end >= 0:
+                        del head[end:]
+                        break
 
-        content = response.text
-        tree = html.fromstring(content)
+        tree = html.fromstring(bytes(head) + b"</head></html>")
         content = tree.xpath("//meta[@property='og:description']/@content")[0]
-        matches = re.findall(
-            r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}",  # noqa
-            content,
-        )
-        return time_to_epoch(matches.pop())
-
-    async def scrape(self, url, timeout=2000):
-        """
-        Run sync Playwright in a thread pool to avoid event loop conflicts
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor, lambda: self._sync_scrape(url, timeout)
-        )
+        matches = POST_DATE_PATTERN.findall(content)
+        return time_to_epoch(matches.pop(), source="instagram")
 
-    def _sync_scrape(self, url, timeout=2000):
+    @coalesce("instagram")
+    async def scrape(self, url, timeout=2000, since=None):
         """
-        Synchronously scrapes Instagram page data using Playwright.
+        Scrapes Instagram page data using async Playwright.
 
         This method navigates to a given Instagram URL, waits for the content to load,
         and extracts various data points such as verification status, followers, and
@@ -122,14 +137,20 @@ class InstagramScraperService:
         Args:
             url (str): The Instagram URL to scrape.
             timeout (int, optional): The time to wait for page content to load.
+            since (int, optional): Epoch time of the newest post already known;
+                only newer posts are looked up when the timestamps are exact.
 
         Returns:
             dict: A dictionary containing the scraped data, including:
                 - verified (bool): Whether the account is verified.
                 - follower (int): The number of followers, if available.
                 - posts (list): A list of timestamps of the posts.
+                - postsSince (int | None, optional): Set when the timestamps
+                  are exact, to the `since` the posts were limited to.
                 - error (str, optional): An error message if scraping fails.
                 - message (str, optional): A failure message if scraping fails.
+                - transient (bool, optional): Whether the failure came from the
+                  platform or the network rather than from the profile.
         """
         log = self.logger.getChild("scrape")
         if not url:
@@ -143,135 +164,105 @@ class InstagramScraperService:
             url = url[:-1]
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=self.headless,
-                )  # Set headless=True if you don't want to see the browser
-                context = browser.new_context(
-                    locale="en-US",
-                    extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
-                )
-                page = context.new_page()
+            async with self.browser_pool.context(
+                locale="en-US",
+                extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
+            ) as context:
+                page = await context.new_page()
 
                 # Set a realistic user-agent
-                page.set_extra_http_headers(
+                await page.set_extra_http_headers(
                     {
                         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"  # noqa
                     }
                 )
 
                 # Navigate to the page
-                page.goto(
+                await page.goto(
                     url,
-                    wait_until="networkidle",
+                    wait_until="domcontentloaded",
                     timeout=60000,
                 )
 
                 # Close the "Create New Account" popup
-                close_button = page.query_selector_all('[aria-label="Close"]')
+                close_button = await page.query_selector_all('[aria-label="Close"]')
                 if close_button:
-                    close_button.pop().click()
-                # Wait for page content to load (you can adjust the selector)
-                page.wait_for_timeout(timeout)  # wait 5 seconds
+                    await close_button.pop().click()
+                # Wait until the follower count and the post tiles are rendered,
+                # bounded like the networkidle wait used to be
+                if not await wait_for_ready(
+                    page, READY_SELECTORS, config.SPA_PAGE_READY_TIMEOUT_MS
+                ):
+                    log.warning("Instagram page %s did not become ready", url)
                 # Get the full HTML after JS has rendered
-                html_content = page.content()
-                browser.close()
-
-                tree = html.fromstring(html_content)
-                page_follower = tree.xpath(
-                    "//span/span/span[contains(@class, 'html-span')]"  # noqa
-                )[1]
-                is_verified = (
-                    True
-                    if len(tree.xpath("//title[contains(text(), 'Verified')]")) > 0
-                    else False
-                )
+                html_content = await page.content()
 
-                tiles = tree.xpath(
-                    "//*[contains(@style, 'flex')]//a[contains(@href,'/')]"
-                )
-                hrefs = []
-                for tile in tiles:
-                    hrefs.append(tile.get("href"))
-                    if len(hrefs) == 5:
-                        break
+            tree = html.fromstring(html_content)
+            fields = extract("instagram", tree)
 
-                with requests.Session() as session:
-                    # Set up session headers if needed
-                    session.headers.update(
-                        {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
-                    )
-                    with ThreadPoolExecutor(max_workers=5) as http_executor:
-                        futures = []
-                        for href in hrefs:
-                            future = http_executor.submit(
-                                self._check_url, session, href
-                            )
-                            futures.append(future)
-                        # Collect results
-                        dates = []
-                        for future in futures:
-                            try:
-                                date = future.result()
-                                if date:  # Only add non-None dates
-                                    dates.append(date)
-                            except Exception as e:
-                                log.error("Error processing URL: %s", e)
-                gathered_data = {
-                    "verified": is_verified,
-                    "follower": convert_number_with_suffix(
-                        page_follower.text_content().split(" ")[0]
-                    ),
-                    "posts": dates,
-                }
-                log.info("Gathered data: %s", gathered_data)
+            results = await asyncio.gather(
+                *(self._check_url(href) for href in fields["post_links"]),
+                return_exceptions=True,
+            )
+            # Collect results
+            dates = []
+            for result in results:
+                if isinstance(result, Exception):
+                    log.error("Error processing URL: %s", result)
+                elif result:  # Only add non-None dates
+                    dates.append(result)
+            gathered_data = {
+                "verified": fields["verified"],
+                "follower": fields["follower"],
+                "posts": dates,
+            }
+            log.info("Gathered data: %s", gathered_data)
 
-                return gathered_data
+            return gathered_data
 
         except Exception as e:
             log.error(
                 "Failed to scrape Instagram using playwright: %s. Using fallback.", e
             )
             try:
-                return self._fallback_to_apify(url)
+                return await self._fallback_to_apify(url, since)
             except Exception as e:
                 log.error("Fallback failed: %s", e)
                 return {
                     "error": str(e),
                     "message": "Failed to scrape Instagram",
+                    "transient": is_transient(e),
                 }
 
-    async def scrape_via_apify(self, url, timeout=2000):
-        """
-        Run sync apify in a thread pool to avoid event loop conflicts
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor, lambda: self._sync_scrape_via_apify(url, timeout)
-        )
-
-    def _sync_scrape_via_apify(self, url, timeout=2000):
+    @coalesce("instagram")
+    async def scrape_via_apify(self, url, timeout=2000, since=None):
         """
         Scrapes Instagram data using Apify's Instagram scraper.
 
         Args:
             url (str): The Instagram URL to scrape.
             timeout (int, optional): The time to wait for page content to load.
+            since (int, optional): Epoch time of the newest post already known;
+                only newer posts are looked up when the timestamps are exact.
 
         Returns:
             dict: A dictionary containing the scraped data, including:
                 - verified (bool): Whether the account is verified.
                 - follower (int): The number of followers, if available.
                 - posts (list): A list of timestamps of the posts.
+                - postsSince (int | None, optional): Set when the timestamps
+                  are exact, to the `since` the posts were limited to.
                 - error (str, optional): An error message if scraping fails.
                 - message (str, optional): A failure message if scraping fails.
+                - transient (bool, optional): Whether the failure came from the
+                  platform or the network rather than from the profile.
         """
         if not url:
             return "No URL provided."
 
         log = self.logger.getChild("scrape_via_apify")
         try:
-            gathered_data = self._fallback_to_apify(url)
+            gathered_data = await self._fallback_to_apify(url, since)
             log.info("Gathered data: %s", gathered_data)
 
             return gathered_data
@@ -280,4 +271,5 @@ class InstagramScraperService:
             return {
                 "error": str(e),
                 "message": "Failed to scrape Instagram",
+                "transient": is_transient(e),
             }
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+from src.core.config import config
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    stored_at: float
+    negative: bool
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+
+class ProfileCacheService:
+    """
+    Two-tier cache of the `gathered_data` returned by the scraper services.
+
+    The first tier is an in-process LRU. The optional second tier is a SQLite
+    database shared by every worker on the host, enabled by setting
+    `PROFILE_CACHE_DB_PATH`. Entries are kept for `ttl + stale_ttl` seconds, or
+    `negative_ttl` seconds for failed scrapes; deciding whether an entry is
+    fresh enough is left to the caller. Rows past their retention are deleted
+    from SQLite whenever an entry is written.
+    """
+
+    def __init__(
+        self,
+        max_entries=config.PROFILE_CACHE_SIZE,
+        ttl=config.PROFILE_CACHE_TTL,
+        stale_ttl=config.PROFILE_CACHE_STALE_TTL,
+        negative_ttl=config.PROFILE_CACHE_NEGATIVE_TTL,
+        db_path=config.PROFILE_CACHE_DB_PATH,
+    ):
+        self.logger = logging.getLogger("ProfileCacheService")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.db_path = db_path
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        if self.db_path:
+            self._conn = sqlite3.connect(
+                self.db_path, timeout=5, check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS profile_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, negative INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS profile_cache_stored_at "
+                "ON profile_cache (stored_at)"
+            )
+
+    @staticmethod
+    def is_negative(value) -> bool:
+        """
+        Tells whether a scrape result is a failure that should only be cached
+        briefly.
+        """
+        return not isinstance(value, dict) or "error" in value
+
+    def _retention(self, entry: CacheEntry) -> float:
+        return self.negative_ttl if entry.negative else self.ttl + self.stale_ttl
+
+    def _read_db(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at, negative FROM profile_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(json.loads(row[0]), row[1], bool(row[2]))
+
+    def _write_db(self, key: str, entry: CacheEntry):
+        value = json.dumps(entry.value)
+        positive_cutoff = entry.stored_at - self.ttl - self.stale_ttl
+        negative_cutoff = entry.stored_at - self.negative_ttl
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO profile_cache VALUES (?, ?, ?, ?)",
+                    (key, value, entry.stored_at, int(entry.negative)),
+                )
+                # The first bound lets the stored_at index skip the live rows
+                self._conn.execute(
+                    "DELETE FROM profile_cache WHERE stored_at < ? "
+                    "AND stored_at < CASE negative WHEN 0 THEN ? ELSE ? END",
+                    (
+                        max(positive_cutoff, negative_cutoff),
+                        positive_cutoff,
+                        negative_cutoff,
+                    ),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _remember(self, key: str, entry: CacheEntry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Looks up a profile, first in memory and then in SQLite.
+
+        Args:
+            key (str): The key built by `src.helpers.profile.profile_key`.
+
+        Returns:
+            CacheEntry | None: The entry, or None when missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        elif self.db_path:
+            try:
+                entry = await asyncio.to_thread(self._read_db, key)
+            except sqlite3.Error as e:
+                self.logger.getChild("get").error("Failed to read cache: %s", e)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is None or entry.age > self._retention(entry):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    async def set(self, key: str, value) -> CacheEntry:
+        """
+        Stores a scrape result in both tiers.
+
+        Args:
+            key (str): The key built by `src.helpers.profile.profile_key`.
+            value (dict | str): The gathered data or error returned by a scraper.
+
+        Returns:
+            CacheEntry: The stored entry.
+        """
+        entry = CacheEntry(value, time.time(), self.is_negative(value))
+        self._remember(key, entry)
+        if self.db_path:
+            try:
+                await asyncio.to_thread(self._write_db, key, entry)
+            except sqlite3.Error as e:
+                self.logger.getChild("set").error("Failed to write cache: %s", e)
+        return entry
+
+    def stats(self):
+        """
+        Returns the cache size and hit counters.
+        """
+        return {
+            "entries": len(self._entries),
+            "maxEntries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "persistent": bool(self.db_path),
+        }
+
+    def close(self):
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
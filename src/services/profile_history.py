@@ -0,0 +1,227 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+
+from src.core.config import config
+from src.helpers.profile import profile_key
+
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ProfileHistoryService:
+    """
+    Persistent history of every scraped profile.
+
+    Each profile keeps its post timestamps as one sorted array('q') blob, plus
+    a snapshot of its verified status, followers and likes per scrape, in a
+    SQLite database in WAL mode shared by every worker on the host. Posts are
+    a multiset: distinct posts often share a timestamp, so duplicates are kept.
+
+    Only sources with exact timestamps are scraped incrementally, asking for
+    the posts newer than the last one stored and merging them in. Posts dated
+    relatively or by day cannot be matched to the stored ones, so a scrape of
+    such a source replaces the stored posts. Scores can be recomputed from the
+    history without scraping again. Data older than `retention_days` is dropped.
+    """
+
+    def __init__(
+        self,
+        db_path=config.PROFILE_HISTORY_DB_PATH,
+        retention_days=config.PROFILE_HISTORY_RETENTION_DAYS,
+    ):
+        self.logger = logging.getLogger("ProfileHistoryService")
+        self.retention = retention_days * 24 * 60 * 60
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            db_path, timeout=5, check_same_thread=False, isolation_level=None
+        )
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS profile_posts ("
+            "key TEXT PRIMARY KEY, posts BLOB NOT NULL, last_post INTEGER, "
+            "exact INTEGER NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS profile_snapshots ("
+            "key TEXT NOT NULL, taken_at REAL NOT NULL, verified INTEGER NOT NULL, "
+            "follower INTEGER, likes INTEGER)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS profile_snapshots_key "
+            "ON profile_snapshots (key, taken_at)"
+        )
+
+    def _last_post(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_post FROM profile_posts WHERE key = ? AND exact = 1",
+                (key,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _merge(self, key, data, now, exact, since):
+        cutoff = now - self.retention
+        follower = data.get("follower") or data.get("followers") or 0
+        likes = data.get("likes") or data.get("like")
+        scraped = [ts for ts in map(_as_int, data.get("posts") or []) if ts is not None]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT posts, exact FROM profile_posts WHERE key = ?", (key,)
+                ).fetchone()
+                posts = array("q")
+                if exact and since is not None and row and row[1]:
+                    # The scrape only covers the posts newer than `since`
+                    stored = array("q")
+                    stored.frombytes(row[0])
+                    posts.extend(ts for ts in stored if cutoff <= ts <= since)
+                    scraped = [ts for ts in scraped if ts > since]
+                posts.extend(sorted(ts for ts in scraped if ts >= cutoff))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO profile_posts VALUES (?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        posts.tobytes(),
+                        posts[-1] if posts else None,
+                        1 if exact else 0,
+                        now,
+                    ),
+                )
+                self._conn.execute(
+                    "INSERT INTO profile_snapshots VALUES (?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        now,
+                        1 if data.get("verified") else 0,
+                        _as_int(follower),
+                        _as_int(likes),
+                    ),
+                )
+                self._conn.execute(
+                    "DELETE FROM profile_snapshots WHERE key = ? AND taken_at < ?",
+                    (key, cutoff),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return posts
+
+    def _read(self, keys):
+        profiles = {}
+        with self._lock:
+            for key in keys:
+                snapshot = self._conn.execute(
+                    "SELECT verified, follower, likes FROM profile_snapshots "
+                    "WHERE key = ? ORDER BY taken_at DESC LIMIT 1",
+                    (key,),
+                ).fetchone()
+                if snapshot is None:
+                    continue
+                row = self._conn.execute(
+                    "SELECT posts FROM profile_posts WHERE key = ?", (key,)
+                ).fetchone()
+                posts = array("q")
+                if row:
+                    posts.frombytes(row[0])
+                verified, follower, likes = snapshot
+                profile = {
+                    "verified": bool(verified),
+                    "follower": follower or 0,
+                    "posts": posts,
+                }
+                if likes is not None:
+                    profile["likes"] = likes
+                profiles[key] = profile
+        return profiles
+
+    def _counts(self):
+        with self._lock:
+            profiles, post_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(posts)), 0) FROM profile_posts"
+            ).fetchone()
+            snapshots = self._conn.execute(
+                "SELECT COUNT(*) FROM profile_snapshots"
+            ).fetchone()[0]
+        return profiles, post_bytes // array("q").itemsize, snapshots
+
+    async def since(self, platform, url):
+        """
+        Returns the timestamp of the newest stored post of a profile, when the
+        stored posts have exact timestamps.
+
+        Args:
+            platform (str): The platform name (facebook, instagram, tiktok or x).
+            url (str): The profile URL.
+
+        Returns:
+            int | None: The epoch timestamp, or None when no exact post is
+                stored.
+        """
+        return await asyncio.to_thread(self._last_post, profile_key(platform, url))
+
+    async def record(self, platform, url, data, exact=False, since=None):
+        """
+        Merges the data of a successful scrape into the profile's history.
+
+        Args:
+            platform (str): The platform name (facebook, instagram, tiktok or x).
+            url (str): The profile URL.
+            data (dict): The gathered data returned by the scraper.
+            exact (bool): Whether the post timestamps are exact.
+            since (int, optional): Epoch time the scrape was limited to; only
+                its posts newer than this are merged into the stored ones.
+                Otherwise the stored posts are replaced.
+
+        Returns:
+            dict: The gathered data with `posts` replaced by every stored post
+                timestamp of the profile, newest first.
+        """
+        posts = await asyncio.to_thread(
+            self._merge, profile_key(platform, url), data, time.time(), exact, since
+        )
+        return {**data, "posts": posts.tolist()[::-1]}
+
+    async def load(self, profiles):
+        """
+        Rebuilds the gathered data of profiles from their latest snapshot and
+        stored posts.
+
+        Args:
+            profiles (Iterable[tuple]): The (platform, url) of every profile.
+
+        Returns:
+            dict: The gathered data keyed by (platform, url), for the profiles
+                with a history. Posts are arrays ('q' typecode).
+        """
+        keys = {
+            (platform, url): profile_key(platform, url) for platform, url in profiles
+        }
+        stored = await asyncio.to_thread(self._read, set(keys.values()))
+        return {profile: stored[key] for profile, key in keys.items() if key in stored}
+
+    async def stats(self):
+        """
+        Returns the number of profiles, posts and snapshots stored.
+        """
+        profiles, posts, snapshots = await asyncio.to_thread(self._counts)
+        return {
+            "profiles": profiles,
+            "posts": posts,
+            "snapshots": snapshots,
+            "retentionDays": self.retention // (24 * 60 * 60),
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,4 +1,35 @@
 import time
+from bisect import bisect_left
+
+import numpy as np
+
+MAX_FOLLOWERS = 10_000  # 10k
+MAX_LIKES = 10_000  # 10k
+MAX_POST_SCORE = 7
+# Upper bounds of the post age buckets, the last one being the 30 day horizon
+WEEK_EDGES = (
+    7 * 24 * 60 * 60,  # days x hours x minutes x seconds
+    14 * 24 * 60 * 60,
+    21 * 24 * 60 * 60,
+    30 * 24 * 60 * 60,
+)
+
+
+def _is_scored(info):
+    return type(info) is dict and "error" not in info
+
+
+def _platform_inputs(info):
+    # Values read from a platform's gathered data: verified, followers, likes
+    followers = info.get("follower") or info.get("followers") or 0
+    likes = info.get("likes") or info.get("like") or 0
+    return (1 if info.get("verified") else 0), followers, likes
+
+
+def _uses_follower_score(platform, likes):
+    return (platform == "x" or platform == "instagram") or (
+        likes == 0 and platform == "facebook"
+    )
 
 
 class RateSocialMediaService:
@@ -11,7 +42,7 @@ class RateSocialMediaService:
 
         return (value / max_value) * max_score
 
-    def calculate_post_score(self, post_list, max_score):
+    def calculate_post_score(self, post_list, max_score, now=None):
         """
         Calculate the post score based on the timestamps of the gathered recent posts.
 
@@ -29,37 +60,21 @@ class RateSocialMediaService:
         Args:
             post_list (list): A list of timestamps of the gathered recent posts.
             max_score (float): The maximum score that can be given.
+            now (float, optional): The epoch time post ages are measured from.
 
         Returns:
             float: The calculated post score.
         """  # noqa
-        now = time.time()
-        FIRST_WEEK_SECONDS = 7 * 24 * 60 * 60  # days x hours x minutes x seconds
-        SECOND_WEEK_SECONDS = 14 * 24 * 60 * 60  # days x hours x minutes x seconds
-        THIRD_WEEK_SECONDS = 21 * 24 * 60 * 60  # days x hours x minutes x seconds
-        LAST_WEEK_SECONDS = 30 * 24 * 60 * 60  # days x hours x minutes x seconds
-        sorted_posts = sorted(post_list, reverse=True)
-        post_length = len(sorted_posts)
-
-        if post_length == 0:
+        if now is None:
+            now = time.time()
+        if not post_list:
             return 0
 
-        fourth = sum(
-            1
-            for ts in sorted_posts
-            if now - ts <= LAST_WEEK_SECONDS and now - ts > THIRD_WEEK_SECONDS
-        )
-        third = sum(
-            1
-            for ts in sorted_posts
-            if now - ts <= THIRD_WEEK_SECONDS and now - ts > SECOND_WEEK_SECONDS
-        )
-        second = sum(
-            1
-            for ts in sorted_posts
-            if now - ts <= SECOND_WEEK_SECONDS and now - ts > FIRST_WEEK_SECONDS
-        )
-        first = sum(1 for ts in sorted_posts if now - ts <= FIRST_WEEK_SECONDS)
+        # Posts per week, oldest bucket past the 30 days being ignored
+        weeks = [0, 0, 0, 0, 0]
+        for ts in post_list:
+            weeks[bisect_left(WEEK_EDGES, now - ts)] += 1
+        first, second, third, fourth = weeks[:4]
         total_score = (
             ((first) + (second * 0.75) + (third * 0.5) + (fourth * 0.25)) / 12.5
         ) * max_score
@@ -116,41 +131,35 @@ class RateSocialMediaService:
         # Round to the nearest 2 decimal places
         return round(total_score, 2)
 
-    def rate(self, data):
+    def rate(self, data, now=None):
         """
         Rates a given social media account based on follower count, likes, posts within the last 30 days, and verification status.
 
         Args:
             data (dict): A dictionary containing social media platform names as keys and dictionaries of respective data as values.
+            now (float, optional): The epoch time post ages are measured from.
 
         Returns:
             dict: A dictionary with platform names as keys, scores as values, and an "overallRating" key with the total score.
         """  # noqa
-        MAX_FOLLOWERS = 10_000  # 10k
-        MAX_LIKES = 10_000  # 10k
+        if now is None:
+            now = time.time()
 
         platform_scores = {}
 
         for platform, info in data.items():
-            if type(info) is not dict or "error" in info:
+            if not _is_scored(info):
                 continue
 
-            verified_score = 1 if info.get("verified") else 0
-
-            followers = info.get("follower") or info.get("followers") or 0
+            verified_score, followers, likes = _platform_inputs(info)
             follower_score = self.calculate_score(followers, MAX_FOLLOWERS, 2)
-
-            likes = info.get("likes") or info.get("like") or 0
             like_score = self.calculate_score(likes, MAX_LIKES, 2)
 
             posts = info.get("posts") or []
             # Calculate post score based on recent posts within the last 30 days
-            post_score = 0
-            post_score = self.calculate_post_score(posts, 7)
+            post_score = self.calculate_post_score(posts, MAX_POST_SCORE, now)
 
-            if (platform == "x" or platform == "instagram") or (
-                likes == 0 and platform == "facebook"
-            ):
+            if _uses_follower_score(platform, likes):
                 like_score = follower_score
 
             total_score = (
@@ -158,10 +167,107 @@ class RateSocialMediaService:
             )
             platform_scores[platform] = total_score
 
+        return self._with_overall(data, platform_scores)
+
+    def rate_many(self, accounts, now=None):
+        """
+        Rates many social media accounts at once, with the same results as `rate`.
+
+        The scored platforms of all accounts are packed into columns, and their
+        post timestamps into one flat array delimited by per-platform counts. Post ages
+        are bucketed into weeks with a single `searchsorted` and counted with a
+        `bincount`, and the follower, like and verified scores are computed
+        column-wise.
+
+        Args:
+            accounts (Iterable[dict]): The gathered data of every account, each
+                as accepted by `rate`.
+            now (float, optional): The epoch time post ages are measured from.
+
+        Returns:
+            list: The result of `rate` for every account, in the same order.
+        """
+        if now is None:
+            now = time.time()
+        accounts = list(accounts)
+
+        rows = []  # (account index, platform)
+        verified, followers, likes, follower_like = [], [], [], []
+        post_counts = []
+        timestamps = []
+        for index, data in enumerate(accounts):
+            for platform, info in data.items():
+                if not _is_scored(info):
+                    continue
+                row_verified, row_followers, row_likes = _platform_inputs(info)
+                posts = info.get("posts") or []
+                rows.append((index, platform))
+                verified.append(row_verified)
+                followers.append(row_followers)
+                likes.append(row_likes)
+                follower_like.append(_uses_follower_score(platform, row_likes))
+                post_counts.append(len(posts))
+                timestamps.extend(posts)
+
+        scores = self._score_columns(
+            np.array(verified, dtype=np.int64),
+            np.array(followers, dtype=np.float64),
+            np.array(likes, dtype=np.float64),
+            np.array(follower_like, dtype=bool),
+            np.array(post_counts, dtype=np.int64),
+            np.array(timestamps, dtype=np.float64),
+            now,
+        )
+
+        platform_scores = [{} for _ in accounts]
+        for (index, platform), score in zip(rows, scores):
+            platform_scores[index][platform] = score
+        return [
+            self._with_overall(data, scored)
+            for data, scored in zip(accounts, platform_scores)
+        ]
+
+    def _score_columns(
+        self, verified, followers, likes, follower_like, post_counts, timestamps, now
+    ):
+        # Follower and like scores, as calculate_score on every row
+        follower_scores = np.where(
+            followers > MAX_FOLLOWERS, 2, (followers / MAX_FOLLOWERS) * 2
+        )
+        like_scores = np.where(likes > MAX_LIKES, 2, (likes / MAX_LIKES) * 2)
+        like_scores = np.where(follower_like, follower_scores, like_scores)
+
+        # Posts per week of every row, as calculate_post_score
+        row_count = len(post_counts)
+        post_rows = np.repeat(np.arange(row_count), post_counts)
+        weeks = np.searchsorted(WEEK_EDGES, now - timestamps, side="left")
+        counts = np.bincount(post_rows * 5 + weeks, minlength=row_count * 5).reshape(
+            row_count, 5
+        )
+        post_scores = (
+            (
+                counts[:, 0]
+                + (counts[:, 1] * 0.75)
+                + (counts[:, 2] * 0.5)
+                + (counts[:, 3] * 0.25)
+            )
+            / 12.5
+        ) * MAX_POST_SCORE
+        post_scores = np.minimum(post_scores, MAX_POST_SCORE)
+        # Python's round, since numpy rounds halves differently
+        post_scores = [
+            round(score, 2) if count else 0
+            for score, count in zip(post_scores.tolist(), post_counts.tolist())
+        ]
+
+        totals = verified + ((follower_scores + like_scores) / 2) + post_scores
+        return totals.tolist()
+
+    def _with_overall(self, data, platform_scores):
         overall = self.calculate_overall_score(platform_scores)
 
         for platform, info in data.items():
-            if type(info) is not dict or "error" in info:
+            if not _is_scored(info):
                 platform_scores[platform] = info
 
         return {
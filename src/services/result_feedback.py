@@ -1,13 +1,52 @@
+import hashlib
+import json
 import logging
+from collections import OrderedDict
 
 import google.generativeai as genai
 
 from src.core.config import config
 
 
+def _normalize(value):
+    """
+    Puts raw data in a canonical shape: post timestamps are sorted so that the
+    order a scraper returned them in does not change the cache key.
+    """
+    if isinstance(value, dict):
+        return {
+            key: (
+                sorted(item, reverse=True)
+                if key == "posts" and isinstance(item, list)
+                else _normalize(item)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def feedback_cache_key(raw_data, scores, text_model, preprompt):
+    """
+    Returns the sha256 of the canonical JSON of everything the feedback depends on.
+    """
+    payload = json.dumps(
+        [_normalize(scores), _normalize(raw_data), text_model, preprompt],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 class ResultFeedbackService:
-    def __init__(self):
+    def __init__(self, cache_size=config.FEEDBACK_CACHE_SIZE):
         self.logger = logging.getLogger("ResultFeedbackService")
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
         self.SYSTEM_INSTRUCTION_TEXT = ""
         """Loads the preprompt from a text file."""
         try:
@@ -31,7 +70,11 @@ class ResultFeedbackService:
         text_model: str = config.TEXT_PROMPT_MODEL_NAME,
         **kwargs,
     ) -> str:
-        """Generates an feedback based on structured data using Gemini SDK.
+        """Returns the feedback for the data, calling Gemini only on a cache miss.
+
+        Feedback is cached under a hash of the scores, the raw data, the model
+        name and the preprompt, and the least recently used entry is evicted
+        once `cache_size` is reached. Failures are not cached.
 
         Args:
             raw_data (dict): The raw data to generate feedback about.
@@ -42,7 +85,51 @@ class ResultFeedbackService:
         Returns:
             str: The constructed feedback.
         """
-        log = self.logger.getChild("generate_feedback")
+        key = feedback_cache_key(
+            raw_data, scores, text_model, self.SYSTEM_INSTRUCTION_TEXT
+        )
+        feedback = self._cache.get(key)
+        if feedback is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return feedback
+
+        self.misses += 1
+        feedback = await self._generate_feedback(raw_data, scores, text_model)
+        if self.cache_size > 0:
+            self._cache[key] = feedback
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return feedback
+
+    def stats(self):
+        """
+        Returns the feedback cache size and hit counters.
+        """
+        return {
+            "entries": len(self._cache),
+            "maxEntries": self.cache_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    async def _generate_feedback(
+        self,
+        raw_data: dict,
+        scores: dict,
+        text_model: str,
+    ) -> str:
+        """Generates an feedback based on structured data using Gemini SDK.
+
+        Args:
+            raw_data (dict): The raw data to generate feedback about.
+            scores (dict): The scores to generate feedback about.
+            text_model (str): The model name to use for text generation.
+
+        Returns:
+            str: The constructed feedback.
+        """
+        log = self.logger.getChild("_generate_feedback")
         genai.configure(api_key=config.GOOGLE_API_KEY)
         user_prompt = "Here is the resulting data that you will be analyzing:"
         user_prompt = user_prompt + f"\n---\n{raw_data}{scores}\n---\n"
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import time
+import uuid
+
+from src.core.config import config
+from src.services.scrape_orchestrator import PLATFORMS
+
+
+class ScrapeJob:
+    """
+    State of one queued scrape, as reported by `GET /v1/scrape/jobs/{id}`.
+    """
+
+    def __init__(self, data):
+        self.id = uuid.uuid4().hex
+        self.data = data
+        self.status = "queued"
+        self.created_at = time.time()
+        self.finished_at = None
+        self.platforms = {
+            platform: "pending" if getattr(data, platform) else "skipped"
+            for platform in PLATFORMS
+        }
+        self.result = None
+        self.error = None
+
+    def on_platform_result(self, platform, result):
+        if self.platforms[platform] == "skipped":
+            return
+        failed = not isinstance(result, dict) or "error" in result
+        self.platforms[platform] = "failed" if failed else "done"
+
+    def to_dict(self):
+        return {
+            "jobId": self.id,
+            "status": self.status,
+            "createdAt": self.created_at,
+            "finishedAt": self.finished_at,
+            "platforms": self.platforms,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class ScrapeJobService:
+    """
+    Runs scrape jobs on a fixed number of workers fed by a bounded queue.
+
+    `submit` never waits: when the queue is full it raises `asyncio.QueueFull`
+    so the API can push back on the client. Finished jobs are kept for
+    `retention` seconds so that clients can collect their results.
+    """
+
+    def __init__(
+        self,
+        orchestrator,
+        rate_social_media,
+        result_feedback,
+        workers=config.SCRAPE_JOB_WORKERS,
+        queue_size=config.SCRAPE_JOB_QUEUE_SIZE,
+        retention=config.SCRAPE_JOB_RETENTION,
+    ):
+        self.logger = logging.getLogger("ScrapeJobService")
+        self.orchestrator = orchestrator
+        self.rate_social_media = rate_social_media
+        self.result_feedback = result_feedback
+        self.workers = workers
+        self.retention = retention
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.jobs = {}
+        self._tasks = []
+
+    async def start(self):
+        """
+        Starts the workers.
+        """
+        self._tasks = [
+            asyncio.create_task(self._work(index)) for index in range(self.workers)
+        ]
+
+    async def close(self):
+        """
+        Stops the workers, abandoning the jobs still queued.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, data):
+        """
+        Queues a ScrapeRequest.
+
+        Args:
+            data (ScrapeRequest): The profile URLs to scrape.
+
+        Returns:
+            ScrapeJob: The queued job.
+
+        Raises:
+            asyncio.QueueFull: When the queue is at capacity.
+        """
+        self._prune()
+        job = ScrapeJob(data)
+        self.queue.put_nowait(job)
+        self.jobs[job.id] = job
+        return job
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def _prune(self):
+        cutoff = time.time() - self.retention
+        for job_id in [
+            job_id
+            for job_id, job in self.jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]:
+            del self.jobs[job_id]
+
+    async def _run(self, job):
+        gathered_data = await self.orchestrator.gather(
+            job.data, on_result=job.on_platform_result
+        )
+        scores = self.rate_social_media.rate(gathered_data)
+        feedback = await self.result_feedback.generate_feedback(gathered_data, scores)
+        return {**scores, "feedback": feedback}
+
+    async def _work(self, index):
+        log = self.logger.getChild("_work")
+        while True:
+            job = await self.queue.get()
+            job.status = "running"
+            try:
+                job.result = await self._run(job)
+                job.status = "completed"
+            except asyncio.CancelledError:
+                job.status = "cancelled"
+                raise
+            except Exception as e:
+                log.error("Worker %s failed job %s: %s", index, job.id, e)
+                job.error = str(e)
+                job.status = "failed"
+            finally:
+                job.finished_at = time.time()
+                self.queue.task_done()
@@ -0,0 +1,285 @@
+import asyncio
+import logging
+
+from src.core.config import config
+from src.helpers.profile import profile_key
+from src.utils.circuit_breaker import CLOSED
+
+PLATFORMS = ("facebook", "instagram", "tiktok", "x")
+# Platforms whose scrapers take the `since` of a profile history
+INCREMENTAL_PLATFORMS = ("instagram", "tiktok")
+
+
+class ScrapeOrchestratorService:
+    def __init__(
+        self,
+        facebook,
+        instagram,
+        tiktok,
+        x,
+        deadlines=None,
+        page_timeout=2000,
+        cache=None,
+        breakers=None,
+        history=None,
+    ):
+        self.logger = logging.getLogger("ScrapeOrchestratorService")
+        self.cache = cache
+        self.breakers = breakers
+        self.history = history
+        self._refreshes = {}
+        self.page_timeout = page_timeout
+        self.deadlines = deadlines or {
+            "facebook": config.FACEBOOK_SCRAPE_DEADLINE,
+            "instagram": config.INSTAGRAM_SCRAPE_DEADLINE,
+            "tiktok": config.TIKTOK_SCRAPE_DEADLINE,
+            "x": config.X_SCRAPE_DEADLINE,
+        }
+        # Strategy used for each platform
+        self.scrapers = {
+            "facebook": facebook.scrape,
+            "instagram": instagram.scrape_via_apify,
+            "tiktok": tiktok.scrape_via_httpx,
+            "x": x.scrape,
+        }
+        # Circuit breakers are kept per platform and strategy
+        self.strategies = {
+            "facebook": "playwright",
+            "instagram": "apify",
+            "tiktok": "httpx",
+            "x": "playwright",
+        }
+
+    async def scrape_platform(self, platform, url, max_age=None):
+        """
+        Returns a platform's data from the profile cache, scraping when needed.
+
+        Cached data younger than `max_age` (or the cache TTL when no max age is
+        given) is returned as is. Past the TTL but within the stale window, the
+        stale data is returned and refreshed in the background. When a scrape
+        fails, older data for the profile is served instead of the error.
+
+        Args:
+            platform (str): The platform name (facebook, instagram, tiktok or x).
+            url (str): The profile URL to scrape.
+            max_age (float, optional): Maximum age in seconds of cached data.
+
+        Returns:
+            dict | str: The gathered data, or an error dictionary.
+        """
+        if self.cache is None or not url:
+            return await self._scrape(platform, url)
+
+        key = profile_key(platform, url)
+        entry = await self.cache.get(key)
+        if entry is not None:
+            fresh_for = self.cache.negative_ttl if entry.negative else self.cache.ttl
+            if max_age is not None:
+                fresh_for = min(fresh_for, max_age) if entry.negative else max_age
+            if entry.age <= fresh_for:
+                return entry.value
+            if max_age is None and not entry.negative:
+                self._refresh_in_background(platform, url, key)
+                return entry.value
+
+        result = await self._scrape(platform, url)
+        if self.cache.is_negative(result) and entry is not None and not entry.negative:
+            self.logger.getChild("scrape_platform").warning(
+                "Serving stale %s data after a failed scrape", platform
+            )
+            return entry.value
+        if not (isinstance(result, dict) and result.get("circuitOpen")):
+            await self.cache.set(key, result)
+        return result
+
+    def _refresh_in_background(self, platform, url, key):
+        if key in self._refreshes:
+            return
+
+        async def refresh():
+            try:
+                result = await self._scrape(platform, url)
+                if not self.cache.is_negative(result):
+                    await self.cache.set(key, result)
+            finally:
+                self._refreshes.pop(key, None)
+
+        self._refreshes[key] = asyncio.create_task(refresh())
+
+    async def close(self):
+        """
+        Cancels the background refreshes that are still running.
+        """
+        tasks = list(self._refreshes.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _scrape(self, platform, url):
+        """
+        Scrapes a platform through its circuit breaker.
+
+        While the breaker of the platform's strategy is open, the scrape is not
+        attempted and an unavailable error is returned at once, which lets
+        `scrape_platform` fall back to cached data. Only timeouts and transient
+        errors count as failures; an error about the profile itself, such as a
+        profile that does not exist, leaves the breaker as it was.
+        """
+        if self.breakers is None or not url:
+            return await self._scrape_with_deadline(platform, url)
+
+        strategy = self.strategies[platform]
+        breaker = self.breakers.get(platform, strategy)
+        if not breaker.allow():
+            return {
+                "error": "Circuit open",
+                "message": f"Scraping {platform} via {strategy} is temporarily "
+                "unavailable",
+                "circuitOpen": True,
+            }
+
+        try:
+            result = await self._scrape_with_deadline(platform, url)
+        except BaseException:
+            breaker.abandon()
+            raise
+        if not (isinstance(result, dict) and "error" in result):
+            breaker.record_success()
+        elif result.get("timedOut") or result.get("transient"):
+            breaker.record_failure()
+            if breaker.state != CLOSED:
+                self.logger.getChild("_scrape").warning(
+                    "Circuit for %s via %s is %s", platform, strategy, breaker.state
+                )
+        else:
+            breaker.abandon()
+        return result
+
+    async def _scrape_with_deadline(self, platform, url):
+        """
+        Scrapes a single platform, bounded by that platform's deadline.
+
+        A platform that misses its deadline or raises is reported as an error
+        dictionary so that `RateSocialMediaService.rate` skips it while still
+        scoring the platforms that finished. With a profile history, the result
+        is merged into the history. Scrapers of the incremental platforms are
+        only asked for the posts newer than the last stored one, which they
+        honour when their source has exact timestamps.
+
+        Args:
+            platform (str): The platform name (facebook, instagram, tiktok or x).
+            url (str): The profile URL to scrape.
+
+        Returns:
+            dict | str: The gathered data, or an error dictionary.
+        """
+        log = self.logger.getChild("_scrape_with_deadline")
+        deadline = self.deadlines[platform]
+        try:
+            since = None
+            if platform in INCREMENTAL_PLATFORMS:
+                since = await self._history_since(platform, url)
+            kwargs = {} if since is None else {"since": since}
+            result = await asyncio.wait_for(
+                self.scrapers[platform](url=url, timeout=self.page_timeout, **kwargs),
+                timeout=deadline,
+            )
+            return await self._record_history(platform, url, result)
+        except asyncio.TimeoutError:
+            log.warning("Scraping %s timed out after %ss", platform, deadline)
+            return {
+                "error": f"Timed out after {deadline}s",
+                "message": f"Scraping {platform} timed out",
+                "timedOut": True,
+            }
+        except Exception as e:
+            log.error("Failed to scrape %s: %s", platform, e)
+            return {
+                "error": str(e),
+                "message": f"Failed to scrape {platform}",
+                "transient": True,
+            }
+
+    async def _history_since(self, platform, url):
+        if self.history is None or not url:
+            return None
+        try:
+            return await self.history.since(platform, url)
+        except Exception as e:
+            self.logger.getChild("_history_since").error(
+                "Failed to read %s history: %s", platform, e
+            )
+            return None
+
+    async def _record_history(self, platform, url, result):
+        if not isinstance(result, dict) or "error" in result:
+            return result
+        # Results can be shared by concurrent callers, so they are not mutated
+        data = {key: value for key, value in result.items() if key != "postsSince"}
+        if self.history is None:
+            return data
+        try:
+            return await self.history.record(
+                platform,
+                url,
+                data,
+                exact="postsSince" in result,
+                since=result.get("postsSince"),
+            )
+        except Exception as e:
+            self.logger.getChild("_record_history").error(
+                "Failed to record %s history: %s", platform, e
+            )
+            return data
+
+    async def gather(self, data, on_result=None):
+        """
+        Scrapes every platform of a ScrapeRequest concurrently.
+
+        Args:
+            data (ScrapeRequest): The profile URLs to scrape.
+            on_result (callable, optional): Called with `(platform, result)` as
+                soon as each platform finishes, e.g. to report job progress.
+
+        Returns:
+            dict: Platform names as keys and the gathered data as values.
+        """
+
+        async def scrape(platform):
+            result = await self.scrape_platform(
+                platform, getattr(data, platform), max_age=data.max_age
+            )
+            if on_result is not None:
+                on_result(platform, result)
+            return result
+
+        results = await asyncio.gather(*(scrape(platform) for platform in PLATFORMS))
+        return dict(zip(PLATFORMS, results))
+
+    async def stream(self, data):
+        """
+        Scrapes every platform of a ScrapeRequest concurrently, yielding each
+        platform as soon as it finishes.
+
+        Closing the generator early cancels the platforms still running.
+
+        Args:
+            data (ScrapeRequest): The profile URLs to scrape.
+
+        Yields:
+            tuple: The platform name and its gathered data, in completion order.
+        """
+
+        async def scrape(platform):
+            result = await self.scrape_platform(
+                platform, getattr(data, platform), max_age=data.max_age
+            )
+            return platform, result
+
+        tasks = [asyncio.ensure_future(scrape(platform)) for platform in PLATFORMS]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,147 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from src.core.config import config
+
+
+class SearchCacheService:
+    """
+    Persistent cache of Google Custom Search responses plus a daily quota ledger.
+
+    Responses are keyed by (dork query, start, sort) and stored in SQLite so
+    every worker on the host shares them. The ledger counts the queries sent to
+    Google per UTC day; once the remaining budget reaches `quota_reserve`,
+    `try_consume` refuses and callers are expected to fall back to cached data.
+    """
+
+    def __init__(
+        self,
+        db_path=config.CSE_CACHE_DB_PATH,
+        ttl=config.CSE_CACHE_TTL,
+        daily_quota=config.CSE_DAILY_QUOTA,
+        quota_reserve=config.CSE_QUOTA_RESERVE,
+    ):
+        self.logger = logging.getLogger("SearchCacheService")
+        self.ttl = ttl
+        self.daily_quota = daily_quota
+        self.quota_reserve = quota_reserve
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            db_path, timeout=5, check_same_thread=False, isolation_level=None
+        )
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cse_responses ("
+            "query TEXT NOT NULL, start INTEGER NOT NULL, sort TEXT NOT NULL, "
+            "body TEXT NOT NULL, stored_at REAL NOT NULL, "
+            "PRIMARY KEY (query, start, sort))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cse_quota ("
+            "day TEXT PRIMARY KEY, used INTEGER NOT NULL)"
+        )
+
+    @staticmethod
+    def _today():
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    def _read(self, query, start, sort, max_age):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at FROM cse_responses "
+                "WHERE query = ? AND start = ? AND sort = ?",
+                (query, start, sort),
+            ).fetchone()
+        if row is None or time.time() - row[1] > max_age:
+            return None
+        return json.loads(row[0])
+
+    def _write(self, query, start, sort, body):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cse_responses VALUES (?, ?, ?, ?, ?)",
+                (query, start, sort, json.dumps(body), time.time()),
+            )
+
+    def _consume(self):
+        day = self._today()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT used FROM cse_quota WHERE day = ?", (day,)
+                ).fetchone()
+                used = row[0] if row else 0
+                allowed = self.daily_quota - used > self.quota_reserve
+                if allowed:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO cse_quota VALUES (?, ?)",
+                        (day, used + 1),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return allowed
+
+    def _used(self, day):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT used FROM cse_quota WHERE day = ?", (day,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    async def get(self, query, start, sort, max_age=None):
+        """
+        Returns a cached CSE response.
+
+        Args:
+            query (str): The dork query.
+            start (int): The index of the first result.
+            sort (str): The sort expression sent to CSE.
+            max_age (float, optional): Maximum age in seconds, defaults to the TTL.
+
+        Returns:
+            dict | None: The response body, or None when missing or too old.
+        """
+        max_age = self.ttl if max_age is None else max_age
+        return await asyncio.to_thread(self._read, query, start, sort, max_age)
+
+    async def put(self, query, start, sort, body):
+        """
+        Stores a CSE response body.
+        """
+        await asyncio.to_thread(self._write, query, start, sort, body)
+
+    async def try_consume(self):
+        """
+        Records one CSE query against today's budget.
+
+        Returns:
+            bool: False when the remaining budget is at or below the reserve.
+        """
+        return await asyncio.to_thread(self._consume)
+
+    async def quota(self):
+        """
+        Returns today's usage and the remaining budget.
+        """
+        day = self._today()
+        used = await asyncio.to_thread(self._used, day)
+        return {
+            "day": day,
+            "used": used,
+            "dailyQuota": self.daily_quota,
+            "reserve": self.quota_reserve,
+            "remaining": max(self.daily_quota - used, 0),
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
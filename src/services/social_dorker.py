@@ -1,8 +1,16 @@
+import asyncio
+import logging
+import re
+import time
 from urllib.parse import urlencode, urlparse
 
 import httpx
 
 from src.core.config import config
+from src.utils.time_to_epoch import time_to_epoch
+
+RESULTS_PER_PAGE = 10
+SEARCH_SORT = "date"
 
 
 class SocialDorkerService:
@@ -13,15 +21,22 @@ class SocialDorkerService:
         search_api_endpoint=config.GOOGLE_SEARCH_API_ENDPOINT,
         httpx_client=None,
         timeout=config.HTTPX_TIMEOUT,
+        concurrent_pages=config.CSE_CONCURRENT_PAGES,
+        search_cache=None,
+        breakers=None,
     ):
+        self.logger = logging.getLogger("SocialDorkerService")
         self.api_key = api_key
         self.search_engine_id = search_engine_id
         self.search_api_endpoint = search_api_endpoint
         self.timeout = timeout
-        self.httpx_client = httpx_client or httpx.Client(timeout=self.timeout)
+        self.concurrent_pages = concurrent_pages
+        self.search_cache = search_cache
+        self.breakers = breakers
+        self.httpx_client = httpx_client or httpx.AsyncClient(timeout=self.timeout)
 
-    def close(self):
-        self.httpx_client.close()
+    async def close(self):
+        await self.httpx_client.aclose()
 
     def get_tiktok_dork(self, username):
         return f"site:www.tiktok.com inurl:@{username}/video/"
@@ -51,14 +66,124 @@ class SocialDorkerService:
 
         return None
 
-    def get_video_dates(self, profile_url, dork_fn=None, page=2):
+    def _is_past_horizon(self, create_time, cutoff):
+        """
+        Tells whether a post creation time is older than the cutoff timestamp.
+
+        Dates that cannot be parsed are never considered past the horizon.
+        """
+        try:
+            create_time = re.sub(r"\s+", " ", create_time).strip()
+            return time_to_epoch(create_time, source="google") < cutoff
+        except ValueError:
+            return False
+
+    async def _fetch_page(self, dork_query, start):
+        """
+        Returns one page of results, from the search cache when possible.
+
+        When the daily quota is nearly used up or the search circuit breaker is
+        open, an expired cached response is served instead, or an empty page
+        which ends the pagination.
+        """
+        if self.search_cache is not None:
+            cached = await self.search_cache.get(dork_query, start, SEARCH_SORT)
+            if cached is not None:
+                return cached
+
+        breaker = self.breakers.get("google", "cse") if self.breakers else None
+        if breaker is not None and not breaker.allow():
+            return await self._fallback_page(dork_query, start, "circuit is open")
+        if self.search_cache is not None and not await self.search_cache.try_consume():
+            if breaker is not None:
+                breaker.abandon()
+            return await self._fallback_page(dork_query, start, "quota is low")
+
+        try:
+            data = await self._request_page(dork_query, start)
+        except httpx.HTTPError:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.abandon()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        if self.search_cache is not None:
+            await self.search_cache.put(dork_query, start, SEARCH_SORT, data)
+        return data
+
+    async def _fallback_page(self, dork_query, start, reason):
+        self.logger.getChild("_fallback_page").warning(
+            "Search %s, serving cached results for %s", reason, dork_query
+        )
+        stale = None
+        if self.search_cache is not None:
+            stale = await self.search_cache.get(
+                dork_query, start, SEARCH_SORT, max_age=float("inf")
+            )
+        return stale or {"items": []}
+
+    async def _request_page(self, dork_query, start):
+        params = {
+            "key": self.api_key,
+            "cx": self.search_engine_id,
+            "num": RESULTS_PER_PAGE,
+            "q": dork_query,
+            "start": start,
+            "sort": SEARCH_SORT,
+        }
+        url = f"{self.search_api_endpoint}?{urlencode(params)}"
+        response = await self.httpx_client.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _extract_page_dates(self, data, dork_query, username):
+        video_list = []
+        social_media = None
+        for item in data.get("items", []):
+            link = item["link"]
+            # Adjust the link check for the social media being scraped
+            if dork_query.startswith("site:www.tiktok.com"):
+                url_check = f"https://www.tiktok.com/@{username}/video/"
+                social_media = "tiktok"
+            elif dork_query.startswith("site:https://x.com"):
+                url_check = f"https://x.com/{username}/status/"
+                social_media = "x"
+            elif dork_query.startswith("site:www.facebook.com"):
+                url_check = f"https://www.facebook.com/{username}/posts/"
+                social_media = "facebook"
+            else:
+                url_check = None
+            if url_check and link.lower().startswith(url_check.lower()):
+                create_time = self.extract_create_time(social_media, item)
+                if create_time is not None:
+                    video_list.append(create_time)
+        return video_list
+
+    async def get_video_dates(
+        self,
+        profile_url,
+        dork_fn=None,
+        page=config.CSE_MAX_PAGES,
+        horizon_days=config.RATING_HORIZON_DAYS,
+    ):
         """
         Scrapes video creation dates for a profile using Google Custom Search.
 
+        Because results are sorted by date, pagination stops as soon as a page
+        runs out of results or reaches posts older than the rating horizon. The
+        first page is requested on its own, since most profiles end there, and
+        only then are the later pages requested `concurrent_pages` at a time,
+        the requests for the later pages of a batch being cancelled on a stop.
+
         Args:
             profile_url (str): The profile URL (e.g., TikTok or X).
             dork_fn (callable): Function to generate a Google dork query (username -> query string).
-            page (int): Number of pages (10 results per page).
+            page (int): Maximum number of pages (10 results per page).
+            horizon_days (int): Posts older than this many days are not needed.
 
         Returns:
             list: Video creation dates (Unix timestamp or string, depending on extractor).
@@ -73,41 +198,30 @@ class SocialDorkerService:
 
         # Choose dork query generator
         dork_query = dork_fn(username) if dork_fn else self.get_tiktok_dork(username)
+        cutoff = time.time() - horizon_days * 24 * 60 * 60
         video_list = []
-        start = 1
-
-        for _ in range(page):
-            params = {
-                "key": self.api_key,
-                "cx": self.search_engine_id,
-                "num": 10,
-                "q": dork_query,
-                "start": start,
-                "sort": "date",
-            }
-            url = f"{self.search_api_endpoint}?{urlencode(params)}"
-            response = self.httpx_client.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
-            social_media = None
-            for item in data.get("items", []):
-                link = item["link"]
-                # Adjust the link check for the social media being scraped
-                if dork_query.startswith("site:www.tiktok.com"):
-                    url_check = f"https://www.tiktok.com/@{username}/video/"
-                    social_media = "tiktok"
-                elif dork_query.startswith("site:https://x.com"):
-                    url_check = f"https://x.com/{username}/status/"
-                    social_media = "x"
-                elif dork_query.startswith("site:www.facebook.com"):
-                    url_check = f"https://www.facebook.com/{username}/posts/"
-                    social_media = "facebook"
-                else:
-                    url_check = None
-                if url_check and link.lower().startswith(url_check.lower()):
-                    create_time = self.extract_create_time(social_media, item)
-                    if create_time is not None:
-                        video_list.append(create_time)
-            start += 10
+        starts = [1 + RESULTS_PER_PAGE * index for index in range(page)]
+        # Speculative pages are charged to the quota, so none go with the first
+        batch_size = 1
+
+        while starts:
+            batch, starts = starts[:batch_size], starts[batch_size:]
+            batch_size = self.concurrent_pages
+            tasks = [
+                asyncio.ensure_future(self._fetch_page(dork_query, start))
+                for start in batch
+            ]
+            try:
+                for task in tasks:
+                    data = await task
+                    page_dates = self._extract_page_dates(data, dork_query, username)
+                    video_list.extend(page_dates)
+                    if len(data.get("items", [])) < RESULTS_PER_PAGE or (
+                        page_dates and self._is_past_horizon(page_dates[-1], cutoff)
+                    ):
+                        return video_list
+            finally:
+                for task in tasks:
+                    task.cancel()
 
         return video_list
@@ -1,29 +1,56 @@
-import asyncio
 import logging
 import re
-from concurrent.futures import ThreadPoolExecutor
+import time
+from array import array
 from urllib.parse import parse_qs, urlparse
 
 import httpx
 from lxml import html
-from playwright.sync_api import sync_playwright
 
 from src.core.config import config
+from src.services.browser_pool import BrowserPoolService
 from src.services.social_dorker import SocialDorkerService
+from src.utils.circuit_breaker import is_transient
 from src.utils.convert_number_with_suffix import convert_number_with_suffix
-from src.utils.time_to_epoch import time_to_epoch
+from src.utils.extraction import extract
+from src.utils.page_ready import wait_for_ready
+from src.utils.single_flight import SingleFlight, coalesce
+from src.utils.tiktok_hydration import HydrationParser, summarize_user_info
+from src.utils.time_to_epoch import parse_many
+
+ITEM_LIST_ENDPOINT = "https://www.tiktok.com/api/post/item_list/"
+# Query parameters of the web app session, shared by every item_list call
+ITEM_LIST_SESSION_PARAMS = {
+    "WebIdLastTime": "1748327509",
+    "aid": "1988",
+    "app_language": "en",
+    "app_name": "tiktok_web",
+    "cookie_enabled": "true",
+    "count": "35",
+    "data_collection_enabled": "true",
+    "device_id": "7509009447768409608",
+    "odinId": "7534585605200921607",
+}
+
+# Nodes read from the rendered page, waited for instead of a fixed sleep
+READY_SELECTORS = (
+    "xpath=//h1[@data-e2e='user-title']",
+    "xpath=//div/strong[contains(@title, 'Followers')]",
+)
 
 
 class TiktokScraperService:
-    def __init__(self, headless=True):
+    def __init__(self, browser_pool=None, social_dorker=None, httpx_client=None):
         self.logger = logging.getLogger("TiktokScraperService")
-        self.headless = headless
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.single_flight = SingleFlight()
+        self.browser_pool = browser_pool or BrowserPoolService()
         self.posts = []
-        self.httpx_client = httpx.Client()
+        self.httpx_client = httpx_client or httpx.AsyncClient()
         if not config.GOOGLE_API_KEY or not config.GOOGLE_SEARCH_ENGINE_ID:
             raise Exception("Environment variable not found.")
-        self.social_dorker = SocialDorkerService(httpx_client=self.httpx_client)
+        self.social_dorker = social_dorker or SocialDorkerService(
+            httpx_client=self.httpx_client
+        )
 
     async def extract_create_time(self, url):
         """
@@ -49,13 +76,13 @@ class TiktokScraperService:
             return int(match.group(1))
         return None
 
-    def scrape_using_request(self, url):
+    async def scrape_using_request(self, url):
         """
         Scrape TikTok page data using httpx.
 
-        This method sends a GET request to the provided TikTok URL, extracts the
-        HTML content, and parses it to extract the secUid, verification status, and
-        follower count.
+        The page is streamed and only read up to the end of the user object of
+        its rehydration JSON, after which the connection is closed. Pages
+        without rehydration data are read in full and searched with regexes.
 
         Args:
             url (str): The TikTok URL to scrape.
@@ -66,34 +93,44 @@ class TiktokScraperService:
                 - verified (bool): Whether the account is verified.
                 - followerCount (int): The number of followers, if available.
         """
-        with httpx.Client() as client:
-            response = client.get(url)
-            data = response.text
-            # Extract secUid
-            secuid_match = re.search(r'"secUid"\s*:\s*"([^"]+)"', data)
-            secuid = secuid_match.group(1) if secuid_match else None
-
-            # Extract verified (bool)
-            verified_match = re.search(r'"verified"\s*:\s*(true|false)', data)
-            verified = verified_match.group(1) == "true" if verified_match else None
-
-            # Extract followerCount (from stats or statsV2)
-            followers_match = re.search(r'"followerCount"\s*:\s*"?(\d+)"?', data)
-            followers = int(followers_match.group(1)) if followers_match else None
-
-            return {
-                "secUid": secuid,
-                "verified": verified,
-                "followerCount": followers,
-            }
+        log = self.logger.getChild("scrape_using_request")
+        parser = HydrationParser()
+        async with self.httpx_client.stream("GET", url) as response:
+            async for chunk in response.aiter_bytes():
+                user_info = parser.feed(chunk)
+                if user_info is not None:
+                    log.debug(
+                        "Found rehydration data after %s bytes", parser.bytes_read
+                    )
+                    return summarize_user_info(user_info)
+
+        log.warning("No rehydration data in %s, falling back to regexes", url)
+        data = parser.buffer.decode("utf-8", errors="replace")
+        # Extract secUid
+        secuid_match = re.search(r'"secUid"\s*:\s*"([^"]+)"', data)
+        secuid = secuid_match.group(1) if secuid_match else None
+
+        # Extract verified (bool)
+        verified_match = re.search(r'"verified"\s*:\s*(true|false)', data)
+        verified = verified_match.group(1) == "true" if verified_match else None
+
+        # Extract followerCount (from stats or statsV2)
+        followers_match = re.search(r'"followerCount"\s*:\s*"?(\d+)"?', data)
+        followers = int(followers_match.group(1)) if followers_match else None
+
+        return {
+            "secUid": secuid,
+            "verified": verified,
+            "followerCount": followers,
+        }
 
-    def handle_response(self, response):
+    async def handle_response(self, response):
         """
         Handles the response from TikTok's post item list API.
 
-        Given a Playwright response object, this method extracts the post creation
-        timestamps from the response content and stores them in the `self.posts`
-        attribute.
+        Given a Playwright response object, this method reads the secUid of the
+        item list request and stores the recent post creation timestamps in the
+        `self.posts` attribute.
 
         Args:
             response (Response): The Playwright response object.
@@ -104,87 +141,113 @@ class TiktokScraperService:
         log = self.logger.getChild("handle_response")
         url = response.url
         if "/api/post/item_list/" in url:
-            http_header = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36 Edg/138.0.0.0",  # noqa
-                "Accept-Language": "en-US,en;q=0.9",
-                "Referer": "https://www.tiktok.com/",
-                "Cookie": f"msToken={config.TIKTOK_COOKIES}; odinId=YOUR_ODINID; device_id=7509009447768409608;",  # noqa
-            }
-            # Wait for full body to be available
-            parsed_url = urlparse(url)
-            params = parse_qs(parsed_url.query)
-
-            params["data_collection_enabled"] = True
-            params["device_id"] = 7509009447768409608
-            params["screen_height"] = 1080
-            params["screen_width"] = 1920
-
+            sec_uid = parse_qs(urlparse(url).query).get("secUid", [None])[0]
+            if not sec_uid:
+                return
             try:
-                r = httpx.get(
-                    "https://www.tiktok.com/api/post/item_list/",
-                    params=params,
-                    headers=http_header,
-                    timeout=10,
-                )
-                data = r.json()
-                self.posts = [item["createTime"] for item in data["itemList"]]
-
+                self.posts = list(await self.extract_post_using_requests(sec_uid))
             except Exception as e:
                 log.error("Error reading body: %s", e)
 
-    def extract_post_using_requests(self, secUid):
+    def _item_list_headers(self):
+        return {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36 Edg/138.0.0.0",  # noqa
+            "Accept-Language": "en-US,en;q=0.9",
+            "Referer": "https://www.tiktok.com/",
+            "Cookie": f"msToken={config.TIKTOK_COOKIES}; odinId=YOUR_ODINID; device_id=7509009447768409608;",  # noqa
+        }
+
+    async def extract_post_using_requests(
+        self,
+        secUid,
+        horizon_days=config.RATING_HORIZON_DAYS,
+        max_pages=config.TIKTOK_ITEM_LIST_MAX_PAGES,
+        since=None,
+    ):
         """
         Extracts post timestamps using the TikTok API via HTTPX.
 
-        This method takes in a secUid, constructs a GET request to the TikTok API
-        with the required headers and parameters, and parses the JSON response to
-        retrieve the post timestamps.
+        Item list pages are followed by cursor while `hasMore` is set, and only
+        until a page reaches posts older than the rating horizon, or than
+        `since`. Pinned posts are listed first whatever their age, so they never
+        end the pagination.
 
         Args:
             secUid (str): The secure user ID of the TikTok account.
+            horizon_days (int): Posts older than this many days are not needed.
+            max_pages (int): Maximum number of pages to request.
+            since (int, optional): Epoch time of the newest post already known.
 
         Returns:
-            None
-        """
-        api_endpoint = "https://www.tiktok.com/api/post/item_list/"
+            array: The post creation times as Unix timestamps ('q' typecode).
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36 Edg/138.0.0.0",  # noqa
-            "Accept-Language": "en-US,en;q=0.9",
-            "Referer": "https://www.tiktok.com/",
-            "Cookie": f"msToken={config.TIKTOK_COOKIES}; odinId=YOUR_ODINID; device_id=7509009447768409608;",  # noqa
-        }
-        params = {
-            "WebIdLastTime": ["1748327509"],
-            "aid": ["1988"],
-            "app_language": ["en"],
-            "app_name": ["tiktok_web"],
-            "cookie_enabled": ["true"],
-            "count": ["35"],
-            "cursor": ["0"],
-            "data_collection_enabled": ["true"],
-            "device_id": ["7509009447768409608"],
-            "odinId": ["7534585605200921607"],
-            "secUid": [secUid],
-            "msToken": [config.TIKTOK_COOKIES],
-        }
+        Raises:
+            ValueError: When the response has no item list at all, e.g. when
+                TikTok refuses the request.
+        """
+        cutoff = time.time() - horizon_days * 24 * 60 * 60
+        if since is not None:
+            # Posts up to `since` are already known
+            cutoff = max(cutoff, since + 1)
+        headers = self._item_list_headers()
+        timestamps = array("q")
+        cursor = "0"
+        for page in range(max_pages):
+            params = {
+                **ITEM_LIST_SESSION_PARAMS,
+                "cursor": cursor,
+                "secUid": secUid,
+                "msToken": config.TIKTOK_COOKIES,
+            }
+            r = await self.httpx_client.get(
+                ITEM_LIST_ENDPOINT, params=params, headers=headers, timeout=10
+            )
+            r.raise_for_status()
+            data = r.json()
+            if page == 0 and "itemList" not in data:
+                raise ValueError("TikTok returned no item list")
+
+            past_horizon = False
+            for item in data.get("itemList") or []:
+                created = int(item["createTime"])
+                timestamps.append(created)
+                if created < cutoff and not item.get("isPinnedItem"):
+                    past_horizon = True
+
+            if past_horizon or not data.get("hasMore"):
+                break
+            cursor = str(data.get("cursor", "0"))
+        return timestamps
+
+    async def _recent_post_times(self, url, sec_uid, since=None):
+        """
+        Returns the recent post timestamps from the item list API, falling back
+        to Google dorking when the secUid is unknown or the API call fails.
 
-        r = httpx.get(api_endpoint, params=params, headers=headers, timeout=10)
-        data = r.json()
-        return [item["createTime"] for item in data["itemList"]]
+        Only the item list has exact timestamps and is limited to the posts
+        newer than `since`; dorking always returns every post it finds.
 
-    async def scrape(self, url, timeout=2000):
-        """
-        Run sync Playwright in a thread pool to avoid event loop conflicts
+        Returns:
+            tuple: The post timestamps, and whether they come from the item
+                list.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor, lambda: self._sync_scrape(url, timeout)
+        log = self.logger.getChild("_recent_post_times")
+        if sec_uid:
+            try:
+                posts = await self.extract_post_using_requests(sec_uid, since=since)
+                return list(posts), True
+            except Exception as e:
+                log.warning("Item list failed, falling back to dorking: %s", e)
+
+        posts = await self.social_dorker.get_video_dates(
+            url, dork_fn=self.social_dorker.get_tiktok_dork
         )
+        return list(parse_many(posts, source="tiktok", normalize=True)), False
 
-    def _sync_scrape(self, url, timeout=2000):
+    @coalesce("tiktok")
+    async def scrape(self, url, timeout=2000, since=None):
         """
-        Synchronously scrapes Tiktok page data using Playwright.
+        Scrapes Tiktok page data using async Playwright.
 
         This method navigates to a given Tiktok URL, waits for the content to load,
         and extracts various data points such as verification status, likes, followers,
@@ -194,6 +257,8 @@ class TiktokScraperService:
         Args:
             url (str): The Tiktok URL to scrape.
             timeout (int, optional): The time to wait for page content to load.
+            since (int, optional): Epoch time of the newest post already known;
+                only newer posts are looked up when the timestamps are exact.
 
         Returns:
             dict: A dictionary containing the scraped data, including:
@@ -201,8 +266,12 @@ class TiktokScraperService:
                 - likes (int): The number of likes, if available.
                 - follower (int): The number of followers, if available.
                 - posts (list): A list of timestamps of the posts.
+                - postsSince (int | None, optional): Set when the timestamps
+                  are exact, to the `since` the posts were limited to.
                 - error (str, optional): An error message if scraping fails.
                 - message (str, optional): A failure message if scraping fails.
+                - transient (bool, optional): Whether the failure came from the
+                  platform or the network rather than from the profile.
         """
         log = self.logger.getChild("scrape")
         if not url:
@@ -214,16 +283,13 @@ class TiktokScraperService:
             page_follower = ""
             scraped = {}
             followers = ""
+            sec_uid = None
             try:
-                with sync_playwright() as p:
-                    browser = p.chromium.launch(
-                        headless=self.headless
-                    )  # Set headless=True if you don't want to see the browser
-                    context = browser.new_context(
-                        has_touch=True,
-                        locale="en-US",
-                        extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
-                    )
+                async with self.browser_pool.context(
+                    has_touch=True,
+                    locale="en-US",
+                    extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
+                ) as context:
                     cookie = [
                         {
                             "name": "msToken",
@@ -232,54 +298,49 @@ class TiktokScraperService:
                             "path": "/",
                         }
                     ]
-                    context.add_cookies(cookie)
-                    page = context.new_page()
+                    await context.add_cookies(cookie)
+                    page = await context.new_page()
 
                     # page.on("response", self.handle_response)
 
                     # Navigate to the page
-                    page.goto(url, wait_until="networkidle", timeout=60000)
+                    await page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
-                    # Wait for page content to load (you can adjust the selector)
-                    page.wait_for_timeout(timeout=timeout)  # wait 5 seconds
+                    # Wait until the profile header and follower count are rendered,
+                    # bounded like the networkidle wait used to be
+                    if not await wait_for_ready(
+                        page, READY_SELECTORS, config.SPA_PAGE_READY_TIMEOUT_MS
+                    ):
+                        log.warning("Tiktok page %s did not become ready", url)
 
                     # Get the full HTML after JS has rendered
-                    html_content = page.content()
-                    browser.close()
-                    tree = html.fromstring(html_content)
-                    page_follower = (
-                        tree.xpath("//div/strong[contains(@title, 'Followers')]").pop()
-                    ).text_content()  # noqa
-                    # page_likes = (
-                    #     tree.xpath("//div/strong[contains(@title, 'Likes')]").pop()
-                    # ).text_content()
-                    is_verified = (
-                        True
-                        if len(
-                            tree.xpath(
-                                "//h1[@data-e2e='user-title']/following-sibling::*[1][self::svg]"  # noqa
-                            )
-                        )
-                        > 0
-                        else False
-                    )
+                    html_content = await page.content()
+                user_info = HydrationParser().feed(html_content.encode("utf-8"))
+                if user_info is not None:
+                    sec_uid = summarize_user_info(user_info)["secUid"]
+                tree = html.fromstring(html_content)
+                fields = extract("tiktok", tree)
+                page_follower = fields["follower"]
+                is_verified = fields["verified"]
             except Exception as e:
                 log.error("Failed to scrape Tiktok using playwright: %s", e)
                 log.info("Scraping tiktok via httpx %s", url)
-                scraped = self.scrape_using_request(url)
+                scraped = await self.scrape_using_request(url)
+                sec_uid = scraped["secUid"]
 
             followers = (
                 page_follower if page_follower else str(scraped["followerCount"])
             )
-            verification = is_verified if is_verified else scraped["verified"]
-            posts = self._get_video_dates_sync(url)
-            # posts = self.posts
+            verification = scraped["verified"] if scraped else is_verified
+            posts, exact = await self._recent_post_times(url, sec_uid, since)
             gathered_data = {
                 "verified": verification,
                 "likes": convert_number_with_suffix(followers),
                 "follower": convert_number_with_suffix(followers),
                 "posts": posts,
             }
+            if exact:
+                gathered_data["postsSince"] = since
             log.info("Gathered data: %s", gathered_data)
             return gathered_data
 
@@ -288,9 +349,11 @@ class TiktokScraperService:
             return {
                 "error": str(e),
                 "message": "Failed to scrape Tiktok",
+                "transient": is_transient(e),
             }
 
-    async def scrape_via_httpx(self, url, timeout=2000):
+    @coalesce("tiktok")
+    async def scrape_via_httpx(self, url, timeout=2000, since=None):
         if not url:
             return "No URL provided."
 
@@ -299,16 +362,22 @@ class TiktokScraperService:
             return "No URL provided."
 
         log.info("Scraping tiktok via httpx %s", url)
-        scraped = self.scrape_using_request(url)
-        posts = self.social_dorker.get_video_dates(
-            url, dork_fn=self.social_dorker.get_tiktok_dork
-        )
-        gathered_data = {
-            "verified": scraped["verified"],
-            "follower": convert_number_with_suffix(str(scraped["followerCount"])),
-            "posts": [
-                time_to_epoch(re.sub(r"\s+", " ", post).strip()) for post in posts
-            ],
-        }
+        try:
+            scraped = await self.scrape_using_request(url)
+            posts, exact = await self._recent_post_times(url, scraped["secUid"], since)
+            gathered_data = {
+                "verified": scraped["verified"],
+                "follower": convert_number_with_suffix(str(scraped["followerCount"])),
+                "posts": posts,
+            }
+        except Exception as e:
+            log.error("Failed to scrape Tiktok via httpx: %s", e)
+            return {
+                "error": str(e),
+                "message": "Failed to scrape Tiktok",
+                "transient": is_transient(e),
+            }
+        if exact:
+            gathered_data["postsSince"] = since
         log.info("Gathered data: %s", gathered_data)
         return gathered_data
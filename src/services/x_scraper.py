@@ -1,35 +1,31 @@
-import asyncio
 import logging
-import re
-from concurrent.futures import ThreadPoolExecutor
 
 from lxml import html
-from playwright.sync_api import sync_playwright
 
+from src.core.config import config
+from src.services.browser_pool import BrowserPoolService
 from src.services.social_dorker import SocialDorkerService
-from src.utils.convert_number_with_suffix import convert_number_with_suffix
-from src.utils.time_to_epoch import time_to_epoch
+from src.utils.circuit_breaker import is_transient
+from src.utils.extraction import extract
+from src.utils.page_ready import wait_for_ready
+from src.utils.single_flight import SingleFlight, coalesce
+from src.utils.time_to_epoch import parse_many
+
+# Nodes read from the rendered page, waited for instead of a fixed sleep
+READY_SELECTORS = ("xpath=//*[contains(@href, 'verified')]",)
 
 
 class XScraperService:
-    def __init__(self, headless=True):
+    def __init__(self, browser_pool=None, social_dorker=None):
         self.logger = logging.getLogger("XScraperService")
-        self.headless = headless
-        self.executor = ThreadPoolExecutor(max_workers=1)
-        self.social_dorker = SocialDorkerService()
+        self.single_flight = SingleFlight()
+        self.social_dorker = social_dorker or SocialDorkerService()
+        self.browser_pool = browser_pool or BrowserPoolService()
 
+    @coalesce("x")
     async def scrape(self, url, timeout=2000):
         """
-        Run sync Playwright in a thread pool to avoid event loop conflicts
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor, lambda: self._sync_scrape(url, timeout)
-        )
-
-    def _sync_scrape(self, url, timeout=2000):
-        """
-        Synchronously scrapes X page data using Playwright.
+        Scrapes X page data using async Playwright.
 
         This method navigates to a given X URL, waits for the content to load,
         and extracts various data points such as verification status, followers, and
@@ -47,6 +43,8 @@ class XScraperService:
                 - posts (list): A list of timestamps of the posts.
                 - error (str, optional): An error message if scraping fails.
                 - message (str, optional): A failure message if scraping fails.
+                - transient (bool, optional): Whether the failure came from the
+                  platform or the network rather than from the profile.
         """
         log = self.logger.getChild("scrape")
         if not url:
@@ -55,71 +53,61 @@ class XScraperService:
         log.info("Scraping X %s", url)
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=self.headless)
-                context = browser.new_context(
-                    locale="en-US",
-                    extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
-                )
-                page = context.new_page()
+            async with self.browser_pool.context(
+                locale="en-US",
+                extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
+            ) as context:
+                page = await context.new_page()
 
                 # Set a realistic user-agent
-                page.set_extra_http_headers(
+                await page.set_extra_http_headers(
                     {
                         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36 Edg/138.0.0.0"  # noqa
                     }
                 )
 
                 # Navigate to the page
-                page.goto(url)
+                await page.goto(url)
 
                 # Wait for page content to load (you can adjust the selector)
-                page.wait_for_load_state("domcontentloaded")
+                await page.wait_for_load_state("domcontentloaded")
                 # Close the "Create New Account" popup
-                close_button = page.query_selector('[aria-label="Close"]')
+                close_button = await page.query_selector('[aria-label="Close"]')
                 if close_button:
-                    close_button.click()
+                    await close_button.click()
 
                 # Scroll to the bottom of the page to load more content
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
 
-                # Wait for page content to load (you can adjust the selector)
-                page.wait_for_timeout(timeout)
+                # Wait until the follower count is rendered
+                if not await wait_for_ready(
+                    page, READY_SELECTORS, min(timeout, config.PAGE_READY_TIMEOUT_MS)
+                ):
+                    log.warning("X page %s did not become ready", url)
 
                 # Get the full HTML after JS has rendered
-                html_content = page.content()
-                browser.close()
-                tree = html.fromstring(html_content)
-                # post_age_list = tree.xpath(
-                #     "//*[contains(@href, 'status')][contains(@dir, 'ltr')]"
-                # )
-                page_follower = tree.xpath("//*[contains(@href, 'verified')]")[0]
-                is_verified = (
-                    True
-                    if len(tree.xpath("//*[contains(@aria-label, 'Verified account')]"))
-                    > 0
-                    else False
-                )
-
-                posts = self.social_dorker.get_video_dates(
-                    url, dork_fn=self.social_dorker.get_x_dork
-                )
-                gathered_data = {
-                    "verified": is_verified,
-                    "follower": convert_number_with_suffix(
-                        page_follower.text_content().split(" ")[0]
-                    ),
-                    "posts": [
-                        time_to_epoch(re.sub(r"\s+", " ", post).strip())
-                        for post in posts
-                    ],
-                }
-                log.info("Gathered data: %s", gathered_data)
-                return gathered_data
+                html_content = await page.content()
+            tree = html.fromstring(html_content)
+            # post_age_list = tree.xpath(
+            #     "//*[contains(@href, 'status')][contains(@dir, 'ltr')]"
+            # )
+            fields = extract("x", tree)
+
+            posts = await self.social_dorker.get_video_dates(
+                url, dork_fn=self.social_dorker.get_x_dork
+            )
+            gathered_data = {
+                "verified": fields["verified"],
+                "follower": fields["follower"],
+                "posts": list(parse_many(posts, source="x", normalize=True)),
+            }
+            log.info("Gathered data: %s", gathered_data)
+            return gathered_data
 
         except Exception as e:
             log.error("Error while scraping X: %s", e)
             return {
                 "error": str(e),
                 "message": "Failed to scrape X",
+                "transient": is_transient(e),
             }
@@ -0,0 +1,135 @@
+import asyncio
+import time
+from typing import Dict, Tuple
+
+import httpx
+from playwright.async_api import Error as PlaywrightError
+
+from src.core.config import config
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Response statuses telling that the platform is blocking or failing
+OUTAGE_STATUS_CODES = (403, 429)
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Tells whether a scraping error comes from the platform or the network
+    rather than from the profile itself.
+
+    Timeouts, transport and browser errors, and blocking or server error
+    statuses are transient. A profile that does not exist or a page the fields
+    could not be extracted from is not, and must not open a circuit.
+    """
+    if isinstance(
+        error, (asyncio.TimeoutError, httpx.TransportError, PlaywrightError, OSError)
+    ):
+        return True
+    # httpx.HTTPStatusError and the Apify client errors
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", getattr(response, "status_code", None))
+    return isinstance(status, int) and (status in OUTAGE_STATUS_CODES or status >= 500)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one scraping strategy of one platform.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    are refused without being attempted. Once `reset_timeout` seconds have
+    passed, one probe call is let through (half-open): its success closes the
+    circuit again and its failure re-opens it for another `reset_timeout`.
+    """
+
+    def __init__(
+        self,
+        failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=config.CIRCUIT_RESET_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.rejected = 0
+        self._probing = False
+
+    def allow(self) -> bool:
+        """
+        Tells whether a call may be attempted now. Every allowed call must be
+        followed by `record_success`, `record_failure` or `abandon`.
+        """
+        if (
+            self.state == OPEN
+            and time.monotonic() - self.opened_at >= self.reset_timeout
+        ):
+            self.state = HALF_OPEN
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+    def abandon(self):
+        """
+        Releases the probe slot of a call that neither succeeded nor failed,
+        e.g. one cancelled before it finished or one about a bad profile.
+        """
+        self._probing = False
+
+    def stats(self):
+        retry_in = None
+        if self.state == OPEN:
+            retry_in = max(self.reset_timeout - (time.monotonic() - self.opened_at), 0)
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "retryIn": retry_in,
+        }
+
+
+class CircuitBreakerRegistry:
+    """
+    Creates and holds one CircuitBreaker per (platform, strategy) pair.
+    """
+
+    def __init__(
+        self,
+        failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=config.CIRCUIT_RESET_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+
+    def get(self, platform: str, strategy: str) -> CircuitBreaker:
+        breaker = self.breakers.get((platform, strategy))
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            self.breakers[(platform, strategy)] = breaker
+        return breaker
+
+    def stats(self):
+        return {
+            f"{platform}:{strategy}": breaker.stats()
+            for (platform, strategy), breaker in self.breakers.items()
+        }
@@ -0,0 +1,64 @@
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+async def bounded_map_unordered(
+    fn: Callable[[T], Awaitable[Any]], items: Iterable[T], limit: int
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Runs `fn` over `items` with at most `limit` calls in flight, yielding
+    `(index, result)` pairs in completion order.
+
+    Items are pulled from the iterable only when a slot frees up, so memory
+    stays flat however many items there are. An exception raised by `fn` is
+    yielded as the result instead of being raised. Closing the generator early
+    cancels the calls still running.
+
+    Args:
+        fn (Callable): Coroutine function called with each item.
+        items (Iterable): The items to process.
+        limit (int): Maximum number of concurrent calls.
+
+    Yields:
+        tuple: The position of the item in `items` and its result or exception.
+    """
+    iterator = enumerate(items)
+    pending: Set[asyncio.Task] = set()
+    indexes = {}
+
+    def start_next():
+        for index, item in iterator:
+            task = asyncio.ensure_future(fn(item))
+            indexes[task] = index
+            pending.add(task)
+            return
+
+    try:
+        for _ in range(limit):
+            start_next()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                start_next()
+                try:
+                    result = task.result()
+                except Exception as e:
+                    result = e
+                yield indexes.pop(task), result
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
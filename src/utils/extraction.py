@@ -0,0 +1,147 @@
+import json
+from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+
+from lxml import etree
+
+from src.core.config import config
+from src.utils.convert_number_with_suffix import convert_number_with_suffix
+
+CONVERTERS: Dict[str, Callable[[Any], Any]] = {}
+
+
+def register_converter(name: str):
+    """
+    Registers a function turning an XPath result into a field value, so that
+    specs can refer to it by name.
+    """
+
+    def decorator(fn):
+        CONVERTERS[name] = fn
+        return fn
+
+    return decorator
+
+
+def _text(value) -> str:
+    # Elements carry their text as content, attributes and text() are strings
+    if isinstance(value, etree._Element):
+        return value.text_content()
+    return str(value)
+
+
+@register_converter("text")
+def convert_text(value) -> str:
+    return _text(value)
+
+
+@register_converter("number")
+def convert_number(value) -> int:
+    return convert_number_with_suffix(_text(value))
+
+
+@register_converter("first_word_number")
+def convert_first_word_number(value) -> int:
+    return convert_number_with_suffix(_text(value).split(" ")[0])
+
+
+class FieldSpec(NamedTuple):
+    name: str
+    xpath: etree.XPath
+    pick: Union[str, int]
+    convert: Optional[Callable[[Any], Any]]
+    default: Any
+    required: bool
+    limit: Optional[int]
+
+
+_MISSING = object()
+
+
+class ExtractionSpec:
+    """
+    Compiled extraction spec of one platform.
+
+    Each field has a precompiled XPath, a `pick` telling which match to keep
+    ("first", "last", an index, "all" or "exists") and the name of a converter.
+    `extract` evaluates each XPath exactly once. A field without a match takes
+    its `default`, is left out when it has none, and raises when `required`.
+    """
+
+    def __init__(self, fields: Dict[str, dict]):
+        self.fields = [
+            FieldSpec(
+                name=name,
+                xpath=etree.XPath(field["xpath"]),
+                pick=field.get("pick", "first"),
+                convert=CONVERTERS[field["convert"]] if "convert" in field else None,
+                default=field.get("default", _MISSING),
+                required=field.get("required", False),
+                limit=field.get("limit"),
+            )
+            for name, field in fields.items()
+        ]
+
+    def extract(self, tree) -> Dict[str, Any]:
+        """
+        Extracts every field of the spec from a parsed page.
+
+        Args:
+            tree (lxml.html.HtmlElement): The parsed page.
+
+        Returns:
+            dict: Field names and their converted values.
+
+        Raises:
+            ValueError: When a required field has no match.
+        """
+        data = {}
+        for field in self.fields:
+            matches = field.xpath(tree)
+            if field.pick == "exists":
+                data[field.name] = len(matches) > 0
+                continue
+            if field.pick == "all":
+                matches = matches[: field.limit] if field.limit else matches
+                data[field.name] = [
+                    field.convert(match) if field.convert else match
+                    for match in matches
+                ]
+                continue
+
+            index = {"first": 0, "last": -1}.get(field.pick, field.pick)
+            try:
+                value = matches[index]
+            except IndexError:
+                if field.required:
+                    raise ValueError(f"Field '{field.name}' was not found")
+                if field.default is not _MISSING:
+                    data[field.name] = field.default
+                continue
+            data[field.name] = field.convert(value) if field.convert else value
+        return data
+
+
+def load_specs(path: str) -> Dict[str, ExtractionSpec]:
+    """
+    Loads and compiles the extraction specs of every platform from a JSON file.
+
+    Args:
+        path (str): The JSON file, mapping platforms to their field specs.
+
+    Returns:
+        dict: Platform names and their compiled specs.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        specs = json.load(f)
+    return {platform: ExtractionSpec(fields) for platform, fields in specs.items()}
+
+
+# Compiled once at import, point EXTRACTION_SPECS_PATH elsewhere to swap them
+SPECS = load_specs(config.EXTRACTION_SPECS_PATH)
+
+
+def extract(platform: str, tree) -> Dict[str, Any]:
+    """
+    Extracts the fields of a platform's spec from a parsed page.
+    """
+    return SPECS[platform].extract(tree)
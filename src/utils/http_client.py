@@ -0,0 +1,100 @@
+import asyncio
+from typing import AsyncIterator, Callable, Dict
+
+import httpx
+
+from src.core.config import config
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """
+    Wraps a response stream and calls `release` once the stream is closed.
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that caps the number of in-flight requests per host.
+
+    httpx only limits connections for the whole pool, so one busy host could
+    take every connection. Each host gets its own semaphore, and a slot is held
+    until the response body is closed so streamed responses count as well.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_per_host)
+            self._semaphores[host] = semaphore
+
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        response.stream = _ReleasingStream(response.stream, semaphore.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def build_async_client(rate_limiter=None, **kwargs) -> httpx.AsyncClient:
+    """
+    Builds the shared async HTTP client used by every service.
+
+    The client speaks HTTP/2 when the server supports it and keeps idle
+    connections alive, so repeat calls to the same host skip the TCP and TLS
+    handshakes.
+
+    Args:
+        rate_limiter (HostRateLimiter, optional): Paces requests per host.
+        **kwargs: Extra keyword arguments for `httpx.AsyncClient`.
+
+    Returns:
+        httpx.AsyncClient: The pooled client.
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=config.HTTPX_HTTP2,
+        limits=httpx.Limits(
+            max_connections=config.HTTPX_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTPX_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.HTTPX_KEEPALIVE_EXPIRY,
+        ),
+    )
+    if rate_limiter is not None:
+        # Added to the caller's hooks, which are copied rather than mutated
+        hooks = dict(kwargs.get("event_hooks") or {})
+        hooks["request"] = [*hooks.get("request", []), rate_limiter.httpx_hook]
+        kwargs["event_hooks"] = hooks
+    return httpx.AsyncClient(
+        transport=HostLimitedTransport(
+            transport, max_per_host=config.HTTPX_MAX_CONNECTIONS_PER_HOST
+        ),
+        timeout=config.HTTPX_TIMEOUT,
+        **kwargs,
+    )
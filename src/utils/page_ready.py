@@ -0,0 +1,32 @@
+import time
+from typing import Sequence
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+async def wait_for_ready(page, selectors: Sequence[str], timeout: float) -> bool:
+    """
+    Waits until every selector is attached to the page, or until the timeout.
+
+    Used in place of fixed sleeps: the wait ends as soon as the nodes the
+    scraper reads are rendered, and `timeout` is only the upper bound shared by
+    all the selectors.
+
+    Args:
+        page (Page): The Playwright page.
+        selectors (Sequence[str]): Playwright selectors, e.g. "xpath=//h1".
+        timeout (float): Maximum wait in milliseconds.
+
+    Returns:
+        bool: True when all the selectors were found in time.
+    """
+    deadline = time.monotonic() + timeout / 1000
+    for selector in selectors:
+        remaining = (deadline - time.monotonic()) * 1000
+        if remaining <= 0:
+            return False
+        try:
+            await page.wait_for_selector(selector, state="attached", timeout=remaining)
+        except PlaywrightTimeoutError:
+            return False
+    return True
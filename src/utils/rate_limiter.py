@@ -0,0 +1,116 @@
+import asyncio
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from src.core.config import config
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second, holding up to `burst`.
+
+    Callers are served one at a time in arrival order: asyncio locks wake their
+    waiters first-in first-out, so a burst of requests is spread out instead of
+    failing or racing for the next token.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.queued = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.last_wait = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def estimated_wait(self) -> float:
+        """
+        Seconds a request arriving now would wait for its token.
+        """
+        self._refill()
+        return max(self.queued + 1 - self.tokens, 0) / self.rate
+
+    async def acquire(self):
+        started = time.monotonic()
+        self.queued += 1
+        try:
+            async with self._lock:
+                self._refill()
+                if self.tokens < 1:
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+                    self._refill()
+                self.tokens -= 1
+        finally:
+            self.queued -= 1
+        self.last_wait = time.monotonic() - started
+        self.total_wait += self.last_wait
+        self.acquired += 1
+
+    def stats(self):
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "queued": self.queued,
+            "estimatedWait": round(self.estimated_wait(), 3),
+            "lastWait": round(self.last_wait, 3),
+            "averageWait": (
+                round(self.total_wait / self.acquired, 3) if self.acquired else 0
+            ),
+            "acquired": self.acquired,
+        }
+
+
+class HostRateLimiter:
+    """
+    Outbound rate limiter with one token bucket per configured host.
+
+    A host is matched against the configured domains and their subdomains, so
+    "tiktok.com" also covers "www.tiktok.com" and "m.tiktok.com". Hosts that
+    are not configured are not limited.
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        burst: int = config.OUTBOUND_RATE_BURST,
+    ):
+        rates = config.OUTBOUND_RATE_LIMITS if rates is None else rates
+        self.buckets = {
+            domain.lower(): TokenBucket(rate, burst)
+            for domain, rate in rates.items()
+            if rate > 0
+        }
+
+    def bucket_for(self, url_or_host: str) -> Optional[TokenBucket]:
+        host = urlparse(url_or_host).hostname if "://" in url_or_host else url_or_host
+        labels = (host or "").lower().split(".")
+        for index in range(len(labels) - 1):
+            bucket = self.buckets.get(".".join(labels[index:]))
+            if bucket is not None:
+                return bucket
+        return None
+
+    async def acquire(self, url_or_host: str):
+        """
+        Waits for a token for the host of a URL, or a bare host name.
+        """
+        bucket = self.bucket_for(url_or_host)
+        if bucket is not None:
+            await bucket.acquire()
+
+    async def httpx_hook(self, request):
+        """
+        httpx request event hook applying the limit to every outbound request.
+        """
+        await self.acquire(request.url.host)
+
+    def stats(self):
+        return {domain: bucket.stats() for domain, bucket in self.buckets.items()}
@@ -0,0 +1,89 @@
+import asyncio
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from src.helpers.profile import profile_key
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    The first caller for a key starts the work as a task. Callers arriving
+    while it runs await the same task, shielded so that one caller being
+    cancelled (e.g. by its deadline) does not cancel the others. The task is
+    only cancelled when every caller waiting on it has gone away.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Runs `fn` unless a call with the same key is already running, and
+        returns its result.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            fn (Callable): Zero-argument coroutine function doing the work.
+
+        Returns:
+            Any: The result of the shared call. Its exception is raised to every
+                caller.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda _: self._forget(key, task))
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._calls.get(key) is task and self._waiters[key] == 1:
+                task.cancel()
+            raise
+        finally:
+            if self._calls.get(key) is task:
+                self._waiters[key] -= 1
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            del self._waiters[key]
+
+
+def coalesce(platform: str):
+    """
+    Decorates a scraper method `(self, url, ...)` so that concurrent calls for
+    the same profile share one scrape through the instance's `single_flight`.
+
+    Only calls with the same other arguments (e.g. `timeout` or `since`),
+    defaults applied, share a scrape, since those can change its result.
+    """
+
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(self, url, *args, **kwargs):
+            if not url:
+                return await method(self, url, *args, **kwargs)
+            bound = signature.bind(self, url, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple(bound.arguments.items())[2:]
+            key = (method.__name__, profile_key(platform, url), arguments)
+            return await self.single_flight.do(
+                key, lambda: method(self, url, *args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
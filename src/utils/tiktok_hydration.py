@@ -0,0 +1,91 @@
+import json
+from typing import Optional
+
+SCRIPT_MARKER = b'id="__UNIVERSAL_DATA_FOR_REHYDRATION__"'
+USER_INFO_KEY = b'"userInfo":'
+SCRIPT_END = b"</script>"
+
+_decoder = json.JSONDecoder()
+
+
+class HydrationParser:
+    """
+    Incremental parser for the rehydration JSON of a TikTok profile page.
+
+    Chunks of the HTML are fed as they arrive. Nothing is parsed until the
+    `__UNIVERSAL_DATA_FOR_REHYDRATION__` script is reached, and then only the
+    `userInfo` object (user, stats and statsV2) is decoded, as soon as it is
+    complete, so the caller can stop reading the rest of the page.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.bytes_read = 0
+        self._scanned = 0
+        self._script_start = -1
+        self._user_info_start = -1
+
+    def feed(self, chunk: bytes) -> Optional[dict]:
+        """
+        Adds a chunk of the page.
+
+        Args:
+            chunk (bytes): The next bytes of the response body.
+
+        Returns:
+            dict | None: The userInfo object once it is complete.
+        """
+        self.buffer += chunk
+        self.bytes_read += len(chunk)
+
+        if self._script_start < 0:
+            self._script_start = self._find(SCRIPT_MARKER, 0)
+            if self._script_start < 0:
+                return None
+            self._scanned = self._script_start
+
+        if self._user_info_start < 0:
+            found = self._find(USER_INFO_KEY, self._script_start)
+            if found < 0:
+                return None
+            self._user_info_start = found + len(USER_INFO_KEY)
+        elif b"}" not in chunk and SCRIPT_END[-1:] not in chunk:
+            # The object cannot have been completed by this chunk
+            return None
+
+        end = self.buffer.find(SCRIPT_END, self._user_info_start)
+        text = self.buffer[self._user_info_start : end if end >= 0 else None]
+        try:
+            user_info, _ = _decoder.raw_decode(
+                text.decode("utf-8", errors="replace").lstrip()
+            )
+        except json.JSONDecodeError:
+            # The object is not complete yet, unless the script already ended
+            if end >= 0:
+                raise ValueError("Malformed rehydration data")
+            return None
+        return user_info
+
+    def _find(self, marker: bytes, start: int) -> int:
+        # Only scan the new bytes, plus enough overlap for a split marker
+        found = self.buffer.find(marker, max(start, self._scanned - len(marker) + 1))
+        if found < 0:
+            self._scanned = len(self.buffer)
+        return found
+
+
+def summarize_user_info(user_info: dict) -> dict:
+    """
+    Picks the fields the scraper needs from a rehydration userInfo object.
+
+    Returns:
+        dict: secUid, verified and followerCount, None for the missing ones.
+    """
+    user = user_info.get("user") or {}
+    stats = user_info.get("stats") or user_info.get("statsV2") or {}
+    followers = stats.get("followerCount")
+    return {
+        "secUid": user.get("secUid"),
+        "verified": user.get("verified"),
+        "followerCount": int(followers) if followers is not None else None,
+    }
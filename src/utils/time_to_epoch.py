@@ -1,8 +1,167 @@
+import calendar
 import re
+from array import array
 from datetime import datetime, timedelta
 
+# Month names of the current locale, as matched by strptime's %B and %b
+MONTHS = {name.lower(): index for index, name in enumerate(calendar.month_name) if name}
+MONTH_ABBREVIATIONS = {
+    name.lower(): index for index, name in enumerate(calendar.month_abbr) if name
+}
+SHORT_UNITS = {"m": "minutes", "h": "hours", "d": "days"}
+WORD_UNITS = {"minutes": "minutes", "hours": "hours", "days": "days", "day": "days"}
+WHITESPACE = re.compile(r"\s+")
 
-def time_to_epoch(s: str) -> int:
+# Shape of the last successfully parsed string, per source
+_last_shape = {}
+
+
+def _relative(units):
+    def decode(match, now):
+        value, unit = match.groups()
+        if unit not in units:
+            raise ValueError(f"Unknown time unit: {unit}")
+        dt = now - timedelta(**{units[unit]: int(value)})
+        return int(dt.timestamp())
+
+    return decode
+
+
+def _month_day_year(match, now):
+    name, day, year = match.groups()
+    name = name.lower()
+    month = MONTH_ABBREVIATIONS.get(name) or MONTHS.get(name)
+    if month is None:
+        return None
+    return int(datetime(int(year), month, int(day)).timestamp())
+
+
+def _hour_12(hour, meridiem):
+    hour = int(hour)
+    if not 1 <= hour <= 12:
+        return None
+    return hour % 12 + (12 if meridiem.lower() == "pm" else 0)
+
+
+def _month_day_time(match, now):
+    name, day, hour, minute, meridiem = match.groups()
+    month = MONTHS.get(name.lower())
+    hour = _hour_12(hour, meridiem)
+    if month is None or hour is None:
+        return None
+    return int(datetime(now.year, month, int(day), hour, int(minute)).timestamp())
+
+
+def _day_month_time(match, now):
+    day, name, hour, minute, meridiem = match.groups()
+    month = MONTHS.get(name.lower())
+    hour = int(hour) if meridiem is None else _hour_12(hour, meridiem)
+    # strptime validates these in its default year 1900, which has no Feb 29
+    if month is None or hour is None or (month, int(day)) == (2, 29):
+        return None
+    return int(datetime(now.year, month, int(day), hour, int(minute)).timestamp())
+
+
+def _datetime(match, now):
+    year, month, day, hour, minute, second = map(int, match.groups())
+    return int(datetime(year, month, day, hour, minute, second).timestamp())
+
+
+def _iso_datetime(match, now):
+    year, month, day, hour, minute, second, fraction = match.groups()
+    dt = datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        int(fraction.ljust(6, "0")),
+    )
+    return int(dt.timestamp())
+
+
+def _month_day(match, now):
+    name, day = match.groups()
+    month = MONTHS.get(name.lower())
+    if month is None:
+        return None
+    return int(datetime(now.year, month, int(day)).timestamp())
+
+
+def _day_month(match, now):
+    day, name = match.groups()
+    month = MONTHS.get(name.lower())
+    if month is None or (month, int(day)) == (2, 29):
+        return None
+    return int(datetime(now.year, month, int(day)).timestamp())
+
+
+# Mutually exclusive string shapes, each with the decoder of its format. Only
+# the canonical spelling of every format is matched here; a decoder returns
+# None or raises when the string is not one it can decode exactly.
+SHAPES = (
+    # "1m", "3h", "2d"
+    (re.compile(r"(\d+)([mhd])$"), _relative(SHORT_UNITS)),
+    # "22 hours ago"
+    (re.compile(r"(\d+)\s*(\w+)\s*ago$"), _relative(WORD_UNITS)),
+    # "Jun 18, 2024", "June 18, 2024"
+    (re.compile(r"([A-Za-z]+) (\d{1,2}), (\d{4})\Z"), _month_day_year),
+    # "July 9 at 3:10 am"
+    (
+        re.compile(r"([A-Za-z]+) (\d{1,2}) at (\d{1,2}):(\d{2}) ([AaPp][Mm])\Z"),
+        _month_day_time,
+    ),
+    # "29 June at 18:23", "29 June at 6:23 pm"
+    (
+        re.compile(r"(\d{1,2}) ([A-Za-z]+) at (\d{1,2}):(\d{2})(?: ([AaPp][Mm]))?\Z"),
+        _day_month_time,
+    ),
+    # "2025-07-06 12:47:20"
+    (re.compile(r"(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})\Z"), _datetime),
+    # "2025-07-18T01:00:12.000Z"
+    (
+        re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})\.(\d{1,6})Z\Z"),
+        _iso_datetime,
+    ),
+    # "May 23"
+    (re.compile(r"([A-Za-z]+) (\d{1,2})\Z"), _month_day),
+    # "28 March"
+    (re.compile(r"(\d{1,2}) ([A-Za-z]+)\Z"), _day_month),
+)
+
+
+def _decode(shape, s, now):
+    pattern, decoder = SHAPES[shape]
+    match = pattern.match(s)
+    if match is None:
+        return None
+    try:
+        return decoder(match, now)
+    except ValueError:
+        return None
+
+
+def _parse(s, now, source):
+    last = _last_shape.get(source)
+    if last is not None:
+        result = _decode(last, s, now)
+        if result is not None:
+            return result
+
+    for shape in range(len(SHAPES)):
+        if shape == last:
+            continue
+        result = _decode(shape, s, now)
+        if result is not None:
+            _last_shape[source] = shape
+            return result
+
+    # Lenient spellings, out of range values and errors are left to strptime
+    return _parse_with_strptime(s, now)
+
+
+def time_to_epoch(s: str, source=None) -> int:
     """
     Convert a given time string to its equivalent epoch timestamp.
 
@@ -14,8 +173,13 @@ def time_to_epoch(s: str) -> int:
     5. Date with month name and time (e.g. "July 9 at 3:10 am" or "29 June at 18:23").
     6. Month and day only, assuming the current year (e.g., "May 23", "28 March").
 
+    The shape of the string is classified with precompiled patterns and decoded
+    directly, trying the last successful shape of `source` first. Only strings
+    outside the canonical shapes go through `datetime.strptime`.
+
     Args:
         s (str): The time string to convert.
+        source (str, optional): Where the string comes from, e.g. a platform.
 
     Returns:
         int: The equivalent epoch timestamp.
@@ -23,9 +187,37 @@ def time_to_epoch(s: str) -> int:
     Raises:
         ValueError: If the input string is in an unrecognized format or contains an unknown time unit.
     """  # noqa
+    return _parse(s, datetime.now(), source)
 
+
+def parse_many(values, source=None, normalize=False) -> array:
+    """
+    Convert a batch of time strings to epoch timestamps.
+
+    Relative times of the batch are all resolved against the same moment.
+
+    Args:
+        values (Iterable[str]): The time strings to convert.
+        source (str, optional): Where the strings come from, e.g. a platform.
+        normalize (bool): Whether to collapse whitespace runs and strip the
+            strings first.
+
+    Returns:
+        array: The epoch timestamps ('q' typecode), in the order of `values`.
+
+    Raises:
+        ValueError: If a string is in an unrecognized format.
+    """
     now = datetime.now()
+    timestamps = array("q")
+    for value in values:
+        if normalize:
+            value = WHITESPACE.sub(" ", value).strip()
+        timestamps.append(_parse(value, now, source))
+    return timestamps
+
 
+def _parse_with_strptime(s: str, now: datetime) -> int:
     # Handle relative time (e.g. "1m", "3h", "2d")
     rel_match = re.match(r"(\d+)([mhd])$", s)
     if rel_match:
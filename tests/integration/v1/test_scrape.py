@@ -0,0 +1,167 @@
+import json
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.v1.dependencies import (
+    get_profile_history,
+    get_rate_social_media,
+    get_result_feedback,
+    get_scrape_jobs,
+    get_scrape_orchestrator,
+)
+from src.main import app
+from src.services.profile_history import ProfileHistoryService
+from src.services.rate_social_media import RateSocialMediaService
+from src.services.scrape_jobs import ScrapeJobService
+
+
+class FakeOrchestrator:
+    async def gather(self, data):
+        return self.results()
+
+    async def stream(self, data):
+        for platform, result in self.results().items():
+            yield platform, result
+
+    def results(self):
+        return {
+            "facebook": {
+                "verified": True,
+                "follower": 10_000,
+                "posts": [int(time.time())],
+            },
+            "instagram": "No URL provided.",
+            "tiktok": "No URL provided.",
+            "x": {"error": "Timed out after 60s", "timedOut": True},
+        }
+
+
+class FakeResultFeedback:
+    async def generate_feedback(self, raw_data, scores):
+        return "Looks good"
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_scrape_orchestrator] = FakeOrchestrator
+    app.dependency_overrides[get_rate_social_media] = RateSocialMediaService
+    app.dependency_overrides[get_result_feedback] = FakeResultFeedback
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_post_scrape_success(client):
+    response = client.post(
+        "/v1/scrape",
+        json={"facebook": "https://www.facebook.com/a"},
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["feedback"] == "Looks good"
+    assert data["platformScores"]["x"]["timedOut"] is True
+    assert data["overallRating"] > 0
+
+
+def test_post_scrape_invalid_type(client):
+    response = client.post("/v1/scrape", json={"facebook": 1})
+    assert response.status_code == 422
+
+
+def test_post_scrape_batch_streams_ndjson(client):
+    response = client.post(
+        "/v1/scrape/batch",
+        json={
+            "items": [
+                {"facebook": "https://www.facebook.com/a"},
+                {"facebook": "https://www.facebook.com/b"},
+                {"facebook": "https://www.facebook.com/c"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["index"] for line in lines) == [0, 1, 2]
+    assert all(line["data"]["overallRating"] > 0 for line in lines)
+    assert all("feedback" not in line["data"] for line in lines)
+
+
+def test_post_scrape_batch_rejects_empty_batch(client):
+    response = client.post("/v1/scrape/batch", json={"items": []})
+    assert response.status_code == 422
+
+
+def test_scrape_job_is_accepted_then_polled(client):
+    jobs = ScrapeJobService(
+        FakeOrchestrator(), RateSocialMediaService(), FakeResultFeedback(), queue_size=1
+    )
+    app.dependency_overrides[get_scrape_jobs] = lambda: jobs
+
+    response = client.post(
+        "/v1/scrape/jobs", json={"facebook": "https://www.facebook.com/a"}
+    )
+    assert response.status_code == 202
+    job_id = response.json()["data"]["jobId"]
+
+    response = client.get(f"/v1/scrape/jobs/{job_id}")
+    assert response.status_code == 200
+    assert response.json()["data"]["status"] == "queued"
+    assert response.json()["data"]["platforms"]["facebook"] == "pending"
+
+    response = client.post("/v1/scrape/jobs", json={})
+    assert response.status_code == 503
+
+    assert client.get("/v1/scrape/jobs/unknown").status_code == 404
+
+
+def test_post_scrape_stream_sends_platforms_scores_then_feedback(client):
+    response = client.post(
+        "/v1/scrape/stream",
+        json={"facebook": "https://www.facebook.com/a"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append((event.removeprefix("event: "), json.loads(data[6:])))
+
+    assert [event for event, _ in events] == ["platform"] * 4 + [
+        "scores",
+        "feedback",
+    ]
+    assert events[0][1]["platform"] == "facebook"
+    assert events[4][1]["platformScores"]["x"]["timedOut"] is True
+    assert events[5][1] == {"feedback": "Looks good"}
+
+
+@pytest.mark.asyncio
+async def test_post_rescore_rates_from_history(client):
+    now = int(time.time())
+    history = ProfileHistoryService(db_path=":memory:")
+    data = {"verified": True, "follower": 10_000, "posts": [now]}
+    await history.record("facebook", "https://www.facebook.com/a", data)
+    app.dependency_overrides[get_profile_history] = lambda: history
+
+    response = client.post(
+        "/v1/scrape/rescore",
+        json={
+            "items": [
+                {"facebook": "https://www.facebook.com/a", "x": "https://x.com/a"},
+                {"tiktok": "https://www.tiktok.com/@b"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    first, second = response.json()["data"]
+    expected = RateSocialMediaService().rate({"facebook": data})
+    assert first["platformScores"]["facebook"] == pytest.approx(
+        expected["platformScores"]["facebook"], abs=0.01
+    )
+    assert first["platformScores"]["x"]["error"] == "No history"
+    assert first["platformScores"]["instagram"] == "No URL provided."
+    assert second["overallRating"] == 0
@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from src.services.apify_batcher import ApifyInstagramBatcher, instagram_username
+
+
+class FakeDataset:
+    def __init__(self, items):
+        self.items = items
+
+    async def iterate_items(self):
+        for item in self.items:
+            yield item
+
+
+class FakeActor:
+    def __init__(self, client):
+        self.client = client
+
+    async def call(self, run_input, logger=None):
+        self.client.runs.append(run_input["directUrls"])
+        await asyncio.sleep(0)
+        if self.client.fail:
+            raise RuntimeError("actor failed")
+        return {"defaultDatasetId": str(len(self.client.runs))}
+
+
+class FakeApifyClient:
+    def __init__(self, profiles, fail=False):
+        self.profiles = profiles
+        self.fail = fail
+        self.runs = []
+
+    def actor(self, actor_id):
+        return FakeActor(self)
+
+    def dataset(self, dataset_id):
+        urls = self.runs[int(dataset_id) - 1]
+        return FakeDataset(
+            [
+                self.profiles[instagram_username(url)]
+                for url in urls
+                if instagram_username(url) in self.profiles
+            ]
+        )
+
+
+def test_instagram_username():
+    assert instagram_username("https://www.instagram.com/Shop/") == "shop"
+    assert instagram_username("instagram.com/shop?hl=en") == "shop"
+    with pytest.raises(ValueError):
+        instagram_username("https://www.instagram.com/")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_share_one_run():
+    client = FakeApifyClient(
+        {
+            "one": {"username": "One", "followersCount": 1},
+            "two": {"username": "two", "followersCount": 2},
+        }
+    )
+    batcher = ApifyInstagramBatcher(apify_client=client, window=0.01)
+
+    one, two, again = await asyncio.gather(
+        batcher.fetch("https://www.instagram.com/one/"),
+        batcher.fetch("https://www.instagram.com/two"),
+        batcher.fetch("https://www.instagram.com/ONE"),
+    )
+
+    assert one["followersCount"] == 1
+    assert two["followersCount"] == 2
+    assert again is one
+    assert client.runs == [
+        ["https://www.instagram.com/one/", "https://www.instagram.com/two"]
+    ]
+    assert (batcher.batches, batcher.profiles) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_flushed_without_waiting():
+    client = FakeApifyClient({"one": {"username": "one"}, "two": {"username": "two"}})
+    batcher = ApifyInstagramBatcher(apify_client=client, window=60, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            batcher.fetch("https://www.instagram.com/one"),
+            batcher.fetch("https://www.instagram.com/two"),
+        ),
+        timeout=1,
+    )
+
+    assert [result["username"] for result in results] == ["one", "two"]
+    assert len(client.runs) == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_profile_and_failed_run_raise():
+    client = FakeApifyClient({"one": {"username": "one"}})
+    batcher = ApifyInstagramBatcher(apify_client=client, window=0.01)
+
+    one, missing = await asyncio.gather(
+        batcher.fetch("https://www.instagram.com/one"),
+        batcher.fetch("https://www.instagram.com/missing"),
+        return_exceptions=True,
+    )
+    assert one == {"username": "one"}
+    assert isinstance(missing, LookupError)
+
+    client.fail = True
+    with pytest.raises(RuntimeError):
+        await batcher.fetch("https://www.instagram.com/one")
+
+
+@pytest.mark.asyncio
+async def test_only_posts_newer_than_oldest_since():
+    inputs = []
+
+    class RecordingActor(FakeActor):
+        async def call(self, run_input, logger=None):
+            inputs.append(run_input)
+            return await super().call(run_input, logger)
+
+    client = FakeApifyClient({"one": {"username": "one"}, "two": {"username": "two"}})
+    client.actor = lambda actor_id: RecordingActor(client)
+    batcher = ApifyInstagramBatcher(apify_client=client, window=0.01)
+
+    await asyncio.gather(
+        batcher.fetch("https://www.instagram.com/one", since=1_700_000_000),
+        batcher.fetch("https://www.instagram.com/two", since=1_600_000_000),
+    )
+    await asyncio.gather(
+        batcher.fetch("https://www.instagram.com/one", since=1_700_000_000),
+        batcher.fetch("https://www.instagram.com/two"),
+    )
+
+    assert inputs[0]["onlyPostsNewerThan"] == "2020-09-13T12:26:40Z"
+    assert "onlyPostsNewerThan" not in inputs[1]
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from src.services.browser_pool import BrowserPoolService
+
+
+class FakeContext:
+    def __init__(self):
+        self.route_handler = None
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **context_options):
+        return FakeContext()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.chromium = self
+
+    async def launch(self, headless=True):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+
+@pytest.fixture
+def fake_playwright(mocker):
+    playwright = FakePlaywright()
+    mocker.patch("src.services.browser_pool.async_playwright", return_value=playwright)
+    return playwright
+
+
+@pytest.mark.asyncio
+async def test_browser_is_recycled_after_max_navigations(fake_playwright):
+    pool = BrowserPoolService(size=2, max_navigations=2)
+    await pool.start()
+
+    for _ in range(3):
+        async with pool.context():
+            pass
+
+    assert len(fake_playwright.browsers) == 2
+    assert fake_playwright.browsers[0].closed
+    assert pool.stats()["launches"] == 2
+    assert pool.stats()["navigations"] == 3
+
+    await pool.close()
+    assert all(browser.closed for browser in fake_playwright.browsers)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pages_are_capped(fake_playwright):
+    pool = BrowserPoolService(size=2, max_navigations=100)
+    peak = 0
+
+    async def use_page():
+        nonlocal peak
+        async with pool.context():
+            peak = max(peak, pool.stats()["activePages"])
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(use_page() for _ in range(6)))
+
+    assert peak == 2
+    assert pool.stats()["activePages"] == 0
+    assert pool.stats()["queuedPages"] == 0
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+    def is_navigation_request(self):
+        return self.resource_type == "document"
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = FakeRequest(url, resource_type)
+        self.outcome = None
+
+    async def abort(self, error_code=None):
+        self.outcome = "aborted"
+
+    async def continue_(self):
+        self.outcome = "continued"
+
+
+@pytest.mark.asyncio
+async def test_blocked_resources_and_trackers_are_aborted(fake_playwright):
+    pool = BrowserPoolService(
+        size=1, blocked_resource_types=["image"], blocked_domains=["doubleclick.net"]
+    )
+    routes = [
+        FakeRoute("https://www.tiktok.com/@a", "document"),
+        FakeRoute("https://p16.tiktokcdn.com/avatar.jpeg", "image"),
+        FakeRoute("https://stats.g.doubleclick.net/collect", "xhr"),
+        FakeRoute("https://www.tiktok.com/api/user", "fetch"),
+    ]
+    async with pool.context() as context:
+        for route in routes:
+            await context.route_handler(route)
+
+    assert [route.outcome for route in routes] == [
+        "continued",
+        "aborted",
+        "aborted",
+        "continued",
+    ]
+    stats = pool.stats()
+    assert stats["blockedRequests"] == 2
+    assert stats["estimatedBytesSaved"] > 0
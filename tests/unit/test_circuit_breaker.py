@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import httpx
+
+from src.utils.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    is_transient,
+)
+
+
+def test_opens_after_threshold_and_closes_after_successful_probe(mocker):
+    clock = mocker.patch("src.utils.circuit_breaker.time.monotonic")
+    clock.return_value = 100
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+    clock.return_value = 130
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.stats()["rejected"] == 2
+
+
+def test_failed_probe_reopens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert breaker.opened_at <= time.monotonic()
+
+
+def status_error(status):
+    request = httpx.Request("GET", "https://www.tiktok.com/@a")
+    response = httpx.Response(status, request=request)
+    return httpx.HTTPStatusError("failed", request=request, response=response)
+
+
+def test_only_platform_and_network_errors_are_transient():
+    assert is_transient(asyncio.TimeoutError())
+    assert is_transient(httpx.ConnectError("refused"))
+    assert is_transient(status_error(429))
+    assert is_transient(status_error(503))
+
+    assert not is_transient(status_error(404))
+    assert not is_transient(LookupError("No Apify result for shop"))
+    assert not is_transient(IndexError("list index out of range"))
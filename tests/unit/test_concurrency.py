@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from src.utils.concurrency import bounded_map_unordered
+
+
+@pytest.mark.asyncio
+async def test_bounded_map_unordered_caps_concurrency_and_reports_errors():
+    running = 0
+    peak = 0
+
+    async def work(item):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - item))
+        running -= 1
+        if item == 3:
+            raise ValueError("bad item")
+        return item * 2
+
+    results = {}
+    async for index, result in bounded_map_unordered(work, range(5), limit=2):
+        results[index] = result
+
+    assert peak == 2
+    assert isinstance(results.pop(3), ValueError)
+    assert results == {0: 0, 1: 2, 2: 4, 4: 8}
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+from lxml import html
+
+from src.utils.extraction import extract, load_specs
+
+FACEBOOK_PAGE = """
+<html><body>
+  <h1>Shop <span title="Verified account"></span></h1>
+  <a href="/shop/friends_likes/"><strong>1.2K</strong></a>
+  <a href="/shop/followers/"><strong>3,400</strong></a>
+</body></html>
+"""
+
+
+def test_facebook_spec_extracts_fields_in_one_pass():
+    fields = extract("facebook", html.fromstring(FACEBOOK_PAGE))
+
+    assert fields == {
+        "like": 1200,
+        "follower": 3400,
+        "verified": True,
+        "reviews": "No reviews",
+    }
+
+
+def test_missing_required_field_raises():
+    with pytest.raises(ValueError, match="follower"):
+        extract("x", html.fromstring("<html><body></body></html>"))
+
+
+def test_instagram_post_links_are_limited():
+    links = "".join(f'<a href="/p/{index}/">post</a>' for index in range(8))
+    page = f"""
+    <html><head><title>Shop (Verified)</title></head><body>
+      <span><span><span class="html-span">12</span></span></span>
+      <span><span><span class="html-span">5.5M followers</span></span></span>
+      <div style="display: flex">{links}</div>
+    </body></html>
+    """
+
+    fields = extract("instagram", html.fromstring(page))
+
+    assert fields["follower"] == 5_500_000
+    assert fields["verified"] is True
+    assert fields["post_links"] == [f"/p/{index}/" for index in range(5)]
+
+
+def test_specs_can_be_swapped_from_a_file(tmp_path):
+    path = tmp_path / "specs.json"
+    path.write_text(
+        json.dumps(
+            {"x": {"follower": {"xpath": "//b", "pick": "last", "convert": "number"}}}
+        )
+    )
+
+    specs = load_specs(str(path))
+
+    assert specs["x"].extract(html.fromstring("<p><b>1</b><b>2k</b></p>")) == {
+        "follower": 2000
+    }
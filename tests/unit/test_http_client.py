@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.utils.http_client import HostLimitedTransport, build_async_client
+from src.utils.rate_limiter import HostRateLimiter
+
+
+def ok_response():
+    # A streamed body, like real transports return, instead of preloaded content
+    return httpx.Response(200, stream=httpx.ByteStream(b"ok"))
+
+
+@pytest.mark.asyncio
+async def test_requests_are_capped_per_host():
+    in_flight = {}
+    peak = {}
+
+    async def handler(request):
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return ok_response()
+
+    transport = HostLimitedTransport(httpx.MockTransport(handler), max_per_host=2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        await asyncio.gather(
+            *(client.get("https://www.tiktok.com/") for _ in range(5)),
+            *(client.get("https://www.googleapis.com/") for _ in range(5)),
+        )
+
+    assert peak == {"www.tiktok.com": 2, "www.googleapis.com": 2}
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_holds_slot_until_closed():
+    transport = HostLimitedTransport(
+        httpx.MockTransport(lambda request: ok_response()),
+        max_per_host=1,
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        async with client.stream("GET", "https://www.tiktok.com/") as response:
+            second = asyncio.ensure_future(client.get("https://www.tiktok.com/"))
+            await asyncio.sleep(0.01)
+            assert not second.done()
+            await response.aread()
+        response = await asyncio.wait_for(second, timeout=1)
+
+    assert response.text == "ok"
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_hook_is_added_to_the_callers_hooks():
+    async def log_request(request):
+        pass
+
+    async def log_response(response):
+        pass
+
+    hooks = {"request": [log_request], "response": [log_response]}
+    limiter = HostRateLimiter(rates={})
+    client = build_async_client(rate_limiter=limiter, event_hooks=hooks)
+
+    assert client.event_hooks["request"] == [log_request, limiter.httpx_hook]
+    assert client.event_hooks["response"] == [log_response]
+    assert hooks["request"] == [log_request]
+    await client.aclose()
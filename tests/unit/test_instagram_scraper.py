@@ -0,0 +1,55 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.services.instagram_scraper import InstagramScraperService
+from src.utils.time_to_epoch import time_to_epoch
+
+HEAD = (
+    b"<html><head><title>Post</title>"
+    b'<meta property="og:description" content="12 likes - shop on '
+    b'March 3, 2024: &quot;New in May 1, 2020&quot;. June 18, 2025" />'
+    b"</head>"
+)
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.sent = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+
+@pytest.mark.asyncio
+async def test_check_url_stops_reading_after_head():
+    body = [HEAD[:50], HEAD[50:], b"<body>" + b"x" * 1000] + [b"y" * 1000] * 50
+    streams = []
+    running = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        stream = ChunkedStream(body)
+        streams.append(stream)
+        return httpx.Response(200, stream=stream)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    scraper = InstagramScraperService(httpx_client=client, post_concurrency=2)
+
+    results = await asyncio.gather(
+        *(scraper._check_url(f"/p/{index}/") for index in range(4))
+    )
+
+    # The last date of the description is the post date
+    assert results == [time_to_epoch("June 18, 2025")] * 4
+    assert all(stream.sent <= 3 for stream in streams)
+    assert peak == 2
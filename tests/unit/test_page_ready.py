@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from src.utils.page_ready import wait_for_ready
+
+
+class FakePage:
+    def __init__(self, render_times):
+        self.render_times = render_times
+        self.timeouts = []
+
+    async def wait_for_selector(self, selector, state, timeout):
+        self.timeouts.append(timeout)
+        delay = self.render_times[selector]
+        if delay * 1000 > timeout:
+            await asyncio.sleep(timeout / 1000)
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+        await asyncio.sleep(delay)
+
+
+@pytest.mark.asyncio
+async def test_returns_as_soon_as_selectors_render():
+    page = FakePage({"xpath=//h1": 0.01, "xpath=//strong": 0.02})
+
+    assert await wait_for_ready(page, ["xpath=//h1", "xpath=//strong"], 5000)
+    # The second selector only gets what is left of the shared budget
+    assert page.timeouts[1] < page.timeouts[0] <= 5000
+
+
+@pytest.mark.asyncio
+async def test_gives_up_at_the_upper_bound():
+    page = FakePage({"xpath=//h1": 10})
+
+    assert not await wait_for_ready(page, ["xpath=//h1"], 50)
@@ -0,0 +1,35 @@
+import sqlite3
+
+import pytest
+
+from src.services.profile_cache import ProfileCacheService
+
+
+@pytest.mark.asyncio
+async def test_writes_delete_rows_past_their_retention(tmp_path, mocker):
+    db_path = str(tmp_path / "cache.db")
+    cache = ProfileCacheService(ttl=10, stale_ttl=10, negative_ttl=5, db_path=db_path)
+    clock = mocker.patch("src.services.profile_cache.time.time")
+
+    clock.return_value = 1_000
+    await cache.set("x:a", {"verified": True})
+    await cache.set("x:b", {"error": "boom"})
+    # The failure is past its retention, the profile is not
+    clock.return_value = 1_010
+    await cache.set("x:c", {"verified": False})
+    cache.close()
+
+    with sqlite3.connect(db_path) as conn:
+        keys = {row[0] for row in conn.execute("SELECT key FROM profile_cache")}
+    assert keys == {"x:a", "x:c"}
+
+    # Every row but the newest is past its retention
+    cache = ProfileCacheService(ttl=10, stale_ttl=10, negative_ttl=5, db_path=db_path)
+    clock.return_value = 1_031
+    await cache.set("x:d", {"verified": False})
+    assert (await cache.get("x:a")) is None
+    cache.close()
+
+    with sqlite3.connect(db_path) as conn:
+        keys = {row[0] for row in conn.execute("SELECT key FROM profile_cache")}
+    assert keys == {"x:d"}
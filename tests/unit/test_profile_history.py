@@ -0,0 +1,111 @@
+import time
+
+import pytest
+
+from src.services.profile_history import ProfileHistoryService
+from src.services.rate_social_media import RateSocialMediaService
+
+URL = "https://www.tiktok.com/@shop"
+DAY = 24 * 60 * 60
+
+
+@pytest.fixture
+def history():
+    service = ProfileHistoryService(db_path=":memory:", retention_days=90)
+    yield service
+    service.close()
+
+
+@pytest.mark.asyncio
+async def test_record_merges_exact_posts_newer_than_since(history):
+    now = int(time.time())
+    assert await history.since("tiktok", URL) is None
+
+    first = await history.record(
+        "tiktok",
+        URL,
+        {"verified": True, "follower": 500, "posts": [now - DAY, now - 2 * DAY]},
+        exact=True,
+    )
+    assert first["posts"] == [now - DAY, now - 2 * DAY]
+    assert await history.since("tiktok", URL) == now - DAY
+
+    # Only the posts newer than `since` are taken from the scrape, including
+    # a new one posted at the same second as the last known post
+    second = await history.record(
+        "tiktok",
+        URL,
+        {"verified": True, "follower": 600, "posts": [now, now, now - DAY]},
+        exact=True,
+        since=now - DAY,
+    )
+    assert second["posts"] == [now, now, now - DAY, now - 2 * DAY]
+    assert second["follower"] == 600
+    assert await history.since("tiktok", URL) == now
+
+
+@pytest.mark.asyncio
+async def test_record_replaces_inexact_posts(history):
+    midnight = int(time.time()) // DAY * DAY - 2 * DAY
+    await history.record("facebook", URL, {"verified": True, "posts": [midnight]})
+    assert await history.since("facebook", URL) is None
+
+    # A second post on the same day is counted, the known one is not doubled
+    replaced = await history.record(
+        "facebook", URL, {"verified": True, "posts": [midnight, midnight]}
+    )
+
+    assert replaced["posts"] == [midnight, midnight]
+
+
+@pytest.mark.asyncio
+async def test_record_keeps_posts_sharing_a_timestamp(history):
+    now = int(time.time())
+    midnight = now // DAY * DAY - DAY
+    # Two "3h" posts of one batch, and three posts dated by the same day
+    data = {
+        "verified": True,
+        "follower": 500,
+        "posts": [now - 10_800, now - 10_800, midnight, midnight, midnight],
+    }
+
+    merged = await history.record("facebook", URL, data)
+
+    assert merged["posts"] == sorted(data["posts"], reverse=True)
+    rate = RateSocialMediaService()
+    assert rate.rate({"facebook": merged}, now=now) == rate.rate(
+        {"facebook": data}, now=now
+    )
+    stored = await history.load([("facebook", URL)])
+    assert list(stored[("facebook", URL)]["posts"]) == sorted(data["posts"])
+
+
+@pytest.mark.asyncio
+async def test_record_drops_posts_past_retention(history):
+    now = int(time.time())
+    merged = await history.record(
+        "tiktok", URL, {"verified": False, "posts": [now, now - 100 * DAY]}
+    )
+
+    assert merged["posts"] == [now]
+
+
+@pytest.mark.asyncio
+async def test_load_rebuilds_data_for_rating(history):
+    now = int(time.time())
+    data = {"verified": True, "follower": 2_000, "likes": 2_000, "posts": [now]}
+    await history.record("tiktok", URL, data)
+
+    stored = await history.load([("tiktok", URL), ("x", "https://x.com/shop")])
+
+    assert list(stored) == [("tiktok", URL)]
+    rate = RateSocialMediaService()
+    assert rate.rate({"tiktok": stored[("tiktok", URL)]}, now=now) == rate.rate(
+        {"tiktok": data}, now=now
+    )
+    assert await history.stats() == {
+        "profiles": 1,
+        "posts": 1,
+        "snapshots": 1,
+        "retentionDays": 90,
+    }
@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.utils.rate_limiter import HostRateLimiter
+
+
+def test_subdomains_share_their_domain_bucket():
+    limiter = HostRateLimiter({"tiktok.com": 2, "googleapis.com": 0}, burst=1)
+
+    assert (
+        limiter.bucket_for("https://www.tiktok.com/@a") is limiter.buckets["tiktok.com"]
+    )
+    assert limiter.bucket_for("m.tiktok.com") is limiter.buckets["tiktok.com"]
+    assert limiter.bucket_for("www.googleapis.com") is None
+    assert limiter.bucket_for("nottiktok.com") is None
+
+
+@pytest.mark.asyncio
+async def test_requests_are_paced_in_arrival_order():
+    limiter = HostRateLimiter({"tiktok.com": 20}, burst=1)
+    order = []
+
+    async def request(index):
+        await limiter.acquire("www.tiktok.com")
+        order.append(index)
+
+    started = time.monotonic()
+    await asyncio.gather(*(request(index) for index in range(4)))
+
+    # One token up front, then three more at 20 per second
+    assert time.monotonic() - started >= 0.14
+    assert order == [0, 1, 2, 3]
+    assert limiter.stats()["tiktok.com"]["acquired"] == 4
+
+
+@pytest.mark.asyncio
+async def test_httpx_hook_paces_client_requests():
+    limiter = HostRateLimiter({"tiktok.com": 20}, burst=1)
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+        event_hooks={"request": [limiter.httpx_hook]},
+    )
+    async with client:
+        await asyncio.gather(*(client.get("https://www.tiktok.com/") for _ in range(3)))
+
+    assert limiter.buckets["tiktok.com"].acquired == 3
+    assert limiter.buckets["tiktok.com"].total_wait >= 0.09
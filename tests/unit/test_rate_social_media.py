@@ -0,0 +1,67 @@
+import random
+
+from src.services.rate_social_media import WEEK_EDGES, RateSocialMediaService
+
+NOW = 1_752_000_000.25
+
+
+def random_account(rng):
+    account = {}
+    for platform in ("facebook", "instagram", "tiktok", "x"):
+        roll = rng.random()
+        if roll < 0.15:
+            continue
+        if roll < 0.25:
+            account[platform] = {"error": "boom", "message": "Failed"}
+            continue
+        info = {
+            "verified": rng.random() < 0.5,
+            "posts": [
+                int(NOW - rng.uniform(-3600, 45 * 24 * 60 * 60))
+                for _ in range(rng.randint(0, 40))
+            ],
+        }
+        followers = rng.choice([0, 150, 9_999, 10_000, 10_001, 2_500_000])
+        info["follower" if rng.random() < 0.8 else "followers"] = followers
+        if platform in ("facebook", "tiktok") and rng.random() < 0.7:
+            info["like" if platform == "facebook" else "likes"] = rng.randint(0, 20_000)
+        account[platform] = info
+    return account
+
+
+def test_rate_many_matches_rate_exactly():
+    rng = random.Random(7)
+    accounts = [random_account(rng) for _ in range(300)]
+    # Posts exactly on the week boundaries
+    accounts.append(
+        {
+            "facebook": {
+                "verified": True,
+                "follower": 500,
+                "posts": [int(NOW - edge) for edge in WEEK_EDGES]
+                + [NOW - edge for edge in WEEK_EDGES],
+            }
+        }
+    )
+    accounts.append({})
+    service = RateSocialMediaService()
+
+    expected = [service.rate(account, now=NOW) for account in accounts]
+    assert service.rate_many(accounts, now=NOW) == expected
+
+
+def test_rate_many_handles_no_scored_platforms():
+    service = RateSocialMediaService()
+    accounts = [{"x": "No URL provided."}, {"tiktok": {"error": "boom"}}]
+
+    assert service.rate_many(accounts) == [service.rate(a) for a in accounts]
+    assert service.rate_many([]) == []
+
+
+def test_calculate_post_score_buckets_by_week():
+    service = RateSocialMediaService()
+    day = 24 * 60 * 60
+    posts = [NOW, NOW - 8 * day, NOW - 15 * day, NOW - 22 * day, NOW - 31 * day]
+
+    assert service.calculate_post_score(posts, 7, now=NOW) == round((2.5 / 12.5) * 7, 2)
+    assert service.calculate_post_score([], 7, now=NOW) == 0
@@ -0,0 +1,38 @@
+import pytest
+
+from src.core.config import config
+from src.services.result_feedback import ResultFeedbackService, feedback_cache_key
+
+
+@pytest.fixture
+def service(monkeypatch, mocker):
+    monkeypatch.setattr(config, "GOOGLE_API_KEY", "test-key")
+    service = ResultFeedbackService(cache_size=2)
+    mocker.patch.object(
+        service, "_generate_feedback", side_effect=lambda raw, scores, model: "ok"
+    )
+    return service
+
+
+def test_cache_key_ignores_key_and_post_order():
+    first = feedback_cache_key(
+        {"x": {"posts": [1, 2], "verified": True}}, {"overallRating": 1}, "m", "p"
+    )
+    second = feedback_cache_key(
+        {"x": {"verified": True, "posts": [2, 1]}}, {"overallRating": 1}, "m", "p"
+    )
+    assert first == second
+    assert first != feedback_cache_key({}, {"overallRating": 1}, "m", "p")
+
+
+@pytest.mark.asyncio
+async def test_feedback_is_cached_and_evicted(service):
+    await service.generate_feedback({"x": 1}, {"overallRating": 1})
+    await service.generate_feedback({"x": 1}, {"overallRating": 1})
+    assert service._generate_feedback.call_count == 1
+
+    await service.generate_feedback({"x": 2}, {"overallRating": 1})
+    await service.generate_feedback({"x": 3}, {"overallRating": 1})
+    await service.generate_feedback({"x": 1}, {"overallRating": 1})
+    assert service._generate_feedback.call_count == 4
+    assert service.stats() == {"entries": 2, "maxEntries": 2, "hits": 1, "misses": 4}
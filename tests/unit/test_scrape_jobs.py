@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from src.models.scrape import ScrapeRequest
+from src.services.rate_social_media import RateSocialMediaService
+from src.services.scrape_jobs import ScrapeJobService
+
+
+class FakeOrchestrator:
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    async def gather(self, data, on_result=None):
+        on_result("facebook", {"verified": True, "follower": 10_000})
+        await self.release.wait()
+        on_result("x", {"error": "boom"})
+        return {
+            "facebook": {"verified": True, "follower": 10_000},
+            "instagram": "No URL provided.",
+            "tiktok": "No URL provided.",
+            "x": {"error": "boom"},
+        }
+
+
+class FakeResultFeedback:
+    async def generate_feedback(self, raw_data, scores):
+        return "Looks good"
+
+
+@pytest.mark.asyncio
+async def test_job_reports_progress_and_result():
+    orchestrator = FakeOrchestrator()
+    jobs = ScrapeJobService(
+        orchestrator, RateSocialMediaService(), FakeResultFeedback(), workers=1
+    )
+    await jobs.start()
+    try:
+        job = jobs.submit(
+            ScrapeRequest(facebook="https://www.facebook.com/a", x="https://x.com/a")
+        )
+        await asyncio.sleep(0.01)
+        assert job.status == "running"
+        assert job.platforms == {
+            "facebook": "done",
+            "instagram": "skipped",
+            "tiktok": "skipped",
+            "x": "pending",
+        }
+
+        orchestrator.release.set()
+        await jobs.queue.join()
+        assert job.status == "completed"
+        assert job.platforms["x"] == "failed"
+        assert job.result["feedback"] == "Looks good"
+        assert jobs.get(job.id) is job
+    finally:
+        await jobs.close()
+
+
+@pytest.mark.asyncio
+async def test_submit_refuses_when_queue_is_full():
+    jobs = ScrapeJobService(
+        FakeOrchestrator(), RateSocialMediaService(), FakeResultFeedback(), queue_size=1
+    )
+    jobs.submit(ScrapeRequest())
+    with pytest.raises(asyncio.QueueFull):
+        jobs.submit(ScrapeRequest())
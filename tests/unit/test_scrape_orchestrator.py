@@ -0,0 +1,276 @@
+import asyncio
+import time
+
+import pytest
+
+from src.helpers.profile import profile_key
+from src.models.scrape import ScrapeRequest
+from src.services.profile_cache import ProfileCacheService
+from src.services.profile_history import ProfileHistoryService
+from src.services.rate_social_media import RateSocialMediaService
+from src.services.scrape_orchestrator import ScrapeOrchestratorService
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+
+
+class FakeScraper:
+    def __init__(self, result, delay=0):
+        self.result = result
+        self.delay = delay
+
+    async def scrape(self, url, timeout=2000):
+        await asyncio.sleep(self.delay)
+        return self.result
+
+    scrape_via_apify = scrape
+    scrape_via_httpx = scrape
+
+
+@pytest.mark.asyncio
+async def test_gather_marks_slow_platform_as_timed_out():
+    now = int(time.time())
+    profile = {"verified": True, "follower": 20_000, "posts": [now]}
+    orchestrator = ScrapeOrchestratorService(
+        facebook=FakeScraper(profile),
+        instagram=FakeScraper(profile),
+        tiktok=FakeScraper(profile),
+        x=FakeScraper(profile, delay=5),
+        deadlines={"facebook": 1, "instagram": 1, "tiktok": 1, "x": 0.05},
+    )
+    data = ScrapeRequest(
+        facebook="https://www.facebook.com/a",
+        instagram="https://www.instagram.com/a",
+        tiktok="https://www.tiktok.com/@a",
+        x="https://x.com/a",
+    )
+
+    started = time.monotonic()
+    gathered_data = await orchestrator.gather(data)
+    assert time.monotonic() - started < 1
+
+    assert gathered_data["x"]["timedOut"] is True
+    scores = RateSocialMediaService().rate(gathered_data)
+    assert scores["platformScores"]["x"]["timedOut"] is True
+    assert set(scores["platformScores"]) == {"facebook", "instagram", "tiktok", "x"}
+    assert scores["overallRating"] > 0
+
+
+@pytest.mark.asyncio
+async def test_gather_reports_raising_platform_as_error():
+    class FailingScraper(FakeScraper):
+        async def scrape(self, url, timeout=2000):
+            raise RuntimeError("boom")
+
+        scrape_via_httpx = scrape
+
+    orchestrator = ScrapeOrchestratorService(
+        facebook=FakeScraper({"verified": False}),
+        instagram=FakeScraper({"verified": False}),
+        tiktok=FailingScraper(None),
+        x=FakeScraper({"verified": False}),
+    )
+    gathered_data = await orchestrator.gather(ScrapeRequest())
+
+    assert gathered_data["tiktok"]["error"] == "boom"
+
+
+class CountingScraper(FakeScraper):
+    def __init__(self, result):
+        super().__init__(result)
+        self.calls = 0
+
+    async def scrape(self, url, timeout=2000):
+        self.calls += 1
+        return self.result() if callable(self.result) else self.result
+
+    scrape_via_apify = scrape
+    scrape_via_httpx = scrape
+
+
+def cached_orchestrator(cache, **scrapers):
+    default = {"verified": False}
+    return ScrapeOrchestratorService(
+        facebook=scrapers.get("facebook", FakeScraper(default)),
+        instagram=scrapers.get("instagram", FakeScraper(default)),
+        tiktok=scrapers.get("tiktok", FakeScraper(default)),
+        x=scrapers.get("x", FakeScraper(default)),
+        cache=cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_profile_is_reused_until_max_age():
+    facebook = CountingScraper({"verified": True, "follower": 10})
+    orchestrator = cached_orchestrator(ProfileCacheService(), facebook=facebook)
+
+    url = "https://www.facebook.com/a"
+    await orchestrator.gather(ScrapeRequest(facebook=url))
+    await orchestrator.gather(ScrapeRequest(facebook="https://facebook.com/a/"))
+    assert facebook.calls == 1
+
+    await orchestrator.gather(ScrapeRequest(facebook=url, max_age=0))
+    assert facebook.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_profile_is_served_while_refreshing():
+    results = iter([{"follower": 1}, {"follower": 2}])
+    facebook = CountingScraper(lambda: next(results))
+    cache = ProfileCacheService(ttl=0, stale_ttl=60)
+    orchestrator = cached_orchestrator(cache, facebook=facebook)
+
+    url = "https://www.facebook.com/a"
+    assert (await orchestrator.scrape_platform("facebook", url))["follower"] == 1
+    assert (await orchestrator.scrape_platform("facebook", url))["follower"] == 1
+    await asyncio.gather(*orchestrator._refreshes.values())
+
+    entry = await cache.get(profile_key("facebook", url))
+    assert entry.value["follower"] == 2
+    assert facebook.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_are_cached_briefly(tmp_path):
+    class FailingScraper(CountingScraper):
+        async def scrape(self, url, timeout=2000):
+            self.calls += 1
+            raise RuntimeError("profile not found")
+
+        scrape_via_httpx = scrape
+
+    tiktok = FailingScraper(None)
+    cache = ProfileCacheService(db_path=str(tmp_path / "cache.db"))
+    orchestrator = cached_orchestrator(cache, tiktok=tiktok)
+
+    url = "https://www.tiktok.com/@a"
+    first = await orchestrator.scrape_platform("tiktok", url)
+    second = await orchestrator.scrape_platform("tiktok", url)
+    assert first == second
+    assert tiktok.calls == 1
+
+    # A second worker sharing the SQLite file sees the cached failure
+    shared = ProfileCacheService(db_path=str(tmp_path / "cache.db"))
+    entry = await shared.get(profile_key("tiktok", url))
+    assert entry.negative and entry.value["error"] == "profile not found"
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_platforms_in_completion_order():
+    orchestrator = ScrapeOrchestratorService(
+        facebook=FakeScraper({"verified": True}, delay=0.05),
+        instagram=FakeScraper({"verified": True}, delay=0.03),
+        tiktok=FakeScraper({"verified": True}),
+        x=FakeScraper({"verified": True}, delay=0.01),
+    )
+    data = ScrapeRequest(
+        facebook="https://www.facebook.com/a",
+        instagram="https://www.instagram.com/a",
+        tiktok="https://www.tiktok.com/@a",
+        x="https://x.com/a",
+    )
+
+    order = [platform async for platform, _ in orchestrator.stream(data)]
+
+    assert order == ["tiktok", "x", "instagram", "facebook"]
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_serves_cached_profile_without_scraping():
+    class FlakyScraper(CountingScraper):
+        async def scrape(self, url, timeout=2000):
+            self.calls += 1
+            if self.calls > 1:
+                raise RuntimeError("blocked")
+            return {"verified": True}
+
+    x = FlakyScraper(None)
+    orchestrator = cached_orchestrator(ProfileCacheService(ttl=0), x=x)
+    orchestrator.breakers = CircuitBreakerRegistry(
+        failure_threshold=1, reset_timeout=60
+    )
+
+    url = "https://x.com/a"
+    assert await orchestrator.scrape_platform("x", url) == {"verified": True}
+    # Scrape fails and opens the circuit, stale data is served
+    assert await orchestrator.scrape_platform("x", url, max_age=0) == {"verified": True}
+    assert await orchestrator.scrape_platform("x", url, max_age=0) == {"verified": True}
+    assert x.calls == 2
+    assert orchestrator.breakers.stats()["x:playwright"]["state"] == "open"
+
+    result = await orchestrator.scrape_platform("x", "https://x.com/b")
+    assert result["circuitOpen"] is True
+
+
+@pytest.mark.asyncio
+async def test_profile_errors_do_not_open_the_circuit():
+    not_found = {"error": "No user", "message": "Failed", "transient": False}
+    blocked = {"error": "429", "message": "Failed", "transient": True}
+    x = CountingScraper(not_found)
+    orchestrator = cached_orchestrator(None, x=x)
+    orchestrator.breakers = CircuitBreakerRegistry(
+        failure_threshold=2, reset_timeout=60
+    )
+
+    for index in range(5):
+        await orchestrator.scrape_platform("x", f"https://x.com/missing{index}")
+    assert orchestrator.breakers.stats()["x:playwright"]["state"] == "closed"
+
+    x.result = blocked
+    await orchestrator.scrape_platform("x", "https://x.com/a")
+    await orchestrator.scrape_platform("x", "https://x.com/b")
+    assert orchestrator.breakers.stats()["x:playwright"]["state"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_history_requests_only_new_posts_and_merges_them():
+    class IncrementalScraper(FakeScraper):
+        def __init__(self):
+            self.since = []
+
+        async def scrape(self, url, timeout=2000, since=None):
+            self.since.append(since)
+            if since is None:
+                posts = [now - 60, now - 120]
+            else:
+                posts = [now]
+            return {"verified": True, "posts": posts, "postsSince": since}
+
+        scrape_via_httpx = scrape
+
+    now = int(time.time())
+    tiktok = IncrementalScraper()
+    orchestrator = ScrapeOrchestratorService(
+        facebook=FakeScraper({}),
+        instagram=FakeScraper({}),
+        tiktok=tiktok,
+        x=FakeScraper({}),
+        history=ProfileHistoryService(db_path=":memory:"),
+    )
+    url = "https://www.tiktok.com/@a"
+
+    await orchestrator.scrape_platform("tiktok", url)
+    result = await orchestrator.scrape_platform("tiktok", url)
+
+    assert tiktok.since == [None, now - 60]
+    assert result == {"verified": True, "posts": [now, now - 60, now - 120]}
+
+
+@pytest.mark.asyncio
+async def test_history_is_not_asked_for_inexact_platforms():
+    class DatedScraper(FakeScraper):
+        async def scrape(self, url, timeout=2000):
+            return {"verified": True, "posts": [now - 60, now - 60]}
+
+    now = int(time.time())
+    orchestrator = ScrapeOrchestratorService(
+        facebook=DatedScraper({}),
+        instagram=FakeScraper({}),
+        tiktok=FakeScraper({}),
+        x=FakeScraper({}),
+        history=ProfileHistoryService(db_path=":memory:"),
+    )
+    url = "https://www.facebook.com/a"
+
+    await orchestrator.scrape_platform("facebook", url)
+    result = await orchestrator.scrape_platform("facebook", url)
+
+    assert result["posts"] == [now - 60, now - 60]
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from src.utils.single_flight import SingleFlight, coalesce
+
+
+class SlowScraper:
+    def __init__(self):
+        self.single_flight = SingleFlight()
+        self.calls = 0
+
+    @coalesce("facebook")
+    async def scrape(self, url, timeout=2000, since=None):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return {"url": url, "call": self.calls, "since": since}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_scrapes_of_a_profile_share_one_call():
+    scraper = SlowScraper()
+    results = await asyncio.gather(
+        scraper.scrape("https://www.facebook.com/a"),
+        scraper.scrape("https://facebook.com/a/"),
+        scraper.scrape("https://www.facebook.com/b"),
+    )
+
+    assert scraper.calls == 2
+    assert results[0] is results[1]
+    assert scraper.single_flight.in_flight() == 0
+
+    await scraper.scrape("https://www.facebook.com/a")
+    assert scraper.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_scrapes_with_other_arguments_are_not_shared():
+    scraper = SlowScraper()
+    url = "https://www.facebook.com/a"
+    results = await asyncio.gather(
+        scraper.scrape(url),
+        scraper.scrape(url, 2000),
+        scraper.scrape(url=url, timeout=2000, since=None),
+        scraper.scrape(url, since=100),
+    )
+
+    assert scraper.calls == 2
+    assert results[0] is results[1] is results[2]
+    assert results[3]["since"] == 100
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_others():
+    scraper = SlowScraper()
+    impatient = asyncio.ensure_future(scraper.scrape("https://www.facebook.com/a"))
+    patient = asyncio.ensure_future(scraper.scrape("https://www.facebook.com/a"))
+    await asyncio.sleep(0.01)
+    impatient.cancel()
+
+    assert (await patient)["call"] == 1
+    assert impatient.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_last_cancelled_caller_cancels_the_call():
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+    finished = []
+
+    async def work():
+        started.set()
+        await asyncio.sleep(1)
+        finished.append(True)
+
+    caller = asyncio.ensure_future(single_flight.do("key", work))
+    await started.wait()
+    caller.cancel()
+    await asyncio.gather(caller, return_exceptions=True)
+    await asyncio.sleep(0.01)
+
+    assert single_flight.in_flight() == 0
+    assert finished == []
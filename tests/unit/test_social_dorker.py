@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from src.services.search_cache import SearchCacheService
+from src.services.social_dorker import SocialDorkerService
+
+
+def search_item(username, days_ago):
+    date = (datetime.now() - timedelta(days=days_ago)).strftime("%b %d, %Y")
+    return {
+        "link": f"https://www.tiktok.com/@{username}/video/{days_ago}",
+        "htmlSnippet": f"{date} .<b>video</b>",
+    }
+
+
+def build_dorker(pages):
+    requested = []
+
+    async def handler(request):
+        start = int(request.url.params["start"])
+        requested.append(start)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"items": pages.get(start, [])})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return SocialDorkerService(httpx_client=client, concurrent_pages=2), requested
+
+
+@pytest.mark.asyncio
+async def test_stops_at_rating_horizon():
+    pages = {
+        1: [search_item("user", day) for day in range(0, 10)],
+        11: [search_item("user", day) for day in range(35, 45)],
+        21: [search_item("user", day) for day in range(45, 55)],
+    }
+    dorker, requested = build_dorker(pages)
+
+    dates = await dorker.get_video_dates(
+        "https://www.tiktok.com/@user", page=3, horizon_days=30
+    )
+
+    assert len(dates) == 20
+    assert requested[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_first_page_is_requested_alone():
+    pages = {
+        1: [search_item("user", day) for day in range(25, 35)],
+        11: [search_item("user", day) for day in range(35, 45)],
+    }
+    dorker, requested = build_dorker(pages)
+
+    dates = await dorker.get_video_dates(
+        "https://www.tiktok.com/@user", page=3, horizon_days=30
+    )
+
+    assert len(dates) == 10
+    assert requested == [1]
+
+
+@pytest.mark.asyncio
+async def test_stops_on_short_page():
+    pages = {1: [search_item("user", day) for day in range(0, 4)]}
+    dorker, requested = build_dorker(pages)
+
+    dates = await dorker.get_video_dates("https://www.tiktok.com/@user", page=4)
+
+    assert len(dates) == 4
+    assert requested == [1]
+
+
+@pytest.mark.asyncio
+async def test_search_cache_serves_repeat_queries_and_respects_quota():
+    pages = {1: [search_item("user", day) for day in range(0, 4)]}
+    dorker, requested = build_dorker(pages)
+    dorker.search_cache = SearchCacheService(
+        db_path=":memory:", ttl=60, daily_quota=2, quota_reserve=1
+    )
+
+    first = await dorker.get_video_dates("https://www.tiktok.com/@user")
+    second = await dorker.get_video_dates("https://www.tiktok.com/@user")
+    assert first == second
+    assert requested == [1]
+
+    # The budget is spent, so an uncached query is answered with an empty page
+    other = await dorker.get_video_dates("https://www.tiktok.com/@other")
+    assert other == []
+    assert requested == [1]
+    assert (await dorker.search_cache.quota())["remaining"] == 1
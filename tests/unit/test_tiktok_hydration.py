@@ -0,0 +1,103 @@
+import json
+
+import httpx
+import pytest
+
+from src.core.config import config
+from src.services.tiktok_scraper import TiktokScraperService
+from src.utils.tiktok_hydration import HydrationParser, summarize_user_info
+
+USER_INFO = {
+    "user": {
+        "secUid": "MS4wLjABAAAA",
+        "verified": True,
+        "nickname": "Shop",
+    },
+    "stats": {"followerCount": 12345, "heartCount": 1},
+    "statsV2": {"followerCount": "12345"},
+}
+PAGE = (
+    "<html><head><title>Shop</title></head><body>"
+    # A nested "verified" key before the user object, which the regex matched
+    '<script id="SIGI_STATE">{"shareMeta":{"verified":false}}</script>'
+    '<script id="__UNIVERSAL_DATA_FOR_REHYDRATION__" type="application/json">'
+    + json.dumps(
+        {
+            "__DEFAULT_SCOPE__": {
+                "webapp.user-detail": {"userInfo": USER_INFO, "shareMeta": {}}
+            }
+        }
+    )
+    + "</script>"
+    + "<div>"
+    + "x" * 50_000
+    + "</div></body></html>"
+).encode()
+USER_INFO_OFFSET = PAGE.index(b'"userInfo":')
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.sent = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+
+def test_parser_stops_once_user_info_is_complete():
+    parser = HydrationParser()
+    result = None
+    for start in range(0, len(PAGE), 64):
+        result = parser.feed(PAGE[start : start + 64])
+        if result is not None:
+            break
+
+    assert result == USER_INFO
+    assert parser.bytes_read < len(PAGE) // 10
+    assert summarize_user_info(result) == {
+        "secUid": "MS4wLjABAAAA",
+        "verified": True,
+        "followerCount": 12345,
+    }
+
+
+@pytest.mark.parametrize("split", range(1, 11))
+def test_parser_finds_user_info_key_split_across_chunks(split):
+    parser = HydrationParser()
+    cut = USER_INFO_OFFSET + split
+
+    assert parser.feed(PAGE[:cut]) is None
+    assert parser.feed(PAGE[cut : cut + 2048]) == USER_INFO
+
+
+def test_page_without_rehydration_data_is_not_parsed():
+    parser = HydrationParser()
+
+    assert parser.feed(b"<html><body>no data</body></html>") is None
+
+
+@pytest.mark.asyncio
+async def test_scrape_using_request_reads_the_stream(monkeypatch):
+    monkeypatch.setattr(config, "GOOGLE_API_KEY", "key")
+    monkeypatch.setattr(config, "GOOGLE_SEARCH_ENGINE_ID", "id")
+
+    # Small chunks, one of them ending inside the "userInfo" key
+    cuts = [0, *range(64, USER_INFO_OFFSET, 64), USER_INFO_OFFSET + 5]
+    cuts += range(cuts[-1] + 64, len(PAGE), 64)
+    stream = ChunkedStream([PAGE[a:b] for a, b in zip(cuts, [*cuts[1:], None])])
+
+    def handler(request):
+        return httpx.Response(200, stream=stream)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    scraper = TiktokScraperService(httpx_client=client)
+
+    assert await scraper.scrape_using_request("https://www.tiktok.com/@shop") == {
+        "secUid": "MS4wLjABAAAA",
+        "verified": True,
+        "followerCount": 12345,
+    }
+    assert stream.sent < len(stream.chunks) // 10
@@ -0,0 +1,108 @@
+import time
+from array import array
+
+import httpx
+import pytest
+
+from src.core.config import config
+from src.services.tiktok_scraper import TiktokScraperService
+
+DAY = 24 * 60 * 60
+
+
+def item(days_ago, pinned=False):
+    return {
+        "createTime": int(time.time() - days_ago * DAY),
+        "isPinnedItem": pinned,
+    }
+
+
+@pytest.fixture
+def build_scraper(monkeypatch):
+    monkeypatch.setattr(config, "GOOGLE_API_KEY", "key")
+    monkeypatch.setattr(config, "GOOGLE_SEARCH_ENGINE_ID", "id")
+
+    def build(pages):
+        cursors = []
+
+        def handler(request):
+            cursor = request.url.params["cursor"]
+            cursors.append(cursor)
+            return httpx.Response(200, json=pages[cursor])
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return TiktokScraperService(httpx_client=client), cursors
+
+    return build
+
+
+@pytest.mark.asyncio
+async def test_item_list_follows_cursor_until_horizon(build_scraper):
+    pages = {
+        "0": {
+            "itemList": [item(400, pinned=True), item(1), item(5)],
+            "hasMore": True,
+            "cursor": "111",
+        },
+        "111": {"itemList": [item(20), item(40)], "hasMore": True, "cursor": "222"},
+        "222": {"itemList": [item(50)], "hasMore": False},
+    }
+    scraper, cursors = build_scraper(pages)
+
+    timestamps = await scraper.extract_post_using_requests("sec", horizon_days=30)
+
+    assert isinstance(timestamps, array) and timestamps.typecode == "q"
+    assert len(timestamps) == 5
+    # The old pinned post did not stop the pagination, the 40 day old one did
+    assert cursors == ["0", "111"]
+
+
+@pytest.mark.asyncio
+async def test_item_list_stops_without_more_pages(build_scraper):
+    scraper, cursors = build_scraper(
+        {"0": {"itemList": [item(1)], "hasMore": False, "cursor": "9"}}
+    )
+
+    assert len(await scraper.extract_post_using_requests("sec")) == 1
+    assert cursors == ["0"]
+
+
+@pytest.mark.asyncio
+async def test_refused_item_list_raises(build_scraper):
+    scraper, _ = build_scraper({"0": {"statusCode": 10201}})
+
+    with pytest.raises(ValueError):
+        await scraper.extract_post_using_requests("sec")
+
+
+@pytest.mark.asyncio
+async def test_item_list_stops_at_known_posts(build_scraper):
+    known = item(3)
+    pages = {
+        "0": {"itemList": [item(1), known], "hasMore": True, "cursor": "111"},
+        "111": {"itemList": [item(5)], "hasMore": False},
+    }
+    scraper, cursors = build_scraper(pages)
+
+    await scraper.extract_post_using_requests("sec", since=known["createTime"])
+
+    assert cursors == ["0"]
+
+
+@pytest.mark.asyncio
+async def test_dorking_fallback_ignores_since(build_scraper):
+    scraper, _ = build_scraper({"0": {"statusCode": 10201}})
+    calls = []
+
+    async def get_video_dates(url, **kwargs):
+        calls.append(kwargs)
+        return ["2d", "2d"]
+
+    scraper.social_dorker.get_video_dates = get_video_dates
+
+    posts, exact = await scraper._recent_post_times(
+        "https://www.tiktok.com/@a", "sec", since=int(time.time())
+    )
+
+    assert len(posts) == 2 and not exact
+    assert "since" not in calls[0]
@@ -0,0 +1,92 @@
+from array import array
+from datetime import datetime
+
+import pytest
+
+from src.utils import time_to_epoch as module
+from src.utils.time_to_epoch import parse_many, time_to_epoch
+
+NOW = datetime(2025, 7, 20, 10, 30, 15)
+
+SAMPLES = [
+    "1m",
+    "3h",
+    "2d",
+    "22 hours ago",
+    "5 minutes ago",
+    "1 day ago",
+    "3days ago",
+    "Jun 18, 2024",
+    "June 18, 2024",
+    "jun 8, 2024",
+    "Sep 1, 2023",
+    "July 9 at 3:10 am",
+    "July 9 at 12:10 AM",
+    "July 9 at 12:05 pm",
+    "29 June at 18:23",
+    "29 June at 6:23 pm",
+    "1 March at 00:00",
+    "2025-07-06 12:47:20",
+    "2025-07-18T01:00:12.000Z",
+    "2025-07-18T01:00:12.5Z",
+    "May 23",
+    "28 March",
+    "28 February",
+    # Lenient spellings only strptime accepts
+    "June  18, 2024",
+    "2025-7-6 1:4:2",
+    "29 June at 6:3 pm",
+]
+
+INVALID = [
+    "",
+    "yesterday",
+    "3 weeks ago",
+    "1 hour ago",
+    "Sept 1, 2023",
+    "Jun 31, 2024",
+    "July 9 at 13:10 pm",
+    "29 June at 24:00",
+    "2025-02-30 10:00:00",
+    "29 February",
+    "June 18, 2024\n",
+]
+
+
+@pytest.mark.parametrize("value", SAMPLES)
+def test_matches_strptime_parser(value):
+    assert module._parse(value, NOW, "test") == module._parse_with_strptime(value, NOW)
+
+
+@pytest.mark.parametrize("value", INVALID)
+def test_rejects_what_strptime_rejects(value):
+    with pytest.raises(ValueError) as expected:
+        module._parse_with_strptime(value, NOW)
+    with pytest.raises(ValueError) as actual:
+        module._parse(value, NOW, "test")
+    assert str(actual.value) == str(expected.value)
+
+
+def test_remembers_last_shape_per_source():
+    time_to_epoch("2025-07-18T01:00:12.000Z", source="apify")
+    time_to_epoch("June 18, 2024", source="instagram")
+
+    assert module._last_shape["apify"] != module._last_shape["instagram"]
+    # A different shape from the same source is still parsed
+    assert time_to_epoch("June 18, 2024", source="apify") == time_to_epoch(
+        "June 18, 2024"
+    )
+
+
+def test_parse_many_returns_compact_array():
+    result = parse_many(["  June 18,\n 2024 ", "2025-07-06 12:47:20"], normalize=True)
+
+    assert isinstance(result, array)
+    assert result.typecode == "q"
+    assert list(result) == [
+        int(datetime(2024, 6, 18).timestamp()),
+        int(datetime(2025, 7, 6, 12, 47, 20).timestamp()),
+    ]
+
+    with pytest.raises(ValueError):
+        parse_many(["June 18, 2024", "yesterday"])